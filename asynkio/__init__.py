@@ -1,19 +1,85 @@
 __version__ = '0.0.9'
 
+from .cache import (
+    TTLCache,
+)
+from .io import (
+    ShapedWriter,
+)
+from .sync import (
+    RateLimiter,
+)
 from .time import (
+    BiasCalibrator,
+    Clock,
+    DelayQueue,
     Duration,
+    DurationArray,
+    Expired,
     Instant,
+    InstantArray,
     Interval,
+    IntervalStats,
+    LoopClock,
     MissedTickBehavior,
     MissedTickBehaviour,
+    MonotonicClock,
+    PerfCounterClock,
+    SharedInterval,
+    Sleep,
+    Timeout,
+    TimerCoalescer,
+    TimerWheel,
+    VirtualClock,
+    VirtualEventLoop,
+    WallClock,
+    advance,
+    default_clock,
+    pause,
+    resume,
+    run_virtual,
+    sleep,
+    sleep_until,
+    timeout,
+    timeout_at,
 )
 
 __all__ = [
     '__version__',
+    'BiasCalibrator',
+    'Clock',
+    'DelayQueue',
     'Duration',
+    'DurationArray',
+    'Expired',
     'Instant',
+    'InstantArray',
     'Interval',
+    'IntervalStats',
+    'LoopClock',
     'MissedTickBehavior',
     'MissedTickBehaviour',
+    'MonotonicClock',
+    'PerfCounterClock',
+    'RateLimiter',
+    'ShapedWriter',
+    'SharedInterval',
+    'Sleep',
+    'TTLCache',
+    'Timeout',
+    'TimerCoalescer',
+    'TimerWheel',
+    'VirtualClock',
+    'VirtualEventLoop',
+    'WallClock',
+    'advance',
+    'default_clock',
+    'pause',
+    'resume',
+    'run_virtual',
+    'sleep',
+    'sleep_until',
+    'timeout',
+    'timeout_at',
 ]
 
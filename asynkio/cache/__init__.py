@@ -0,0 +1,8 @@
+from .ttl import (
+    TTLCache,
+)
+
+__all__ = [
+    'TTLCache',
+]
+
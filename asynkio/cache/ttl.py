@@ -0,0 +1,458 @@
+# Definition of `TTLCache`.
+
+import asyncio
+from collections import (
+    OrderedDict,
+)
+import functools
+import weakref
+
+from ..time import (
+    Clock,
+    Duration,
+    Interval,
+    MissedTickBehaviour,
+    default_clock,
+)
+
+_MISSING = object()
+
+
+async def _sweep_periodically(
+    cache_ref: weakref.ref,
+    interval: Interval,
+):
+
+    # holds the cache only weakly between sweeps, so that an abandoned cache
+    # may be collected, whereupon the sweeps end
+
+    async for _ in interval:
+
+        cache = cache_ref()
+
+        if cache is None:
+
+            return
+
+        cache.sweep()
+
+        del cache
+
+
+class TTLCache:
+    """
+    Asynchronous cache whose entries each expire after a time-to-live
+    (TTL), with single-flight loading and optional LRU eviction.
+
+    Expired entries are removed in bulk by a periodic sweep, driven by an
+    `Interval` (started on the first insertion within a running loop),
+    rather than by a timer per entry: the entries are bucketed by the sweep
+    at (or after) which they expire, so that each sweep visits only those
+    entries that are due. Between sweeps, an entry that has expired is
+    treated as a miss on lookup (and removed), so that it is never
+    returned.
+
+    Concurrent misses for the same key in `get_or_load()` share a single
+    call of the loader.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_ttl_ns',
+        '_maxsize',
+        '_sweep_period_ns',
+        '_clock',
+        '_now_ns',
+        '_reference_ns',
+        '__weakref__',
+        # variant fields:
+        '_data',
+        '_buckets',
+        '_swept',
+        '_loading',
+        '_interval',
+        '_closed',
+        '_hits',
+        '_misses',
+        '_loads',
+        '_expirations',
+        '_evictions',
+    )
+
+    def __init__(
+        self,
+        ttl: Duration | int,
+        maxsize: int | None = None,
+        sweep_period: Duration | int = Duration.from_secs(1),
+        clock: Clock | None = None,
+    ):
+        """
+        Creates an empty instance, whose entries expire after `ttl` (unless
+        given otherwise on insertion), and - if `maxsize` is given - which
+        evicts its least recently used entries to hold no more than
+        `maxsize`. Expired entries are swept every `sweep_period`, measured
+        with `clock` (which defaults to `default_clock()`).
+        """
+
+        assert int(ttl) >= 0, "`ttl` may not be negative"
+        assert maxsize is None or maxsize > 0, "`maxsize` must be positive"
+        assert int(sweep_period) > 0, "`sweep_period` must be positive"
+
+        self._ttl_ns = int(ttl)
+        self._maxsize = maxsize
+        self._sweep_period_ns = int(sweep_period)
+        self._clock = clock or default_clock()
+        self._now_ns = self._clock.now_ns
+        self._reference_ns = self._now_ns()
+
+        # entries, as `key: (value, expiry_ns)`, ordered by recency of use
+        # if bounded
+
+        self._data = {} if maxsize is None else OrderedDict()
+
+        # keys by the index of the sweep at (or after) which they expire;
+        # keys whose entries have since been replaced or removed are skipped
+
+        self._buckets = {}
+        self._swept = 0
+        self._loading = {}
+        self._interval = None
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_ttl_ns: {self._ttl_ns:,}; "
+            f"_maxsize: {self._maxsize}; "
+            f"_sweep_period_ns: {self._sweep_period_ns:,}; "
+            f"_clock: {self._clock!r}; "
+            f"_len: {len(self._data):,}; "
+            f"_hits: {self._hits:,}; "
+            f"_misses: {self._misses:,}; "
+            f"_expirations: {self._expirations:,}; "
+            f"_evictions: {self._evictions:,}; "
+            ">"
+        )
+
+    def __len__(self) -> int:
+        """
+        The number of entries held, including any that have expired since
+        the last sweep.
+        """
+
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+
+        entry = self._data.get(key)
+
+        return entry is not None and entry[1] > self._now_ns()
+
+    async def __aenter__(self):
+
+        self._start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    def _start(self):
+
+        if self._interval is not None or self._closed:
+
+            return
+
+        loop = asyncio._get_running_loop()
+
+        if loop is None:
+
+            return
+
+        interval = self._interval = Interval(
+            self._sweep_period_ns,
+            MissedTickBehaviour.SKIP,
+            name='TTLCache.sweep',
+            clock=self._clock,
+        )
+
+        loop.create_task(_sweep_periodically(weakref.ref(self), interval))
+
+    def _on_loaded(
+        self,
+        key,
+        ttl: Duration | int | None,
+        task: asyncio.Task,
+    ):
+
+        if self._loading.get(key) is task:
+
+            del self._loading[key]
+
+        if not task.cancelled() and task.exception() is None:
+
+            self.set(key, task.result(), ttl)
+
+    def get(
+        self,
+        key,
+        default=None,
+    ):
+        """
+        Obtains the value of the entry with the given `key`, or `default`
+        if there is no such entry (or it has expired).
+        """
+
+        data = self._data
+        entry = data.get(key)
+
+        if entry is not None:
+
+            if entry[1] > self._now_ns():
+
+                self._hits += 1
+
+                if self._maxsize is not None:
+
+                    data.move_to_end(key)
+
+                return entry[0]
+
+            del data[key]
+
+            self._expirations += 1
+
+        self._misses += 1
+
+        return default
+
+    def set(
+        self,
+        key,
+        value,
+        ttl: Duration | int | None = None,
+    ):
+        """
+        Inserts, or replaces, the entry with the given `key`, to expire
+        after `ttl` (which defaults to that of the cache).
+        """
+
+        expiry_ns = self._now_ns() + (self._ttl_ns if ttl is None else int(ttl))
+
+        data = self._data
+
+        if self._maxsize is not None and key in data:
+
+            data.move_to_end(key)
+
+        data[key] = (value, expiry_ns)
+
+        index = max((expiry_ns - self._reference_ns) // self._sweep_period_ns + 1, self._swept + 1)
+
+        bucket = self._buckets.get(index)
+
+        if bucket is None:
+
+            self._buckets[index] = [key]
+        else:
+
+            bucket.append(key)
+
+        if self._maxsize is not None and len(data) > self._maxsize:
+
+            data.popitem(last=False)
+
+            self._evictions += 1
+
+        if self._interval is None:
+
+            self._start()
+
+    async def get_or_load(
+        self,
+        key,
+        loader,
+        ttl: Duration | int | None = None,
+    ):
+        """
+        Obtains the value of the entry with the given `key` or, if there is
+        no such entry, loads it with `await loader(key)` and inserts it, to
+        expire after `ttl` (which defaults to that of the cache).
+
+        Concurrent misses for the same key share a single call of `loader`,
+        whose outcome - value or exception - is given to each of them, and
+        which is not abandoned if they are cancelled. Exceptions are not
+        cached.
+        """
+
+        value = self.get(key, _MISSING)
+
+        if value is not _MISSING:
+
+            return value
+
+        task = self._loading.get(key)
+
+        if task is None:
+
+            task = self._loading[key] = asyncio.ensure_future(loader(key))
+
+            self._loads += 1
+
+            # registered before any awaiter's, so that the entry is inserted
+            # before they resume
+
+            task.add_done_callback(functools.partial(self._on_loaded, key, ttl))
+
+        return await asyncio.shield(task)
+
+    def invalidate(self, key) -> bool:
+        """
+        Removes the entry with the given `key`, indicating whether there was
+        such an entry.
+        """
+
+        return self._data.pop(key, None) is not None
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+
+        self._data.clear()
+        self._buckets.clear()
+
+    def sweep(self) -> int:
+        """
+        Removes all expired entries, returning how many were removed. This
+        is called periodically while the cache is used within a running
+        loop, but may also be called directly.
+        """
+
+        now_ns = self._now_ns()
+        index = (now_ns - self._reference_ns) // self._sweep_period_ns
+
+        buckets = self._buckets
+        data = self._data
+        swept = self._swept
+
+        if index <= swept:
+
+            return 0
+
+        self._swept = index
+
+        if index - swept <= len(buckets):
+
+            indexes = range(swept + 1, index + 1)
+        else:
+
+            indexes = sorted(i for i in buckets if i <= index)
+
+        count = 0
+
+        for i in indexes:
+
+            keys = buckets.pop(i, None)
+
+            if keys is None:
+
+                continue
+
+            for key in keys:
+
+                entry = data.get(key)
+
+                if entry is not None and entry[1] <= now_ns:
+
+                    del data[key]
+
+                    count += 1
+
+        self._expirations += count
+
+        return count
+
+    def close(self):
+        """
+        Stops the periodic sweep (whereupon expired entries are removed only
+        on lookup, or by `sweep()`).
+        """
+
+        self._closed = True
+
+        if self._interval is not None:
+
+            self._interval.stop()
+
+    def clock(self) -> Clock:
+        """
+        The cache's clock.
+        """
+
+        return self._clock
+
+    def evictions(self) -> int:
+        """
+        The number of entries evicted to bound the size of the cache.
+        """
+
+        return self._evictions
+
+    def expirations(self) -> int:
+        """
+        The number of entries removed on expiry, by sweeps or on lookup.
+        """
+
+        return self._expirations
+
+    def hits(self) -> int:
+        """
+        The number of lookups that found an entry.
+        """
+
+        return self._hits
+
+    def loads(self) -> int:
+        """
+        The number of calls of loaders by `get_or_load()`.
+        """
+
+        return self._loads
+
+    def maxsize(self) -> int | None:
+        """
+        The maximum number of entries, if bounded.
+        """
+
+        return self._maxsize
+
+    def misses(self) -> int:
+        """
+        The number of lookups that found no entry (or an expired one).
+        """
+
+        return self._misses
+
+    def sweep_period(self) -> Duration:
+        """
+        The period of the sweep for expired entries.
+        """
+
+        return Duration.from_nanos(self._sweep_period_ns)
+
+    def ttl(self) -> Duration:
+        """
+        The default time-to-live of entries.
+        """
+
+        return Duration.from_nanos(self._ttl_ns)
+
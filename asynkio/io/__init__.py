@@ -0,0 +1,8 @@
+from .shaper import (
+    ShapedWriter,
+)
+
+__all__ = [
+    'ShapedWriter',
+]
+
@@ -0,0 +1,270 @@
+# Definition of `ShapedWriter`.
+
+import asyncio
+
+from ..time import (
+    Clock,
+    Duration,
+    Sleep,
+    default_clock,
+)
+
+
+class ShapedWriter:
+    """
+    Wrapper around an `asyncio.StreamWriter` (or `asyncio.Transport`) that
+    limits the rate at which bytes are written to it - to `rate` bytes per
+    second, in bursts of up to `burst` bytes - by a leaky bucket measured in
+    bytes.
+
+    Writes are buffered, and passed on by a pump task, started when there
+    are bytes to write, which sleeps (with a `Sleep` that is reset rather
+    than re-created) until exactly the instant that the budget permits the
+    next chunk, rather than polling. Small writes are coalesced: each chunk
+    is as much of the buffer as the budget permits when it is written, up to
+    `burst` bytes.
+
+    As in `RateLimiter`, the bucket is held as its "theoretical arrival
+    time" (TAT): the instant at which the bytes written would have been
+    written were they written at exactly `rate`; a chunk may be written
+    once it would take the TAT no more than `burst` bytes' time beyond now.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_writer',
+        '_drain',
+        '_rate',
+        '_burst',
+        '_burst_ns',
+        '_clock',
+        '_now_ns',
+        '_sleep',
+        # variant fields:
+        '_buffer',
+        '_tat_ns',
+        '_pump_task',
+        '_bytes_written',
+        '_chunks_written',
+    )
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter | asyncio.WriteTransport,
+        rate: int,
+        burst: int | None = None,
+        clock: Clock | None = None,
+    ):
+        """
+        Creates an instance that writes to `writer` - anything with a
+        `write()` method, whose `drain()` (if any) is awaited after each
+        chunk - at no more than `rate` bytes per second, in bursts of up to
+        `burst` bytes (which defaults to a tenth of a second's worth, and at
+        least 1,500), measured with `clock` (which defaults to
+        `default_clock()`).
+        """
+
+        assert rate > 0, "`rate` must be positive"
+        assert burst is None or burst > 0, "`burst` must be positive"
+
+        self._writer = writer
+        self._drain = getattr(writer, 'drain', None)
+        self._rate = rate
+        self._burst = max(rate // 10, 1_500) if burst is None else burst
+        self._burst_ns = self._cost_ns(self._burst)
+        self._clock = clock or default_clock()
+        self._now_ns = self._clock.now_ns
+        self._sleep = Sleep(0, self._clock)
+
+        self._buffer = bytearray()
+        self._tat_ns = 0
+        self._pump_task = None
+        self._bytes_written = 0
+        self._chunks_written = 0
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_writer: {self._writer!r}; "
+            f"_rate: {self._rate:,}; "
+            f"_burst: {self._burst:,}; "
+            f"_clock: {self._clock!r}; "
+            f"_pending: {len(self._buffer):,}; "
+            f"_bytes_written: {self._bytes_written:,}; "
+            f"_chunks_written: {self._chunks_written:,}; "
+            ">"
+        )
+
+    def _cost_ns(self, n: int) -> int:
+
+        # the time taken to write `n` bytes at the rate, rounded up so that
+        # the rate is never exceeded
+
+        return -(-n * 1_000_000_000 // self._rate)
+
+    async def _pump(self):
+
+        buffer = self._buffer
+        writer = self._writer
+        drain = self._drain
+        sleep = self._sleep
+        now_ns = self._now_ns
+
+        while buffer:
+
+            t_ns = now_ns()
+            tat_ns = self._tat_ns
+
+            if tat_ns < t_ns:
+
+                tat_ns = t_ns
+
+            # wait until the budget permits as much of the buffer as may be
+            # written in one burst
+
+            ready_ns = tat_ns + self._cost_ns(min(len(buffer), self._burst)) - self._burst_ns
+
+            if ready_ns > t_ns:
+
+                sleep.reset(ready_ns)
+
+                await sleep
+
+                continue
+
+            # then write as much as the budget permits now, coalescing any
+            # writes made in the meantime
+
+            n = min(len(buffer), (t_ns + self._burst_ns - tat_ns) * self._rate // 1_000_000_000)
+
+            chunk = bytes(buffer[:n])
+
+            del buffer[:n]
+
+            self._tat_ns = tat_ns + self._cost_ns(n)
+            self._bytes_written += n
+            self._chunks_written += 1
+
+            writer.write(chunk)
+
+            if drain is not None:
+
+                await drain()
+
+    def write(self, data: bytes | bytearray | memoryview):
+        """
+        Buffers `data`, to be written as the budget permits. As with
+        `asyncio.StreamWriter`, `drain()` should be awaited to bound the
+        buffer.
+        """
+
+        task = self._pump_task
+
+        if task is not None and task.done() and not task.cancelled() and task.exception() is not None:
+
+            raise task.exception()
+
+        self._buffer += data
+
+        if task is None or task.done():
+
+            self._pump_task = asyncio.get_running_loop().create_task(self._pump())
+
+    def writelines(self, data):
+        """
+        Buffers each of `data`, as `write()`.
+        """
+
+        for item in data:
+
+            self.write(item)
+
+    async def drain(self):
+        """
+        Waits until all buffered bytes have been written (and drained) to
+        the underlying writer, raising any exception raised in doing so.
+        """
+
+        task = self._pump_task
+
+        if task is not None:
+
+            await asyncio.shield(task)
+
+    async def aclose(self):
+        """
+        Drains the buffer, and closes the underlying writer (waiting for it
+        to close, if it supports `wait_closed()`).
+        """
+
+        try:
+
+            await self.drain()
+        finally:
+
+            self._writer.close()
+
+            wait_closed = getattr(self._writer, 'wait_closed', None)
+
+            if wait_closed is not None:
+
+                await wait_closed()
+
+    def burst(self) -> int:
+        """
+        The maximum number of bytes written at once.
+        """
+
+        return self._burst
+
+    def bytes_written(self) -> int:
+        """
+        The number of bytes written to the underlying writer.
+        """
+
+        return self._bytes_written
+
+    def chunks_written(self) -> int:
+        """
+        The number of writes to the underlying writer.
+        """
+
+        return self._chunks_written
+
+    def clock(self) -> Clock:
+        """
+        The shaper's clock.
+        """
+
+        return self._clock
+
+    def pending(self) -> int:
+        """
+        The number of bytes buffered but not yet written.
+        """
+
+        return len(self._buffer)
+
+    def rate(self) -> int:
+        """
+        The maximum rate, in bytes per second.
+        """
+
+        return self._rate
+
+    def retry_after(self) -> Duration:
+        """
+        The time until a burst may be written.
+        """
+
+        return Duration.from_nanos(max(self._tat_ns - self._now_ns(), 0))
+
+    def writer(self):
+        """
+        The underlying writer.
+        """
+
+        return self._writer
+
@@ -0,0 +1,26 @@
+from . import (
+    broadcast,
+    mpsc,
+    watch,
+)
+from .errors import (
+    ChannelClosed,
+    ChannelEmpty,
+    ChannelFull,
+    Lagged,
+)
+from .rate_limiter import (
+    RateLimiter,
+)
+
+__all__ = [
+    'ChannelClosed',
+    'ChannelEmpty',
+    'ChannelFull',
+    'Lagged',
+    'RateLimiter',
+    'broadcast',
+    'mpsc',
+    'watch',
+]
+
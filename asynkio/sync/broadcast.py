@@ -0,0 +1,432 @@
+# Definition of `channel()`, `Sender`, and `Receiver`, of the broadcast
+# channel.
+
+from .errors import (
+    ChannelClosed,
+    ChannelEmpty,
+    Lagged,
+)
+from .waiter import (
+    ChannelWaiter,
+)
+
+# Results of `Receiver._take()` other than a value.
+
+_EMPTY = object()
+_CLOSED = object()
+
+
+class _Channel:
+    """
+    State shared by the senders and the receivers of a channel.
+
+    Sent values are held once, in a ring of fixed capacity; each receiver
+    holds only the sequence number of the next value it is to receive.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_capacity',
+        '_ring',
+        # variant fields:
+        '_tail',
+        '_waiters',
+        '_senders',
+        '_receivers',
+    )
+
+    def __init__(self, capacity: int):
+
+        self._capacity = capacity
+        self._ring = [None] * capacity
+
+        # the sequence number of the next value sent, so that those retained
+        # are in [max(0, _tail - _capacity), _tail)
+
+        self._tail = 0
+
+        # the waiters of the receivers waiting, in a dict so that a receiver
+        # that waits again, after a cancelled wait, is held only once
+
+        self._waiters = {}
+        self._senders = 1
+        self._receivers = 1
+
+    def _wake_all(self):
+
+        waiters = self._waiters
+
+        if waiters:
+
+            self._waiters = {}
+
+            for waiter in waiters:
+
+                waiter._wake()
+
+
+class Sender:
+    """
+    Sending side of a broadcast channel, as obtained from `channel()`.
+
+    Sending never waits: each value is written into the ring, overwriting
+    the oldest once it is full, and every receiver then waiting is woken.
+    A sender may be cloned, with `clone()`, and each sender must be closed,
+    with `close()` (or by use as a context manager); once all are closed,
+    the receivers receive the values remaining to them and then find the
+    channel closed.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_channel',
+        # variant fields:
+        '_closed',
+    )
+
+    def __init__(self, channel: _Channel):
+
+        self._channel = channel
+
+        self._closed = False
+
+    def __repr__(self):
+
+        channel = self._channel
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_capacity: {channel._capacity:,}; "
+            f"_tail: {channel._tail:,}; "
+            f"_senders: {channel._senders:,}; "
+            f"_receivers: {channel._receivers:,}; "
+            f"_closed: {self._closed}; "
+            ">"
+        )
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    def send(self, value) -> int:
+        """
+        Sends `value` to all receivers, returning the number of receivers
+        open; raises `ChannelClosed` if this sender is closed.
+        """
+
+        if self._closed:
+
+            raise ChannelClosed(value)
+
+        channel = self._channel
+        tail = channel._tail
+
+        channel._ring[tail % channel._capacity] = value
+        channel._tail = tail + 1
+
+        if channel._waiters:
+
+            channel._wake_all()
+
+        return channel._receivers
+
+    def subscribe(self) -> 'Receiver':
+        """
+        Obtains a new receiver, which receives the values sent from now on.
+        """
+
+        if self._closed:
+
+            raise ChannelClosed()
+
+        channel = self._channel
+
+        channel._receivers += 1
+
+        return Receiver(channel, channel._tail)
+
+    def clone(self) -> 'Sender':
+        """
+        Obtains another sender for the same channel, which must be closed
+        independently.
+        """
+
+        if self._closed:
+
+            raise ChannelClosed()
+
+        self._channel._senders += 1
+
+        return Sender(self._channel)
+
+    def close(self):
+        """
+        Closes this sender (and, if it is the last, the channel); has no
+        effect if already closed.
+        """
+
+        if self._closed:
+
+            return
+
+        self._closed = True
+
+        channel = self._channel
+
+        channel._senders -= 1
+
+        if 0 == channel._senders:
+
+            channel._wake_all()
+
+    def is_closed(self) -> bool:
+        """
+        Indicates whether this sender is closed.
+        """
+
+        return self._closed
+
+    def max_capacity(self) -> int:
+        """
+        The capacity of the channel.
+        """
+
+        return self._channel._capacity
+
+    def receiver_count(self) -> int:
+        """
+        The number of receivers open.
+        """
+
+        return self._channel._receivers
+
+
+class Receiver:
+    """
+    Receiving side of a broadcast channel, as obtained from `channel()` or
+    `Sender.subscribe()`.
+
+    Values are received with `recv()`, `try_recv()`, or by asynchronous
+    iteration, which ends once the channel is closed and the receiver has
+    received all the values remaining to it.
+
+    A receiver that falls more than the channel's capacity behind the
+    senders has missed the values overwritten in the meantime: its next
+    receive raises `Lagged`, with the number missed, and it resumes from
+    the oldest value retained - i.e. as `MissedTickBehaviour.SKIP`, missed
+    values are skipped (and counted), rather than buffered without bound.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_channel',
+        '_waiter',
+        # variant fields:
+        '_next',
+        '_closed',
+    )
+
+    def __init__(
+        self,
+        channel: _Channel,
+        pos: int,
+    ):
+
+        self._channel = channel
+        self._waiter = ChannelWaiter()
+
+        self._next = pos
+        self._closed = False
+
+    def __repr__(self):
+
+        channel = self._channel
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_capacity: {channel._capacity:,}; "
+            f"_next: {self._next:,}; "
+            f"_tail: {channel._tail:,}; "
+            f"_closed: {self._closed}; "
+            ">"
+        )
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        The number of values retained that this receiver has yet to receive.
+        """
+
+        channel = self._channel
+
+        return min(channel._tail - self._next, channel._capacity)
+
+    def __aiter__(self):
+
+        return self
+
+    async def __anext__(self):
+
+        while True:
+
+            value = self._take()
+
+            if _EMPTY is value:
+
+                await self._wait()
+            elif _CLOSED is value:
+
+                raise StopAsyncIteration
+            else:
+
+                return value
+
+    def _take(self):
+
+        # obtains the next value, if any, advancing the cursor; raises
+        # `Lagged` if values have been missed, or returns `_EMPTY` if there
+        # is none yet, or `_CLOSED` if there will be none
+
+        channel = self._channel
+        capacity = channel._capacity
+
+        pos = self._next
+        tail = channel._tail
+
+        if pos < tail:
+
+            head = tail - capacity
+
+            if pos < head:
+
+                self._next = head
+
+                raise Lagged(head - pos)
+
+            self._next = pos + 1
+
+            return channel._ring[pos % capacity]
+
+        if self._closed or 0 == channel._senders:
+
+            return _CLOSED
+
+        return _EMPTY
+
+    def _wait(self):
+
+        waiter = self._waiter
+
+        self._channel._waiters[waiter] = None
+
+        return waiter._wait()
+
+    async def recv(self):
+        """
+        Receives the next value, waiting for one to be sent if there is
+        none; raises `Lagged` if values have been missed, or `ChannelClosed`
+        if the channel (or this receiver) is closed and there are none.
+        """
+
+        while True:
+
+            value = self._take()
+
+            if _EMPTY is value:
+
+                await self._wait()
+            elif _CLOSED is value:
+
+                raise ChannelClosed()
+            else:
+
+                return value
+
+    def try_recv(self):
+        """
+        Receives the next value without waiting; raises `Lagged` if values
+        have been missed, `ChannelEmpty` if there are none, or
+        `ChannelClosed` if the channel (or this receiver) is closed and
+        there are none.
+        """
+
+        value = self._take()
+
+        if _EMPTY is value:
+
+            raise ChannelEmpty()
+
+        if _CLOSED is value:
+
+            raise ChannelClosed()
+
+        return value
+
+    def resubscribe(self) -> 'Receiver':
+        """
+        Obtains a new receiver, which receives the values sent from now on.
+        """
+
+        channel = self._channel
+
+        channel._receivers += 1
+
+        return Receiver(channel, channel._tail)
+
+    def close(self):
+        """
+        Closes this receiver, so that it is no longer counted by the senders
+        and waits no more (while the values already sent may still be
+        received); has no effect if already closed.
+        """
+
+        if self._closed:
+
+            return
+
+        self._closed = True
+
+        channel = self._channel
+
+        channel._receivers -= 1
+
+        waiter = self._waiter
+
+        channel._waiters.pop(waiter, None)
+
+        waiter._wake()
+
+    def is_closed(self) -> bool:
+        """
+        Indicates whether this receiver is closed.
+        """
+
+        return self._closed
+
+
+def channel(capacity: int) -> tuple[Sender, Receiver]:
+    """
+    Creates a broadcast channel retaining the most recent `capacity` values,
+    returning a sender and a first receiver; further receivers are
+    obtained with `Sender.subscribe()`.
+    """
+
+    assert capacity > 0, "`capacity` must be positive"
+
+    state = _Channel(capacity)
+
+    return Sender(state), Receiver(state, 0)
+
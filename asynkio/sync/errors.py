@@ -0,0 +1,37 @@
+# Definition of channel exceptions.
+
+
+class ChannelClosed(Exception):
+    """
+    Raised when sending on a channel whose receiving side is closed (with
+    the value that could not be sent as its argument), or when receiving
+    from a channel that is closed and empty.
+    """
+
+
+class ChannelEmpty(Exception):
+    """
+    Raised when receiving, without waiting, from a channel that is empty.
+    """
+
+
+class ChannelFull(Exception):
+    """
+    Raised when sending, without waiting, on a channel that is full (with
+    the value that could not be sent as its argument).
+    """
+
+
+class Lagged(Exception):
+    """
+    Raised when receiving from a broadcast channel by a receiver that has
+    fallen so far behind that values it had yet to receive have been
+    overwritten; `n` is the number missed.
+    """
+
+    def __init__(self, n: int):
+
+        super().__init__(n)
+
+        self.n = n
+
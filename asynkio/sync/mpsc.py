@@ -0,0 +1,485 @@
+# Definition of `channel()`, `Sender`, and `Receiver`, of the bounded
+# multi-producer, single-consumer channel.
+
+import asyncio
+from collections import (
+    deque,
+)
+
+from ..time import (
+    Duration,
+    timeout,
+)
+from .errors import (
+    ChannelClosed,
+    ChannelEmpty,
+    ChannelFull,
+)
+from .waiter import (
+    ChannelWaiter,
+)
+
+
+class _Channel:
+    """
+    State shared by the senders and the receiver of a channel.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_capacity',
+        '_buffer',
+        '_send_waiters',
+        '_recv_waiter',
+        # variant fields:
+        '_reserved',
+        '_senders',
+        '_rx_closed',
+    )
+
+    def __init__(self, capacity: int):
+
+        self._capacity = capacity
+        self._buffer = deque()
+        self._send_waiters = deque()
+        self._recv_waiter = ChannelWaiter()
+
+        # slots granted to waiting senders that have yet to use them
+
+        self._reserved = 0
+        self._senders = 1
+        self._rx_closed = False
+
+    def _is_closed(self) -> bool:
+
+        return 0 == self._senders or self._rx_closed
+
+    def _push(self, value):
+
+        self._buffer.append(value)
+
+        self._recv_waiter._wake()
+
+    def _release(self, n: int):
+
+        # grants freed slots to waiting senders, in the order they arrived
+
+        waiters = self._send_waiters
+
+        while n and waiters:
+
+            future = waiters.popleft()
+
+            if future.done():
+
+                continue
+
+            self._reserved += 1
+
+            future.set_result(True)
+
+            n -= 1
+
+
+class Sender:
+    """
+    Sending side of a bounded channel, as obtained from `channel()`.
+
+    A sender may be cloned, with `clone()`, and each sender must be closed,
+    with `close()` (or by use as a context manager); once all are closed,
+    the receiver receives the items remaining in the channel and then finds
+    it closed.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_channel',
+        # variant fields:
+        '_closed',
+    )
+
+    def __init__(self, channel: _Channel):
+
+        self._channel = channel
+
+        self._closed = False
+
+    def __repr__(self):
+
+        channel = self._channel
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_capacity: {channel._capacity:,}; "
+            f"_len: {len(channel._buffer):,}; "
+            f"_senders: {channel._senders:,}; "
+            f"_closed: {self._closed}; "
+            ">"
+        )
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    async def send(self, value):
+        """
+        Sends `value`, waiting - in the order of arrival with other waiting
+        senders - for capacity if the channel is full; raises
+        `ChannelClosed` if the receiver is (or becomes) closed.
+        """
+
+        channel = self._channel
+
+        if self._closed or channel._rx_closed:
+
+            raise ChannelClosed(value)
+
+        waiters = channel._send_waiters
+
+        if not waiters and len(channel._buffer) + channel._reserved < channel._capacity:
+
+            channel._push(value)
+
+            return
+
+        future = asyncio.get_running_loop().create_future()
+
+        waiters.append(future)
+
+        try:
+
+            granted = await future
+        except asyncio.CancelledError:
+
+            if future.done() and not future.cancelled() and future.result():
+
+                # pass on the slot granted in the meantime
+
+                channel._reserved -= 1
+                channel._release(1)
+
+            raise
+
+        if not granted:
+
+            raise ChannelClosed(value)
+
+        channel._reserved -= 1
+
+        channel._push(value)
+
+    async def send_timeout(
+        self,
+        value,
+        duration: Duration | int,
+    ):
+        """
+        Sends `value`, as `send()`, waiting no longer than `duration` - a
+        `Duration` or an integer number of nanoseconds - for capacity;
+        raises `TimeoutError` if it does not become available.
+        """
+
+        async with timeout(duration):
+
+            await self.send(value)
+
+    def try_send(self, value):
+        """
+        Sends `value` without waiting; raises `ChannelFull` if the channel
+        is full, or `ChannelClosed` if the receiver is closed.
+        """
+
+        channel = self._channel
+
+        if self._closed or channel._rx_closed:
+
+            raise ChannelClosed(value)
+
+        if channel._send_waiters or len(channel._buffer) + channel._reserved >= channel._capacity:
+
+            raise ChannelFull(value)
+
+        channel._push(value)
+
+    def clone(self) -> 'Sender':
+        """
+        Obtains another sender for the same channel, which must be closed
+        independently.
+        """
+
+        if self._closed:
+
+            raise ChannelClosed()
+
+        self._channel._senders += 1
+
+        return Sender(self._channel)
+
+    def close(self):
+        """
+        Closes this sender (and, if it is the last, the channel); has no
+        effect if already closed.
+        """
+
+        if self._closed:
+
+            return
+
+        self._closed = True
+
+        channel = self._channel
+
+        channel._senders -= 1
+
+        if 0 == channel._senders:
+
+            channel._recv_waiter._wake()
+
+    def capacity(self) -> int:
+        """
+        The number of items that may be sent without waiting.
+        """
+
+        channel = self._channel
+
+        return max(channel._capacity - len(channel._buffer) - channel._reserved, 0)
+
+    def is_closed(self) -> bool:
+        """
+        Indicates whether the receiver is closed.
+        """
+
+        return self._channel._rx_closed
+
+    def max_capacity(self) -> int:
+        """
+        The capacity of the channel.
+        """
+
+        return self._channel._capacity
+
+
+class Receiver:
+    """
+    Receiving side of a bounded channel, as obtained from `channel()`.
+
+    Items are received with `recv()`, `recv_many()`, `try_recv()`, or by
+    asynchronous iteration, which ends once the channel is closed and
+    empty. Receiving allocates no futures: an item already buffered is
+    returned without yielding to the loop, and an empty channel is waited
+    on with a reusable awaitable.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_channel',
+        # variant fields:
+    )
+
+    def __init__(self, channel: _Channel):
+
+        self._channel = channel
+
+    def __repr__(self):
+
+        channel = self._channel
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_capacity: {channel._capacity:,}; "
+            f"_len: {len(channel._buffer):,}; "
+            f"_senders: {channel._senders:,}; "
+            f"_rx_closed: {channel._rx_closed}; "
+            ">"
+        )
+
+    def __len__(self) -> int:
+        """
+        The number of items buffered.
+        """
+
+        return len(self._channel._buffer)
+
+    def __aiter__(self):
+
+        return self
+
+    async def __anext__(self):
+
+        channel = self._channel
+        buffer = channel._buffer
+
+        while not buffer:
+
+            if channel._is_closed():
+
+                raise StopAsyncIteration
+
+            await channel._recv_waiter._wait()
+
+        value = buffer.popleft()
+
+        if channel._send_waiters:
+
+            channel._release(1)
+
+        return value
+
+    async def recv(self):
+        """
+        Receives the next item, waiting for one if the channel is empty;
+        raises `ChannelClosed` if the channel is closed and empty.
+        """
+
+        channel = self._channel
+        buffer = channel._buffer
+
+        while not buffer:
+
+            if channel._is_closed():
+
+                raise ChannelClosed()
+
+            await channel._recv_waiter._wait()
+
+        value = buffer.popleft()
+
+        if channel._send_waiters:
+
+            channel._release(1)
+
+        return value
+
+    async def recv_many(
+        self,
+        buffer: list,
+        limit: int,
+    ) -> int:
+        """
+        Appends up to `limit` items to `buffer`, waiting for at least one if
+        the channel is empty, returning the number appended, which is 0 only
+        if the channel is closed and empty.
+        """
+
+        assert limit > 0, "`limit` must be positive"
+
+        channel = self._channel
+        items = channel._buffer
+
+        while not items:
+
+            if channel._is_closed():
+
+                return 0
+
+            await channel._recv_waiter._wait()
+
+        n = len(items)
+
+        if n <= limit:
+
+            buffer.extend(items)
+            items.clear()
+        else:
+
+            n = limit
+
+            append = buffer.append
+            popleft = items.popleft
+
+            for _ in range(n):
+
+                append(popleft())
+
+        if channel._send_waiters:
+
+            channel._release(n)
+
+        return n
+
+    def try_recv(self):
+        """
+        Receives the next item without waiting; raises `ChannelEmpty` if
+        the channel is empty, or `ChannelClosed` if it is closed and empty.
+        """
+
+        channel = self._channel
+        buffer = channel._buffer
+
+        if buffer:
+
+            value = buffer.popleft()
+
+            if channel._send_waiters:
+
+                channel._release(1)
+
+            return value
+
+        if channel._is_closed():
+
+            raise ChannelClosed()
+
+        raise ChannelEmpty()
+
+    def close(self):
+        """
+        Closes the receiving side, so that no more items may be sent (and
+        waiting senders raise `ChannelClosed`), while those buffered may
+        still be received.
+        """
+
+        channel = self._channel
+
+        if channel._rx_closed:
+
+            return
+
+        channel._rx_closed = True
+
+        waiters = channel._send_waiters
+
+        while waiters:
+
+            future = waiters.popleft()
+
+            if not future.done():
+
+                future.set_result(False)
+
+        channel._recv_waiter._wake()
+
+    def is_closed(self) -> bool:
+        """
+        Indicates whether the channel is closed: either all senders, or the
+        receiver, are closed.
+        """
+
+        return self._channel._is_closed()
+
+    def max_capacity(self) -> int:
+        """
+        The capacity of the channel.
+        """
+
+        return self._channel._capacity
+
+
+def channel(capacity: int) -> tuple[Sender, Receiver]:
+    """
+    Creates a bounded multi-producer, single-consumer channel, holding up
+    to `capacity` items, returning its sender and receiver.
+    """
+
+    assert capacity > 0, "`capacity` must be positive"
+
+    state = _Channel(capacity)
+
+    return Sender(state), Receiver(state)
+
@@ -0,0 +1,294 @@
+# Definition of `RateLimiter`.
+
+import asyncio
+
+from ..time import (
+    Clock,
+    Duration,
+    Instant,
+    default_clock,
+    sleep_until,
+)
+
+
+class RateLimiter:
+    """
+    Per-key rate limiter - permitting up to `limit` acquisitions per
+    `period` for each key, in bursts of up to `burst` - implementing the
+    Generic Cell Rate Algorithm (GCRA).
+
+    The state of each key is a single integer: its "theoretical arrival
+    time" (TAT), the instant at which its acquisitions would be spent were
+    they made at exactly the permitted rate. An acquisition of `n` advances
+    the TAT by `n` emission intervals (`period / limit`, rounded up to a
+    whole nanosecond, so that the rate is never exceeded), and is permitted
+    if the result is no more than `burst` emission intervals from now.
+
+    A key whose TAT has passed is equivalent to one never seen, and may be
+    discarded, by `purge()`.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_limit',
+        '_period_ns',
+        '_burst',
+        '_interval_ns',
+        '_tolerance_ns',
+        '_clock',
+        '_now_ns',
+        # variant fields:
+        '_tats',
+    )
+
+    def __init__(
+        self,
+        limit: int,
+        period: Duration | int,
+        burst: int | None = None,
+        clock: Clock | None = None,
+    ):
+        """
+        Creates an instance permitting `limit` acquisitions per `period` -
+        a `Duration` or an integer number of nanoseconds - for each key, in
+        bursts of up to `burst` (which defaults to `limit`), measured with
+        `clock` (which defaults to `default_clock()`).
+        """
+
+        assert limit > 0, "`limit` must be positive"
+        assert int(period) > 0, "`period` must be positive"
+        assert burst is None or burst > 0, "`burst` must be positive"
+
+        self._limit = limit
+        self._period_ns = int(period)
+        self._burst = limit if burst is None else burst
+        self._interval_ns = -(-self._period_ns // limit)
+        self._tolerance_ns = self._burst * self._interval_ns
+        self._clock = clock or default_clock()
+        self._now_ns = self._clock.now_ns
+
+        self._tats = {}
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_limit: {self._limit:,}; "
+            f"_period_ns: {self._period_ns:,}; "
+            f"_burst: {self._burst:,}; "
+            f"_interval_ns: {self._interval_ns:,}; "
+            f"_clock: {self._clock!r}; "
+            f"_keys: {len(self._tats):,}; "
+            ">"
+        )
+
+    def __len__(self) -> int:
+        """
+        The number of keys whose state is held.
+        """
+
+        return len(self._tats)
+
+    def _cost_ns(self, n: int) -> int:
+
+        if not 0 < n <= self._burst:
+
+            raise ValueError(f"cannot acquire {n} when the burst is {self._burst}")
+
+        return n * self._interval_ns
+
+    def try_acquire(
+        self,
+        key=None,
+        n: int = 1,
+    ) -> bool:
+        """
+        Acquires `n` for `key`, if permitted now, indicating whether it was;
+        raises `ValueError` if `n` exceeds the burst.
+        """
+
+        now_ns = self._now_ns()
+        tats = self._tats
+
+        tat_ns = tats.get(key, now_ns)
+
+        if tat_ns < now_ns:
+
+            tat_ns = now_ns
+
+        tat_ns += self._interval_ns if 1 == n else self._cost_ns(n)
+
+        if tat_ns - self._tolerance_ns > now_ns:
+
+            return False
+
+        tats[key] = tat_ns
+
+        return True
+
+    def try_acquire_many(
+        self,
+        keys,
+        n: int = 1,
+    ) -> list[bool]:
+        """
+        Acquires `n` for each of `keys` (which may repeat), as
+        `try_acquire()`, all as of one reading of the clock, indicating for
+        each whether it was permitted.
+        """
+
+        cost_ns = self._cost_ns(n)
+        now_ns = self._now_ns()
+        limit_ns = now_ns + self._tolerance_ns
+        tats = self._tats
+        get = tats.get
+
+        result = []
+        append = result.append
+
+        for key in keys:
+
+            tat_ns = get(key, now_ns)
+
+            if tat_ns < now_ns:
+
+                tat_ns = now_ns
+
+            tat_ns += cost_ns
+
+            if tat_ns > limit_ns:
+
+                append(False)
+            else:
+
+                tats[key] = tat_ns
+
+                append(True)
+
+        return result
+
+    async def acquire(
+        self,
+        key=None,
+        n: int = 1,
+    ):
+        """
+        Acquires `n` for `key`, waiting until exactly the instant that it is
+        permitted; raises `ValueError` if `n` exceeds the burst.
+
+        The acquisition is reserved on entry, so that waiters are served in
+        the order in which they arrive, and is given back if the wait is
+        cancelled.
+        """
+
+        cost_ns = self._cost_ns(n)
+        now_ns = self._now_ns()
+        tats = self._tats
+
+        tat_ns = tats.get(key, now_ns)
+
+        if tat_ns < now_ns:
+
+            tat_ns = now_ns
+
+        tat_ns += cost_ns
+
+        tats[key] = tat_ns
+
+        ready_ns = tat_ns - self._tolerance_ns
+
+        if ready_ns <= now_ns:
+
+            return
+
+        try:
+
+            await sleep_until(ready_ns, self._clock)
+        except asyncio.CancelledError:
+
+            if key in tats:
+
+                tats[key] -= cost_ns
+
+            raise
+
+    def retry_after(
+        self,
+        key=None,
+        n: int = 1,
+    ) -> Duration:
+        """
+        The time until `n` may be acquired for `key`, which is zero if it
+        may be acquired now.
+        """
+
+        now_ns = self._now_ns()
+
+        tat_ns = max(self._tats.get(key, now_ns), now_ns) + self._cost_ns(n)
+
+        return Duration.from_nanos(max(tat_ns - self._tolerance_ns - now_ns, 0))
+
+    def tat(self, key=None) -> Instant | None:
+        """
+        The theoretical arrival time of `key`, or `None` if its state is not
+        held.
+        """
+
+        tat_ns = self._tats.get(key)
+
+        return None if tat_ns is None else Instant(tat_ns)
+
+    def purge(self) -> int:
+        """
+        Discards the state of all keys whose theoretical arrival time has
+        passed (and which are hence at full capacity), returning how many
+        were discarded.
+        """
+
+        now_ns = self._now_ns()
+        tats = self._tats
+
+        stale = [key for key, tat_ns in tats.items() if tat_ns <= now_ns]
+
+        for key in stale:
+
+            del tats[key]
+
+        return len(stale)
+
+    def burst(self) -> int:
+        """
+        The maximum number of acquisitions permitted at once.
+        """
+
+        return self._burst
+
+    def clock(self) -> Clock:
+        """
+        The limiter's clock.
+        """
+
+        return self._clock
+
+    def emission_interval(self) -> Duration:
+        """
+        The interval between acquisitions at the permitted rate.
+        """
+
+        return Duration.from_nanos(self._interval_ns)
+
+    def limit(self) -> int:
+        """
+        The number of acquisitions permitted per period.
+        """
+
+        return self._limit
+
+    def period(self) -> Duration:
+        """
+        The period over which `limit` acquisitions are permitted.
+        """
+
+        return Duration.from_nanos(self._period_ns)
+
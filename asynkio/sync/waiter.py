@@ -0,0 +1,64 @@
+# Definition of `ChannelWaiter`.
+
+import asyncio
+
+from ..time.waiter import (
+    _CANCELLED,
+    _IDLE,
+    _READY,
+    _WAITING,
+    Waiter,
+)
+
+
+class ChannelWaiter(Waiter):
+    """
+    Reusable awaitable on which a channel's receiver waits while it has
+    nothing to receive.
+
+    The first wake (e.g. by a send, or by the closing of the channel)
+    schedules the awaiting task via `loop.call_soon()`, and any further
+    wakes before it runs have no effect, so that many sends made while the
+    receiver waits cost it one wake-up.
+    """
+
+    __slots__ = ()
+
+    def _wait(self):
+
+        if _IDLE != self._state:
+
+            raise RuntimeError("receiver is already being awaited")
+
+        return self
+
+    def _wake(self):
+
+        if _WAITING == self._state:
+
+            self._complete(_READY)
+
+    def __next__(self):
+
+        state = self._state
+
+        if _IDLE == state:
+
+            self._loop = asyncio.get_running_loop()
+            self._state = _WAITING
+            self._asyncio_future_blocking = True
+
+            return self
+
+        if _READY == state:
+
+            self._reset()
+
+            raise StopIteration
+
+        if _CANCELLED == state:
+
+            self._raise_cancelled()
+
+        raise RuntimeError("receiver is already being awaited")
+
@@ -0,0 +1,386 @@
+# Definition of `channel()`, `Sender`, and `Receiver`, of the watch channel.
+
+from .errors import (
+    ChannelClosed,
+)
+from .waiter import (
+    ChannelWaiter,
+)
+
+
+class _Channel:
+    """
+    State shared by the sender and the receivers of a channel.
+
+    The channel holds only the latest value, and a version that is advanced
+    by each send; each receiver holds the version it has last seen.
+    """
+
+    __slots__ = (
+        # variant fields:
+        '_value',
+        '_version',
+        '_waiters',
+        '_closed',
+        '_receivers',
+    )
+
+    def __init__(self, value):
+
+        self._value = value
+        self._version = 0
+
+        # the waiters of the receivers waiting, in a dict so that a receiver
+        # that waits again, after a cancelled wait, is held only once
+
+        self._waiters = {}
+        self._closed = False
+        self._receivers = 1
+
+    def _wake_all(self):
+
+        waiters = self._waiters
+
+        if waiters:
+
+            self._waiters = {}
+
+            for waiter in waiters:
+
+                waiter._wake()
+
+
+class Sender:
+    """
+    Sending side of a watch channel, as obtained from `channel()`.
+
+    Each send replaces the value and advances the version, waking the
+    receivers then waiting in `changed()`; a receiver woken by the first of
+    many sends made before it runs sees only the latest. The sender must be
+    closed, with `close()` (or by use as a context manager), whereupon the
+    receivers find the channel closed.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_channel',
+        # variant fields:
+    )
+
+    def __init__(self, channel: _Channel):
+
+        self._channel = channel
+
+    def __repr__(self):
+
+        channel = self._channel
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_version: {channel._version:,}; "
+            f"_receivers: {channel._receivers:,}; "
+            f"_closed: {channel._closed}; "
+            ">"
+        )
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    def send(self, value):
+        """
+        Replaces the value with `value`, and notifies the receivers; raises
+        `ChannelClosed` if the sender is closed.
+        """
+
+        channel = self._channel
+
+        if channel._closed:
+
+            raise ChannelClosed(value)
+
+        channel._value = value
+        channel._version += 1
+
+        if channel._waiters:
+
+            channel._wake_all()
+
+    def send_replace(self, value):
+        """
+        As `send()`, returning the value replaced.
+        """
+
+        previous = self._channel._value
+
+        self.send(value)
+
+        return previous
+
+    def borrow(self):
+        """
+        The latest value (not a copy).
+        """
+
+        return self._channel._value
+
+    def subscribe(self) -> 'Receiver':
+        """
+        Obtains a new receiver, which has seen the latest value.
+        """
+
+        channel = self._channel
+
+        channel._receivers += 1
+
+        return Receiver(channel, channel._version)
+
+    def close(self):
+        """
+        Closes the channel; has no effect if already closed.
+        """
+
+        channel = self._channel
+
+        if channel._closed:
+
+            return
+
+        channel._closed = True
+
+        channel._wake_all()
+
+    def is_closed(self) -> bool:
+        """
+        Indicates whether the channel is closed.
+        """
+
+        return self._channel._closed
+
+    def receiver_count(self) -> int:
+        """
+        The number of receivers open.
+        """
+
+        return self._channel._receivers
+
+    def version(self) -> int:
+        """
+        The version of the latest value, which is 0 for the initial value
+        and is advanced by each send.
+        """
+
+        return self._channel._version
+
+
+class Receiver:
+    """
+    Receiving side of a watch channel, as obtained from `channel()`,
+    `Sender.subscribe()`, or `Receiver.clone()`.
+
+    `changed()` waits until a value that the receiver has not seen is sent,
+    and `borrow()` gives access to the latest value without copying it; a
+    loop of the form
+
+        while True:
+
+            await rx.changed()
+
+            apply(rx.borrow())
+
+    thus wakes only when the value changes, and once however many changes
+    are made in the meantime. Asynchronous iteration is equivalent, yielding
+    the latest value after each change, and ends once the sender is closed.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_channel',
+        '_waiter',
+        # variant fields:
+        '_seen',
+        '_closed',
+    )
+
+    def __init__(
+        self,
+        channel: _Channel,
+        seen: int,
+    ):
+
+        self._channel = channel
+        self._waiter = ChannelWaiter()
+
+        self._seen = seen
+        self._closed = False
+
+    def __repr__(self):
+
+        channel = self._channel
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_seen: {self._seen:,}; "
+            f"_version: {channel._version:,}; "
+            f"_closed: {self._closed}; "
+            ">"
+        )
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    def __aiter__(self):
+
+        return self
+
+    async def __anext__(self):
+
+        channel = self._channel
+
+        while True:
+
+            version = channel._version
+
+            if self._seen != version:
+
+                self._seen = version
+
+                return channel._value
+
+            if self._closed or channel._closed:
+
+                raise StopAsyncIteration
+
+            waiter = self._waiter
+
+            channel._waiters[waiter] = None
+
+            await waiter._wait()
+
+    async def changed(self):
+        """
+        Waits until the latest value is one this receiver has not seen - not
+        waiting if it already is - and marks it as seen; raises
+        `ChannelClosed` if the channel (or this receiver) is closed and
+        there is no such value.
+        """
+
+        channel = self._channel
+
+        while True:
+
+            version = channel._version
+
+            if self._seen != version:
+
+                self._seen = version
+
+                return
+
+            if self._closed or channel._closed:
+
+                raise ChannelClosed()
+
+            waiter = self._waiter
+
+            channel._waiters[waiter] = None
+
+            await waiter._wait()
+
+    def borrow(self):
+        """
+        The latest value (not a copy), without marking it as seen.
+        """
+
+        return self._channel._value
+
+    def borrow_and_update(self):
+        """
+        The latest value (not a copy), marking it as seen.
+        """
+
+        channel = self._channel
+
+        self._seen = channel._version
+
+        return channel._value
+
+    def has_changed(self) -> bool:
+        """
+        Indicates whether the latest value is one this receiver has not
+        seen.
+        """
+
+        return self._seen != self._channel._version
+
+    def mark_changed(self):
+        """
+        Marks the latest value as not seen, so that `changed()` completes
+        without waiting.
+        """
+
+        self._seen = -1
+
+    def clone(self) -> 'Receiver':
+        """
+        Obtains another receiver, which has seen what this one has.
+        """
+
+        channel = self._channel
+
+        channel._receivers += 1
+
+        return Receiver(channel, self._seen)
+
+    def close(self):
+        """
+        Closes this receiver, so that it is no longer counted by the sender
+        and waits no more; has no effect if already closed.
+        """
+
+        if self._closed:
+
+            return
+
+        self._closed = True
+
+        channel = self._channel
+
+        channel._receivers -= 1
+
+        waiter = self._waiter
+
+        channel._waiters.pop(waiter, None)
+
+        waiter._wake()
+
+    def is_closed(self) -> bool:
+        """
+        Indicates whether this receiver, or the channel, is closed.
+        """
+
+        return self._closed or self._channel._closed
+
+
+def channel(value) -> tuple[Sender, Receiver]:
+    """
+    Creates a watch channel holding the initial `value`, returning its
+    sender and a first receiver, which has seen the initial value; further
+    receivers are obtained with `Sender.subscribe()` or `Receiver.clone()`.
+    """
+
+    state = _Channel(value)
+
+    return Sender(state), Receiver(state, 0)
+
@@ -1,3 +1,25 @@
+from .arrays import (
+    DurationArray,
+    InstantArray,
+)
+from .calibrator import (
+    BiasCalibrator,
+)
+from .clock import (
+    Clock,
+    LoopClock,
+    MonotonicClock,
+    PerfCounterClock,
+    WallClock,
+    default_clock,
+)
+from .coalescer import (
+    TimerCoalescer,
+)
+from .delay_queue import (
+    DelayQueue,
+    Expired,
+)
 from .duration import (
     Duration,
 )
@@ -9,12 +31,66 @@ from .interval import (
     MissedTickBehavior,
     MissedTickBehaviour,
 )
+from .shared import (
+    SharedInterval,
+)
+from .sleep import (
+    Sleep,
+    sleep,
+    sleep_until,
+)
+from .stats import (
+    IntervalStats,
+)
+from .timeout import (
+    Timeout,
+    timeout,
+    timeout_at,
+)
+from .virtual import (
+    VirtualClock,
+    VirtualEventLoop,
+    advance,
+    pause,
+    resume,
+    run_virtual,
+)
+from .wheel import (
+    TimerWheel,
+)
 
 __all__ = [
+    'BiasCalibrator',
+    'Clock',
+    'DelayQueue',
     'Duration',
+    'DurationArray',
+    'Expired',
     'Instant',
+    'InstantArray',
     'Interval',
+    'IntervalStats',
+    'LoopClock',
     'MissedTickBehavior',
     'MissedTickBehaviour',
+    'MonotonicClock',
+    'PerfCounterClock',
+    'SharedInterval',
+    'Sleep',
+    'Timeout',
+    'TimerCoalescer',
+    'TimerWheel',
+    'VirtualClock',
+    'VirtualEventLoop',
+    'WallClock',
+    'advance',
+    'default_clock',
+    'pause',
+    'resume',
+    'run_virtual',
+    'sleep',
+    'sleep_until',
+    'timeout',
+    'timeout_at',
 ]
 
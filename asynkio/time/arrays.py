@@ -0,0 +1,479 @@
+# Definition of `DurationArray` and `InstantArray`.
+
+from array import array
+from itertools import repeat
+from operator import (
+    add,
+    floordiv,
+    mod,
+    sub,
+    truediv,
+)
+
+from .duration import (
+    Duration,
+)
+from .instant import (
+    Instant,
+)
+from .stats import (
+    nearest_rank,
+)
+
+try:
+
+    import numpy as _np
+except ImportError:
+
+    _np = None
+
+
+def _is_ndarray(data) -> bool:
+
+    return _np is not None and isinstance(data, _np.ndarray)
+
+
+def _as_data(values):
+    """
+    Adopts `values` - an `array('q')`, or a NumPy `int64` array - without
+    copying, or else copies (the integer values of) its elements into a new
+    `array('q')`.
+    """
+
+    if isinstance(values, array) and 'q' == values.typecode:
+
+        return values
+
+    if _is_ndarray(values):
+
+        assert _np.int64 == values.dtype, "NumPy arrays must be of `int64`"
+
+        return values
+
+    return array('q', map(int, values))
+
+
+class _TimeArray:
+    """
+    Base for arrays of time values, held as integer nanoseconds in an
+    `array('q')` or a NumPy `int64` array.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_data',
+        # variant fields:
+    )
+
+    def __init__(self, values=()):
+        """
+        Creates an instance from `values`: an `array('q')` or NumPy `int64`
+        array, which is adopted without copying; or any iterable of values
+        convertible (by `int()`) to nanoseconds, which is copied.
+        """
+
+        self._data = _as_data(values)
+
+    def __repr__(self):
+
+        return f"<{self.__module__}.{self.__class__.__name__}: len={len(self._data):,}>"
+
+    def __len__(self) -> int:
+
+        return len(self._data)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exports the nanosecond values, without copying, through the buffer
+        protocol (Python 3.12+; see also `data()`).
+        """
+
+        return memoryview(self._data)
+
+    def data(self):
+        """
+        The underlying `array('q')` or NumPy `int64` array of nanosecond
+        values, which supports the buffer protocol.
+        """
+
+        return self._data
+
+    def numpy(self):
+        """
+        The nanosecond values as a NumPy `int64` array, sharing (rather than
+        copying) the underlying storage. Requires NumPy.
+        """
+
+        if _np is None:
+
+            raise ImportError("NumPy is required for `numpy()`")
+
+        data = self._data
+
+        return data if _is_ndarray(data) else _np.frombuffer(data, dtype=_np.int64)
+
+    def tolist(self) -> list[int]:
+        """
+        The nanosecond values, as a list of integers.
+        """
+
+        return self._data.tolist()
+
+    def _scalar(
+        self,
+        fn,
+        ns: int,
+    ):
+
+        data = self._data
+
+        if _is_ndarray(data):
+
+            return fn(data, ns)
+
+        return array('q', map(fn, data, repeat(ns)))
+
+    def _elementwise(
+        self,
+        fn,
+        other: '_TimeArray',
+    ):
+
+        assert len(self._data) == len(other._data), "arrays must be of the same length"
+
+        lhs = self._data
+        rhs = other._data
+
+        if _is_ndarray(lhs) or _is_ndarray(rhs):
+
+            return fn(self.numpy(), other.numpy())
+
+        return array('q', map(fn, lhs, rhs))
+
+    def _min_ns(self) -> int:
+
+        return int(self._data.min()) if _is_ndarray(self._data) else min(self._data)
+
+    def _max_ns(self) -> int:
+
+        return int(self._data.max()) if _is_ndarray(self._data) else max(self._data)
+
+    def _percentile_ns(self, p: float) -> int:
+
+        assert 0 <= p <= 100, "`p` must be in the range [0, 100]"
+
+        data = self._data
+
+        if 0 == len(data):
+
+            raise ValueError("percentile of an empty array")
+
+        # nearest-rank, so that the result is a member of the array
+
+        rank = nearest_rank(p, len(data))
+
+        if _is_ndarray(data):
+
+            return int(_np.partition(data, rank - 1)[rank - 1])
+
+        return sorted(data)[rank - 1]
+
+
+class DurationArray(_TimeArray):
+    """
+    Array of durations, held as integer nanoseconds, supporting elementwise
+    arithmetic and unit conversion without creating a `Duration` per
+    element.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def from_durations(durations) -> 'DurationArray':
+        """
+        Creates an instance from an iterable of `Duration` (or of integer
+        nanoseconds).
+        """
+
+        return DurationArray(durations)
+
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+
+            return DurationArray(self._data[index])
+
+        return Duration.from_nanos(int(self._data[index]))
+
+    def __iter__(self):
+
+        return map(Duration.from_nanos, self.tolist())
+
+    def __add__(self, rhs) -> 'DurationArray':
+
+        if isinstance(rhs, DurationArray):
+
+            return DurationArray(self._elementwise(add, rhs))
+
+        if isinstance(rhs, (Duration, int)):
+
+            return DurationArray(self._scalar(add, int(rhs)))
+
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, rhs) -> 'DurationArray':
+
+        if isinstance(rhs, DurationArray):
+
+            return DurationArray(self._elementwise(sub, rhs))
+
+        if isinstance(rhs, (Duration, int)):
+
+            return DurationArray(self._scalar(sub, int(rhs)))
+
+        return NotImplemented
+
+    def __rsub__(self, lhs) -> 'DurationArray':
+
+        # `lhs - element`, for each element
+
+        if isinstance(lhs, (Duration, int)):
+
+            ns = int(lhs)
+            data = self._data
+
+            return DurationArray(ns - data if _is_ndarray(data) else array('q', map(ns.__sub__, data)))
+
+        return NotImplemented
+
+    def __mul__(self, rhs: float | int) -> 'DurationArray':
+
+        data = self._data
+
+        if isinstance(rhs, float):
+
+            # truncated, as `Duration.__mul__()`
+
+            if _is_ndarray(data):
+
+                return DurationArray((data * rhs).astype(_np.int64))
+
+            return DurationArray(array('q', [int(v * rhs) for v in data]))
+
+        if isinstance(rhs, int):
+
+            return DurationArray(data * rhs if _is_ndarray(data) else array('q', map(rhs.__mul__, data)))
+
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def as_nanos(self):
+        """
+        The durations in whole nanoseconds, as an `array('q')` (or NumPy
+        array).
+        """
+
+        return self._data
+
+    def as_micros(self):
+        """
+        The durations in whole microseconds, as an `array('q')` (or NumPy
+        array).
+        """
+
+        return self._scalar(floordiv, 1_000)
+
+    def as_millis(self):
+        """
+        The durations in whole milliseconds, as an `array('q')` (or NumPy
+        array).
+        """
+
+        return self._scalar(floordiv, 1_000_000)
+
+    def as_secs(self):
+        """
+        The durations in whole seconds, as an `array('q')` (or NumPy
+        array).
+        """
+
+        return self._scalar(floordiv, 1_000_000_000)
+
+    def as_secs_f(self):
+        """
+        The durations in fractional seconds, as an `array('d')` (or NumPy
+        array).
+        """
+
+        data = self._data
+
+        if _is_ndarray(data):
+
+            return data / 1_000_000_000.0
+
+        return array('d', map(truediv, data, repeat(1_000_000_000.0)))
+
+    def subsec_nanos(self):
+        """
+        The fractional parts of the durations, in nanoseconds.
+        """
+
+        return self._scalar(mod, 1_000_000_000)
+
+    def subsec_micros(self):
+        """
+        The fractional parts of the durations, in microseconds.
+        """
+
+        return DurationArray(self.subsec_nanos()).as_micros()
+
+    def subsec_millis(self):
+        """
+        The fractional parts of the durations, in milliseconds.
+        """
+
+        return DurationArray(self.subsec_nanos()).as_millis()
+
+    def min(self) -> Duration:
+        """
+        The least duration.
+        """
+
+        return Duration.from_nanos(self._min_ns())
+
+    def max(self) -> Duration:
+        """
+        The greatest duration.
+        """
+
+        return Duration.from_nanos(self._max_ns())
+
+    def sum(self) -> Duration:
+        """
+        The sum of the durations.
+        """
+
+        data = self._data
+
+        return Duration.from_nanos(int(data.sum()) if _is_ndarray(data) else sum(data))
+
+    def percentile(self, p: float) -> Duration:
+        """
+        The `p`'th percentile duration (by the nearest-rank method, so that
+        it is one of the durations).
+        """
+
+        return Duration.from_nanos(self._percentile_ns(p))
+
+
+class InstantArray(_TimeArray):
+    """
+    Array of instants, held as integer nanoseconds (since their clock's
+    epoch), supporting elementwise arithmetic with durations without
+    creating an `Instant` per element.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def from_instants(instants) -> 'InstantArray':
+        """
+        Creates an instance from an iterable of `Instant` (or of integer
+        nanoseconds).
+        """
+
+        return InstantArray(instants)
+
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+
+            return InstantArray(self._data[index])
+
+        return Instant(int(self._data[index]))
+
+    def __iter__(self):
+
+        return map(Instant, self.tolist())
+
+    def __add__(self, rhs) -> 'InstantArray':
+        """
+        Adds `rhs` - a `Duration` (or integer nanoseconds), or a
+        `DurationArray` of the same length - to each instant.
+        """
+
+        if isinstance(rhs, DurationArray):
+
+            return InstantArray(self._elementwise(add, rhs))
+
+        if isinstance(rhs, (Duration, int)):
+
+            return InstantArray(self._scalar(add, int(rhs)))
+
+        return NotImplemented
+
+    def __sub__(self, rhs) -> 'InstantArray | DurationArray':
+        """
+        Subtracts `rhs` from each instant: an `Instant`, or an
+        `InstantArray` of the same length, giving a `DurationArray`; or a
+        `Duration` (or integer nanoseconds), or a `DurationArray` of the
+        same length, giving an `InstantArray`.
+        """
+
+        if isinstance(rhs, InstantArray):
+
+            return DurationArray(self._elementwise(sub, rhs))
+
+        if isinstance(rhs, Instant):
+
+            return DurationArray(self._scalar(sub, int(rhs)))
+
+        if isinstance(rhs, DurationArray):
+
+            return InstantArray(self._elementwise(sub, rhs))
+
+        if isinstance(rhs, (Duration, int)):
+
+            return InstantArray(self._scalar(sub, int(rhs)))
+
+        return NotImplemented
+
+    def diff(self) -> DurationArray:
+        """
+        The durations between successive instants (of which there is one
+        fewer than there are instants).
+        """
+
+        data = self._data
+
+        if _is_ndarray(data):
+
+            return DurationArray(_np.diff(data))
+
+        return DurationArray(array('q', map(sub, data[1:], data)))
+
+    def min(self) -> Instant:
+        """
+        The earliest instant.
+        """
+
+        return Instant(self._min_ns())
+
+    def max(self) -> Instant:
+        """
+        The latest instant.
+        """
+
+        return Instant(self._max_ns())
+
+    def percentile(self, p: float) -> Instant:
+        """
+        The `p`'th percentile instant (by the nearest-rank method, so that
+        it is one of the instants).
+        """
+
+        return Instant(self._percentile_ns(p))
+
@@ -0,0 +1,127 @@
+# Definition of `BiasCalibrator`.
+
+import asyncio
+import weakref
+
+from .duration import (
+    Duration,
+)
+
+_CALIBRATORS = weakref.WeakKeyDictionary()
+
+
+class BiasCalibrator:
+    """
+    Estimates the latency with which the event loop wakes up for timers -
+    i.e. the actual wake-up time less the time for which the timer was
+    armed - as an exponentially-weighted moving average (EWMA) of observed
+    latencies, for use as an adaptive `negative_bias` (see `Interval`).
+
+    A calibrator may be used by a single interval, or shared - e.g. that
+    obtained from `for_loop()` - by all those on a loop.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_alpha',
+        '_maximum_ns',
+        # variant fields:
+        '_estimate',
+        '_samples',
+    )
+
+    def __init__(
+        self,
+        alpha: float = 0.125,
+        initial: Duration | int = 0,
+        maximum: Duration | int | None = None,
+    ):
+        """
+        Creates an instance with the given smoothing factor `alpha` - the
+        weight given to each new observation - and `initial` estimate,
+        optionally bounded by `maximum`.
+        """
+
+        assert 0.0 < alpha <= 1.0, "`alpha` must be in the range (0, 1]"
+
+        self._alpha = alpha
+        self._maximum_ns = None if maximum is None else int(maximum)
+
+        self._estimate = float(int(initial))
+        self._samples = 0
+
+    @staticmethod
+    def for_loop(loop: asyncio.AbstractEventLoop | None = None) -> 'BiasCalibrator':
+        """
+        Obtains the calibrator shared by all users of `loop` (or of the
+        running loop, if `loop` is not given), creating it if necessary.
+        """
+
+        if loop is None:
+
+            loop = asyncio.get_running_loop()
+
+        calibrator = _CALIBRATORS.get(loop)
+
+        if calibrator is None:
+
+            calibrator = BiasCalibrator()
+
+            _CALIBRATORS[loop] = calibrator
+
+        return calibrator
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_alpha: {self._alpha}; "
+            f"_maximum_ns: {self._maximum_ns}; "
+            f"_estimate: {self._estimate:,.0f}; "
+            f"_samples: {self._samples:,}; "
+            ">"
+        )
+
+    def estimate(self) -> Duration:
+        """
+        The current estimate of the wake-up latency.
+        """
+
+        return Duration.from_nanos(self._estimate_ns())
+
+    def samples(self) -> int:
+        """
+        The number of latencies observed.
+        """
+
+        return self._samples
+
+    def observe(
+        self,
+        latency_ns: int,
+    ):
+        """
+        Incorporates an observed wake-up latency, in nanoseconds, into the
+        estimate.
+        """
+
+        self._samples += 1
+        self._estimate += (latency_ns - self._estimate) * self._alpha
+
+    def _estimate_ns(self) -> int:
+
+        estimate_ns = int(self._estimate)
+
+        if estimate_ns < 0:
+
+            return 0
+
+        maximum_ns = self._maximum_ns
+
+        if maximum_ns is not None and estimate_ns > maximum_ns:
+
+            return maximum_ns
+
+        return estimate_ns
+
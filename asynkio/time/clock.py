@@ -0,0 +1,168 @@
+# Definition of `Clock` and its standard implementations.
+
+import asyncio
+import time
+import weakref
+
+# Clocks that take the place of the default clocks while their loop runs,
+# as registered by (e.g.) `VirtualEventLoop`.
+
+_LOOP_CLOCKS = weakref.WeakKeyDictionary()
+
+
+class Clock:
+    """
+    Source of the current time, in nanoseconds.
+
+    Instants obtained from different clocks are not comparable: each clock
+    has its own epoch.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+
+        return f"<{self.__module__}.{self.__class__.__name__}>"
+
+    def now_ns(self) -> int:
+        """
+        The current time, in nanoseconds since the clock's epoch.
+        """
+
+        raise NotImplementedError
+
+    def loop_time(
+        self,
+        t_ns: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> float:
+        """
+        Converts the time `t_ns`, on this clock, into the time of `loop`,
+        i.e. into a value suitable for `loop.call_at()`.
+        """
+
+        return loop.time() + (t_ns - self.now_ns()) / 1_000_000_000
+
+
+class MonotonicClock(Clock):
+    """
+    Clock based on `time.monotonic_ns()`, which is unaffected by changes to
+    the system (wall-clock) time. This is the default for scheduling.
+    """
+
+    __slots__ = ()
+
+    now_ns = staticmethod(time.monotonic_ns)
+
+
+class PerfCounterClock(Clock):
+    """
+    Clock based on `time.perf_counter_ns()`, the highest-resolution clock
+    available.
+    """
+
+    __slots__ = ()
+
+    now_ns = staticmethod(time.perf_counter_ns)
+
+
+class WallClock(Clock):
+    """
+    Clock based on `time.time_ns()`, i.e. nanoseconds since the UNIX epoch.
+    It is subject to adjustment (e.g. by NTP) and so should be used only
+    for display.
+    """
+
+    __slots__ = ()
+
+    now_ns = staticmethod(time.time_ns)
+
+
+class LoopClock(Clock):
+    """
+    Clock based on the event loop's `time()`: the given loop, if any, or
+    else the running loop.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_loop',
+        # variant fields:
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+
+        self._loop = loop
+
+    def now_ns(self) -> int:
+
+        loop = self._loop or asyncio.get_running_loop()
+
+        return int(loop.time() * 1_000_000_000)
+
+    def loop_time(
+        self,
+        t_ns: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> float:
+
+        if self._loop is None or self._loop is loop:
+
+            return t_ns / 1_000_000_000
+
+        return super().loop_time(t_ns, loop)
+
+
+MONOTONIC_CLOCK = MonotonicClock()
+PERF_COUNTER_CLOCK = PerfCounterClock()
+WALL_CLOCK = WallClock()
+
+
+def loop_clock() -> Clock | None:
+    """
+    The clock registered for the running loop (e.g. that of a
+    `VirtualEventLoop`), if any.
+    """
+
+    if not _LOOP_CLOCKS:
+
+        return None
+
+    loop = asyncio._get_running_loop()
+
+    return None if loop is None else _LOOP_CLOCKS.get(loop)
+
+
+def default_clock() -> Clock:
+    """
+    The clock used for scheduling when none is specified: that registered
+    for the running loop, if any, or else the monotonic clock.
+    """
+
+    return loop_clock() or MONOTONIC_CLOCK
+
+
+def instant_clock() -> Clock:
+    """
+    The clock of `Instant.now()`, when not given one: that registered for
+    the running loop, if any, or else the wall clock.
+    """
+
+    return loop_clock() or WALL_CLOCK
+
+
+def map_ns(
+    t_ns: int,
+    from_clock: Clock,
+    to_clock: Clock,
+) -> int:
+    """
+    Maps the time `t_ns`, on `from_clock`, onto `to_clock`, by the
+    difference between their current times.
+    """
+
+    return t_ns - from_clock.now_ns() + to_clock.now_ns()
+
@@ -0,0 +1,287 @@
+# Definition of `TimerCoalescer`.
+
+import asyncio
+import contextvars
+import weakref
+
+_COALESCERS = weakref.WeakKeyDictionary()
+
+
+def slack_deadline(
+    deadline_ns: int,
+    slack_ns: int,
+) -> int:
+    """
+    Moves `deadline_ns` later, by less than `slack_ns`, onto a boundary that
+    is shared by nearby deadlines.
+
+    As with Linux's timer slack, the boundary is a multiple of the largest
+    power of two not exceeding `slack_ns`, so that deadlines with similar
+    slack tend to coincide, and those with greater slack fall on boundaries
+    that are also boundaries for those with less.
+    """
+
+    if slack_ns <= 1:
+
+        return deadline_ns
+
+    granularity = 1 << (slack_ns.bit_length() - 1)
+
+    return -(-deadline_ns // granularity) * granularity
+
+
+class _Batch:
+    """
+    Callbacks that share a single loop timer.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_coalescer',
+        '_when_ns',
+        # variant fields:
+        '_handle',
+        '_entries',
+    )
+
+    def __init__(
+        self,
+        coalescer,
+        when_ns: int,
+    ):
+
+        self._coalescer = coalescer
+        self._when_ns = when_ns
+
+        self._handle = None
+        self._entries = {}
+
+    def _fire(self):
+
+        coalescer = self._coalescer
+
+        del coalescer._batches[self._when_ns]
+
+        entries = self._entries
+
+        self._handle = None
+
+        coalescer._wakeups += 1
+
+        # the number of callbacks called, of which all but the first are
+        # coalesced
+
+        called = 0
+
+        # iterate over a snapshot, since a callback may cancel another entry
+        # in the batch (which then removes itself from `_entries`)
+
+        for entry in tuple(entries):
+
+            if entry._batch is None:
+
+                continue
+
+            entry._batch = None
+
+            called += 1
+
+            if called > 1:
+
+                coalescer._coalesced += 1
+
+            try:
+
+                entry._callback(*entry._args)
+            except (SystemExit, KeyboardInterrupt):
+
+                raise
+            except BaseException as exc:
+
+                coalescer._loop.call_exception_handler(
+                    {
+                        'message': f"exception in coalesced timer callback {entry._callback!r}",
+                        'exception': exc,
+                    }
+                )
+
+
+class CoalescedHandle:
+    """
+    Handle to a callback scheduled with `TimerCoalescer.call_at()`.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_callback',
+        '_args',
+        # variant fields:
+        '_batch',
+    )
+
+    def __init__(
+        self,
+        batch: _Batch,
+        callback,
+        args,
+    ):
+
+        self._callback = callback
+        self._args = args
+
+        self._batch = batch
+
+    def cancel(self) -> bool:
+        """
+        Cancels the callback, if it has not yet been called; returns `True`
+        if it was cancelled.
+        """
+
+        batch = self._batch
+
+        if batch is None:
+
+            return False
+
+        self._batch = None
+
+        del batch._entries[self]
+
+        # the batch's timer is cancelled with its last entry, unless it is
+        # firing (in which case it has already been released)
+
+        if not batch._entries and batch._handle is not None:
+
+            batch._handle.cancel()
+
+            del batch._coalescer._batches[batch._when_ns]
+
+        return True
+
+    def pending(self) -> bool:
+        """
+        Indicates whether the callback is still waiting to be called.
+        """
+
+        return self._batch is not None
+
+
+class TimerCoalescer:
+    """
+    Schedules callbacks with a slack tolerance, such that those whose
+    deadlines are near each other share one loop timer (and so one loop
+    wake-up), in the manner of Linux's timer slack.
+
+    Each callback may be called up to its slack after its deadline, and
+    never before it. Deadlines are expressed in nanoseconds on the event
+    loop's clock (i.e. `loop.time()` scaled to nanoseconds).
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_loop',
+        '_context',
+        # variant fields:
+        '_batches',
+        '_wakeups',
+        '_coalesced',
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        """
+        Creates an instance bound to `loop`.
+        """
+
+        self._loop = loop
+        self._context = contextvars.Context()
+
+        self._batches = {}
+        self._wakeups = 0
+        self._coalesced = 0
+
+    @staticmethod
+    def for_loop(loop: asyncio.AbstractEventLoop | None = None) -> 'TimerCoalescer':
+        """
+        Obtains the coalescer shared by all users of `loop` (or of the
+        running loop, if `loop` is not given), creating it if necessary.
+        """
+
+        if loop is None:
+
+            loop = asyncio.get_running_loop()
+
+        coalescer = _COALESCERS.get(loop)
+
+        if coalescer is None:
+
+            coalescer = TimerCoalescer(loop)
+
+            _COALESCERS[loop] = coalescer
+
+        return coalescer
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_batches: {len(self._batches):,}; "
+            f"_wakeups: {self._wakeups:,}; "
+            f"_coalesced: {self._coalesced:,}; "
+            ">"
+        )
+
+    def __len__(self) -> int:
+        """
+        The number of loop timers currently armed.
+        """
+
+        return len(self._batches)
+
+    def wakeups(self) -> int:
+        """
+        The number of loop timers that have fired.
+        """
+
+        return self._wakeups
+
+    def coalesced_wakeups(self) -> int:
+        """
+        The number of callbacks that have been called from a loop timer
+        shared with another callback, i.e. the number of loop wake-ups that
+        have been saved.
+        """
+
+        return self._coalesced
+
+    def call_at(
+        self,
+        deadline_ns: int,
+        slack_ns: int,
+        callback,
+        *args,
+    ) -> CoalescedHandle:
+        """
+        Arranges for `callback(*args)` to be called at, or by up to
+        `slack_ns` after, `deadline_ns` on the loop's clock.
+        """
+
+        when_ns = slack_deadline(deadline_ns, slack_ns)
+
+        batch = self._batches.get(when_ns)
+
+        if batch is None:
+
+            batch = self._batches[when_ns] = _Batch(self, when_ns)
+
+            batch._handle = self._loop.call_at(when_ns / 1_000_000_000, batch._fire, context=self._context)
+
+        handle = CoalescedHandle(batch, callback, args)
+
+        batch._entries[handle] = None
+
+        return handle
+
@@ -0,0 +1,522 @@
+# Definition of `DelayQueue` and `Expired`.
+
+from array import array
+import asyncio
+from heapq import (
+    heapify,
+    heappop,
+    heappush,
+)
+
+from .clock import (
+    Clock,
+    default_clock,
+)
+from .duration import (
+    Duration,
+)
+from .instant import (
+    Instant,
+)
+from .waiter import (
+    _CANCELLED,
+    _IDLE,
+    _READY,
+    _WAITING,
+    Waiter,
+)
+
+_SLOT_MASK = 0xFFFF_FFFF
+
+
+class Expired:
+    """
+    An item removed from a `DelayQueue`, on expiry or by `remove()`.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_value',
+        '_deadline_ns',
+        '_key',
+        # variant fields:
+    )
+
+    def __init__(
+        self,
+        value,
+        deadline_ns: int,
+        key: int,
+    ):
+
+        self._value = value
+        self._deadline_ns = deadline_ns
+        self._key = key
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_value: {self._value!r}; "
+            f"_deadline_ns: {self._deadline_ns:,}; "
+            f"_key: {self._key}; "
+            ">"
+        )
+
+    def deadline(self) -> Instant:
+        """
+        The instant at which the item was due to expire.
+        """
+
+        return Instant(self._deadline_ns)
+
+    def key(self) -> int:
+        """
+        The key under which the item was inserted (and which is no longer
+        valid).
+        """
+
+        return self._key
+
+    def value(self):
+        """
+        The item's value.
+        """
+
+        return self._value
+
+
+class _ExpiryWaiter(Waiter):
+    """
+    Reusable awaitable returned by `DelayQueue.__anext__()`, which is armed
+    for the earliest deadline in the queue (or, when the queue is empty,
+    waits for an insertion).
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_queue',
+        # variant fields:
+        '_armed_ns',
+    )
+
+    def __init__(self, queue):
+
+        super().__init__()
+
+        self._queue = queue
+
+        self._armed_ns = None
+
+    def _schedule(self, loop):
+
+        deadline_ns = self._queue._next_deadline_ns()
+
+        self._armed_ns = deadline_ns
+
+        if deadline_ns is None:
+
+            self._loop = loop
+            self._state = _WAITING
+            self._asyncio_future_blocking = True
+        else:
+
+            self._arm(loop, self._queue._clock.loop_time(deadline_ns, loop))
+
+    def _reschedule(self, deadline_ns: int):
+
+        if _WAITING == self._state and (self._armed_ns is None or deadline_ns < self._armed_ns):
+
+            # an earlier deadline requires the timer to be re-armed now
+
+            self._disarm()
+            self._schedule(self._loop)
+
+    def _fire(self):
+
+        if _WAITING == self._state:
+
+            deadline_ns = self._queue._next_deadline_ns()
+
+            if deadline_ns is None or deadline_ns > self._armed_ns:
+
+                # the items due have since been reset or removed
+
+                self._handle = None
+
+                self._schedule(self._loop)
+
+                return
+
+        super()._fire()
+
+    def __next__(self):
+
+        state = self._state
+        queue = self._queue
+
+        if _IDLE == state:
+
+            expired = queue._pop_expired(queue._now_ns())
+
+            if expired is not None:
+
+                raise StopIteration(expired)
+
+            self._schedule(asyncio.get_running_loop())
+
+            return self
+
+        if _READY == state:
+
+            # the timer is due for the deadline for which it was armed, even
+            # if the clock reads fractionally earlier than the loop
+
+            armed_ns = self._armed_ns
+
+            self._reset()
+
+            expired = queue._pop_expired(max(queue._now_ns(), armed_ns))
+
+            if expired is None:
+
+                self._schedule(asyncio.get_running_loop())
+
+                return self
+
+            raise StopIteration(expired)
+
+        if _CANCELLED == state:
+
+            self._raise_cancelled()
+
+        raise RuntimeError("delay queue is already being awaited")
+
+
+class DelayQueue:
+    """
+    Queue of items that each expire at a deadline, yielded - as `Expired` -
+    by asynchronous iteration as they expire.
+
+    Items are held in slots - parallel arrays of values, deadlines, and
+    generations - that are reused once free, and are identified by integer
+    keys (combining slot and generation, so that the key of a removed item
+    is never mistaken for that of its slot's next occupant). The deadlines
+    are ordered by a binary heap of integers, in which a reset or removed
+    item's entry is discarded lazily, so that insertion and reset are
+    O(log n), and removal O(1) (amortised). However many items it holds, the
+    queue schedules one loop timer, for its earliest deadline, and only
+    while it is being iterated.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_clock',
+        '_now_ns',
+        '_waiter',
+        # variant fields:
+        '_values',
+        '_deadlines',
+        '_generations',
+        '_free',
+        '_heap',
+        '_len',
+    )
+
+    def __init__(
+        self,
+        clock: Clock | None = None,
+    ):
+        """
+        Creates an empty instance, whose deadlines are measured with `clock`
+        (which defaults to `default_clock()`).
+        """
+
+        self._clock = clock or default_clock()
+        self._now_ns = self._clock.now_ns
+        self._waiter = _ExpiryWaiter(self)
+
+        self._values = []
+        self._deadlines = array('q')
+        self._generations = array('I')
+        self._free = array('q')
+        self._heap = []
+        self._len = 0
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_clock: {self._clock!r}; "
+            f"_len: {self._len:,}; "
+            f"_slots: {len(self._values):,}; "
+            f"_heap: {len(self._heap):,}; "
+            ">"
+        )
+
+    def __len__(self) -> int:
+
+        return self._len
+
+    def __contains__(self, key: int) -> bool:
+
+        slot = key & _SLOT_MASK
+        generations = self._generations
+
+        return slot < len(generations) and 1 == generations[slot] & 1 and key >> 32 == generations[slot]
+
+    def __aiter__(self):
+
+        return self
+
+    def __anext__(self):
+        """
+        Obtains an awaitable - reused on every item - that completes with
+        the next item to expire, as `Expired`: immediately, without yielding
+        to the loop, if an item has already expired; otherwise when it does.
+
+        Iteration does not end when the queue is empty, but waits for items
+        to be inserted (and to expire).
+        """
+
+        return self._waiter
+
+    def _slot(self, key: int) -> int:
+
+        slot = key & _SLOT_MASK
+        generations = self._generations
+
+        if slot >= len(generations) or 0 == generations[slot] & 1 or key >> 32 != generations[slot]:
+
+            raise KeyError(key)
+
+        return slot
+
+    def _release(self, slot: int):
+
+        self._values[slot] = None
+        self._generations[slot] = (self._generations[slot] + 1) & _SLOT_MASK
+        self._free.append(slot)
+        self._len -= 1
+
+    def _compact(self):
+
+        # discard the heap's stale entries once they outnumber the live ones
+
+        heap = self._heap
+
+        if len(heap) > 2 * self._len + 64:
+
+            heap[:] = [
+                deadline_ns << 32 | slot
+                for slot, (generation, deadline_ns) in enumerate(zip(self._generations, self._deadlines))
+                if generation & 1
+            ]
+
+            heapify(heap)
+
+    def _next_deadline_ns(self) -> int | None:
+
+        heap = self._heap
+        deadlines = self._deadlines
+        generations = self._generations
+
+        while heap:
+
+            entry = heap[0]
+            deadline_ns = entry >> 32
+            slot = entry & _SLOT_MASK
+
+            if generations[slot] & 1 and deadlines[slot] == deadline_ns:
+
+                return deadline_ns
+
+            heappop(heap)
+
+        return None
+
+    def _pop_expired(self, now_ns: int) -> Expired | None:
+
+        heap = self._heap
+        deadlines = self._deadlines
+        generations = self._generations
+
+        while heap:
+
+            entry = heap[0]
+            deadline_ns = entry >> 32
+
+            if deadline_ns > now_ns:
+
+                return None
+
+            heappop(heap)
+
+            slot = entry & _SLOT_MASK
+            generation = generations[slot]
+
+            if generation & 1 and deadlines[slot] == deadline_ns:
+
+                expired = Expired(self._values[slot], deadline_ns, generation << 32 | slot)
+
+                self._release(slot)
+
+                return expired
+
+        return None
+
+    def insert(
+        self,
+        value,
+        timeout: Duration | int,
+    ) -> int:
+        """
+        Inserts `value`, to expire once `timeout` - a `Duration` or an
+        integer number of nanoseconds - has elapsed, returning its key.
+        """
+
+        return self.insert_at(value, self._now_ns() + int(timeout))
+
+    def insert_at(
+        self,
+        value,
+        when: Instant | int,
+    ) -> int:
+        """
+        Inserts `value`, to expire at `when` - an `Instant` or an integer
+        number of nanoseconds - on the queue's clock, returning its key.
+        """
+
+        deadline_ns = int(when)
+
+        free = self._free
+
+        if free:
+
+            slot = free.pop()
+        else:
+
+            slot = len(self._values)
+
+            self._values.append(None)
+            self._deadlines.append(0)
+            self._generations.append(0)
+
+        generation = (self._generations[slot] + 1) & _SLOT_MASK
+
+        self._values[slot] = value
+        self._deadlines[slot] = deadline_ns
+        self._generations[slot] = generation
+        self._len += 1
+
+        heappush(self._heap, deadline_ns << 32 | slot)
+
+        self._waiter._reschedule(deadline_ns)
+
+        return generation << 32 | slot
+
+    def reset(
+        self,
+        key: int,
+        timeout: Duration | int,
+    ):
+        """
+        Changes the deadline of the item with the given `key` to once
+        `timeout` has elapsed; raises `KeyError` if there is no such item.
+        """
+
+        self.reset_at(key, self._now_ns() + int(timeout))
+
+    def reset_at(
+        self,
+        key: int,
+        when: Instant | int,
+    ):
+        """
+        Changes the deadline of the item with the given `key` to `when`;
+        raises `KeyError` if there is no such item.
+        """
+
+        slot = self._slot(key)
+        deadline_ns = int(when)
+
+        self._deadlines[slot] = deadline_ns
+
+        heappush(self._heap, deadline_ns << 32 | slot)
+
+        self._compact()
+
+        self._waiter._reschedule(deadline_ns)
+
+    def remove(self, key: int) -> Expired:
+        """
+        Removes the item with the given `key`, returning it; raises
+        `KeyError` if there is no such item.
+        """
+
+        slot = self._slot(key)
+
+        expired = Expired(self._values[slot], self._deadlines[slot], key)
+
+        self._release(slot)
+
+        self._compact()
+
+        return expired
+
+    def clear(self):
+        """
+        Removes all items, invalidating their keys.
+        """
+
+        generations = self._generations
+
+        for slot, generation in enumerate(generations):
+
+            if generation & 1:
+
+                self._release(slot)
+
+        self._heap.clear()
+
+    def deadline(self, key: int) -> Instant:
+        """
+        The deadline of the item with the given `key`; raises `KeyError` if
+        there is no such item.
+        """
+
+        return Instant(self._deadlines[self._slot(key)])
+
+    def peek(self) -> int | None:
+        """
+        The key of the item that expires next, or `None` if the queue is
+        empty.
+        """
+
+        deadline_ns = self._next_deadline_ns()
+
+        if deadline_ns is None:
+
+            return None
+
+        slot = self._heap[0] & _SLOT_MASK
+
+        return self._generations[slot] << 32 | slot
+
+    def poll_expired(self) -> Expired | None:
+        """
+        Removes and returns the next item to have expired, if any, without
+        waiting.
+        """
+
+        return self._pop_expired(self._now_ns())
+
+    def clock(self) -> Clock:
+        """
+        The queue's clock.
+        """
+
+        return self._clock
+
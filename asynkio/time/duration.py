@@ -1,7 +1,204 @@
 # Definition of `Duration`.
 
+import functools
+import re
 from typing import Self
 
+# Powers of ten, by order of magnitude, and the unit suffixes of each three
+# orders of magnitude, from nanoseconds.
+
+_SCALES = (
+    1,
+    10,
+    100,
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+    100_000_000,
+    1_000_000_000,
+    10_000_000_000,
+    100_000_000_000,
+)
+
+_SUFFIXES = (
+    'ns',
+    'µs',
+    'ms',
+    's',
+)
+
+# Compiled formatters, by format spec (bounded, in case of arbitrary specs).
+
+_FORMATTERS = {}
+_MAX_FORMATTERS = 64
+
+
+def _duration_to_string(
+    v: int,
+    plus: str,
+) -> str:
+    """
+    Formats `v` nanoseconds to (up to) four significant figures in the
+    largest unit (up to seconds) in which it is whole, prefixing `plus`
+    to non-negative values.
+    """
+
+    if v < 0:
+
+        v = -v
+        sign = '-'
+    else:
+
+        sign = plus
+
+    if 0 == v:
+
+        return "0s"
+
+    # the order of magnitude, from an estimate based on the bit length
+    # that is either exact or one too large
+
+    oom = (v.bit_length() * 1_233) >> 12
+
+    if oom > 11:
+
+        oom = 11
+    elif v < _SCALES[oom]:
+
+        oom -= 1
+
+    suffix = _SUFFIXES[oom // 3]
+
+    if oom < 3:
+
+        return f"{sign}{v}{suffix}"
+
+    # four significant figures, of which 1, 2, or 3 are whole
+
+    i = oom % 3
+
+    whole, frac = divmod(v // _SCALES[oom - 3], _SCALES[3 - i])
+
+    if 0 == frac or whole > 999:
+
+        return f"{sign}{whole}{suffix}"
+
+    if 2 == i:
+
+        return f"{sign}{whole}.{frac}{suffix}"
+
+    if 1 == i:
+
+        return f"{sign}{whole}.{frac:02d}{suffix}"
+
+    return f"{sign}{whole}.{frac:03d}{suffix}"
+
+
+# Units recognised by `Duration.parse()`, in nanoseconds (with both the
+# micro sign and Greek mu for microseconds).
+
+_UNITS = {
+    'ns': 1,
+    'us': 1_000,
+    'µs': 1_000,
+    'μs': 1_000,
+    'ms': 1_000_000,
+    's': 1_000_000_000,
+    'm': 60_000_000_000,
+    'h': 3_600_000_000_000,
+}
+
+_COMPONENT_RE = re.compile(r'(\d+)(?:\.(\d+))?(ns|us|µs|μs|ms|s|m|h)', re.ASCII)
+
+
+@functools.lru_cache(maxsize=1_024)
+def _parse_nanos(s: str) -> int:
+    """
+    Parses `s` into a number of nanoseconds (see `Duration.parse()`).
+    """
+
+    body = s
+    negative = False
+
+    if body[:1] in ('+', '-'):
+
+        negative = '-' == body[0]
+        body = body[1:]
+
+    if '0' == body:
+
+        return 0
+
+    match = _COMPONENT_RE.match(body)
+
+    if match is None:
+
+        raise ValueError(f"invalid duration: {s!r}")
+
+    total = 0
+
+    while match is not None:
+
+        whole, frac, unit = match.groups()
+
+        scale = _UNITS[unit]
+
+        total += int(whole) * scale
+
+        if frac:
+
+            # exact, where representable, else truncated to nanoseconds
+
+            total += int(frac) * scale // 10 ** len(frac)
+
+        end = match.end()
+
+        match = _COMPONENT_RE.match(body, end)
+
+    if end != len(body):
+
+        raise ValueError(f"invalid duration: {s!r}")
+
+    return -total if negative else total
+
+
+class DurationFormatter:
+    """
+    Formatter of durations compiled from a format spec, as obtained from
+    `Duration.formatter()`.
+
+    The only spec character recognised is `+`, which prefixes non-negative
+    durations with `+`.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_format_spec',
+        '_plus',
+        # variant fields:
+    )
+
+    def __init__(
+        self,
+        format_spec: str = '',
+    ):
+
+        self._format_spec = format_spec
+        self._plus = '+' if '+' in format_spec else ''
+
+    def __repr__(self):
+
+        return f"<{self.__module__}.{self.__class__.__name__}: _format_spec={self._format_spec!r}>"
+
+    def __call__(self, duration: 'Duration | int') -> str:
+
+        return _duration_to_string(
+            duration._duration if type(duration) is Duration else int(duration),
+            self._plus,
+        )
+
 
 class Duration:
     """
@@ -58,6 +255,23 @@ class Duration:
 
         return Duration(0, t_s * 1_000_000_000)
 
+    @staticmethod
+    def parse(s: str) -> Self:
+        """
+        Creates a new instance from the string `s`: a sequence of one or
+        more decimal numbers, each with an optional fraction and a unit -
+        `ns`, `us` (or `µs`), `ms`, `s`, `m`, or `h` - optionally preceded
+        by a sign, e.g. `"1.5ms"`, `"250µs"`, `"1m30s"`, `"-2s"`; or `"0"`.
+        This parses the output of `str()`/`format()`.
+
+        The result is exact (in integer nanoseconds), with any fraction of
+        a nanosecond truncated. Parsed strings are cached, so that parsing
+        the same strings repeatedly (e.g. on each reload of configuration)
+        is cheap. Raises `ValueError` if `s` is not a valid duration.
+        """
+
+        return Duration(0, _parse_nanos(s))
+
     def as_nanos(self) -> int:
         """
         Total number of whole nanoseconds contained by this instance.
@@ -115,65 +329,25 @@ class Duration:
         return (self._duration % 1_000_000_000) // 1_000_000
 
     @staticmethod
-    def _scale_index(n: int) -> tuple[int, int]:
-
-        _SCALES = [
-            1,
-            10,
-            100,
-            1_000,
-            10_000,
-            100_000,
-            1_000_000,
-            10_000_000,
-            100_000_000,
-            1_000_000_000,
-            10_000_000_000,
-            100_000_000_000,
-        ]
-
-        assert n > 0
-        assert len(_SCALES) == 12
-
-        if n >= 100_000_000_000:
-
-            return (11, _SCALES[11])
-
-        lo = 0
-        hi = 11
-
-        count = 0
-
-        while lo <= hi:
-
-            count += 1
-
-            assert count < 5, f"too many loops while trying to scale {n}"
-
-            m = (hi + lo) // 2
-
-            b = _SCALES[m]
-
-            if n == b:
-
-                return (m, b)
-
-            if n < b:
+    def formatter(format_spec: str = '') -> 'DurationFormatter':
+        """
+        Obtains a formatter - a callable that formats a `Duration` (or an
+        integer number of nanoseconds) - compiled from `format_spec`, as
+        used by `format()`. Formatters are cached, so obtaining one for a
+        given spec more than once is cheap.
+        """
 
-                hi = m
+        formatter = _FORMATTERS.get(format_spec)
 
-                continue
-            else:
-                assert n > b
+        if formatter is None:
 
-                if n < b * 10:
+            formatter = DurationFormatter(format_spec)
 
-                    return (m, b)
-                else:
+            if len(_FORMATTERS) < _MAX_FORMATTERS:
 
-                    lo = m
+                _FORMATTERS[format_spec] = formatter
 
-        return (11, _SCALES[11])
+        return formatter
 
     @staticmethod
     def duration_to_string(
@@ -181,91 +355,7 @@ class Duration:
         format_spec: str = '',
     ) -> str:
 
-        v = int(duration)
-
-        if v < 0:
-
-            v = -v
-            sign = '-'
-        else:
-
-            if '+' in format_spec:
-
-                sign = '+'
-            else:
-
-                sign = ''
-
-        if v == 0:
-
-            return "0s"
-
-        oom, divisor = Duration._scale_index(v)
-
-        suffixes = [
-            'ns',
-            'µs',
-            'ms',
-            's',
-        ]
-        suffix = suffixes[oom // 3]
-
-        def fmt(
-            sign,
-            whole,
-            frac,
-            suffix,
-        ):
-
-            if frac == 0:
-
-                return f"{sign}{whole}{suffix}"
-            else:
-
-                if whole > 999:
-
-                    return f"{sign}{whole}{suffix}"
-
-                if whole > 99:
-
-                    return f"{sign}{whole}.{frac}{suffix}"
-
-                if whole > 9:
-
-                    return f"{sign}{whole}.{frac:02d}{suffix}"
-
-                return f"{sign}{whole}.{frac}{suffix}"
-
-        if oom < 3:
-
-            return f"{sign}{v}{suffix}"
-        else:
-
-            divisor_0 = divisor // 1_000
-
-            i = oom % 3
-
-            if i == 0:
-
-                divisor_1 = 1_000
-            elif i == 1:
-
-                divisor_1 = 100
-            else:
-
-                divisor_1 = 10
-
-            v //= divisor_0
-
-            whole = v // divisor_1
-            frac = v - (whole * divisor_1)
-
-            return fmt(
-                sign,
-                whole,
-                frac,
-                suffix,
-            )
+        return Duration.formatter(format_spec)(duration)
 
     def __eq__(self, rhs: Self | float | int) -> bool:
 
@@ -281,17 +371,13 @@ class Duration:
 
     def __format__(self, format_spec) -> str:
 
-        return self.duration_to_string(
-            self._duration,
-            format_spec=format_spec,
-        )
+        formatter = _FORMATTERS.get(format_spec) or Duration.formatter(format_spec)
+
+        return _duration_to_string(self._duration, formatter._plus)
 
     def __str__(self) -> str:
 
-        return self.duration_to_string(
-            self._duration,
-            format_spec='',
-        )
+        return _duration_to_string(self._duration, '')
 
     def __repr__(self) -> str:
 
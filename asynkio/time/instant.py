@@ -1,145 +1,216 @@
 # Definition of `Instant`.
 
-from datetime import (
-    UTC,
-    datetime,
-)
+from array import array
 import time
 from typing import Self
 
+from .clock import (
+    loop_clock,
+)
 from .duration import Duration
+from .iso8601 import (
+    format_iso8601,
+    format_iso8601_many,
+    parse_iso8601,
+    parse_iso8601_many,
+)
 
+# Compiled formatters, by format spec (bounded, in case of arbitrary specs).
 
-class Instant:
+_FORMATTERS = {}
+_MAX_FORMATTERS = 64
+
+
+class InstantFormatter:
     """
-    Represents a moment in time.
+    Formatter of instants compiled from a format spec, as obtained from
+    `Instant.formatter()`.
+
+    An empty spec formats as an ISO-8601 UTC timestamp (see
+    `format_iso8601()`). A spec containing one of the types `d`, `o`, `x`,
+    or `X` - optionally with `+` and/or `#` - formats the number of
+    nanoseconds as an integer of that type.
     """
 
     __slots__ = (
         # invariant fields:
-        '_t',
+        '_format_spec',
+        '_int_spec',
         # variant fields:
     )
 
-    def __init__(self, t_ns):
-        """
-        Initialises with the given time instant (specified in nanoseconds).
-        """
+    def __init__(
+        self,
+        format_spec: str = '',
+    ):
 
-        self._t = t_ns
+        typed = None
 
-    @staticmethod
-    def _t_ns_to_d_utc(t_ns: int) -> datetime:
-        """
-        Convert the number of nanoseconds since epoch into a datetime
-        instance assuming UTC.
-        """
+        for c in format_spec:
 
-        return datetime.fromtimestamp(t_ns / 1_000_000_000.0, tz=UTC)
+            if c in 'doxX':
 
-    @staticmethod
-    def now() -> Self:
-        """
-        Initialises with the current time instant.
-        """
+                if typed is not None:
 
-        t_now_ns = time.time_ns()
+                    raise ValueError(f"cannot specify type `{c}` as type already specified as `{typed}`")
 
-        return Instant(t_now_ns)
+                typed = c
 
-    @staticmethod
-    def instant_to_string(
-        instant: Self | int,
-        format_spec: str = '',
-    ) -> str:
+        self._format_spec = format_spec
 
-        typed = None
+        if typed is None:
 
-        def set_type_or_raise(
-            typed,
-            t,
-            c,
-            b,
-        ):
+            self._int_spec = None
+        else:
 
-            # local as_type
+            self._int_spec = ('+' if '+' in format_spec else '') + ('#' if '#' in format_spec else '') + typed
 
-            if typed is not None:
+    def __repr__(self):
 
-                raise ValueError(f"cannot specify type `{t}` as type already specified as `{typed[0]}`")
+        return f"<{self.__module__}.{self.__class__.__name__}: _format_spec={self._format_spec!r}>"
 
-            else:
+    def __call__(self, instant: 'Instant | int') -> str:
 
-                return (t, c, b)
+        t_ns = instant._t if type(instant) is Instant else int(instant)
 
-        show_plus = False
-        show_base = False
+        int_spec = self._int_spec
 
-        for c in format_spec:
+        if int_spec is None:
 
-            if c == 'd':
+            return format_iso8601(t_ns)
 
-                typed = set_type_or_raise(typed, int, c, '')
+        return format(t_ns, int_spec)
 
-            if c == 'o':
 
-                typed = set_type_or_raise(typed, int, c, '0o')
+class Instant:
+    """
+    Represents a moment in time.
+    """
 
-            if c == 'x':
+    __slots__ = (
+        # invariant fields:
+        '_t',
+        # variant fields:
+    )
 
-                typed = set_type_or_raise(typed, int, c, '0x')
+    def __init__(self, t_ns):
+        """
+        Initialises with the given time instant (specified in nanoseconds).
+        """
 
-            if c == 'X':
+        self._t = t_ns
 
-                typed = set_type_or_raise(typed, int, c, '0X')
+    @staticmethod
+    def now(clock=None) -> Self:
+        """
+        Initialises with the current time instant, obtained from `clock`
+        (an instance of `Clock`) if specified, or else from the wall clock
+        (or, if the running loop has a registered clock - e.g. that of a
+        `VirtualEventLoop` - from that clock).
+        """
 
-            if c == '+':
+        if clock is None:
 
-                show_plus = True
+            clock = loop_clock()
 
-            if c == '#':
+        if clock is None:
 
-                show_base = True
+            t_now_ns = time.time_ns()
+        else:
 
-        if typed:
+            t_now_ns = clock.now_ns()
 
-            if typed[0] is int:
+        return Instant(t_now_ns)
 
-                fmt = ''
+    @staticmethod
+    def formatter(format_spec: str = '') -> 'InstantFormatter':
+        """
+        Obtains a formatter - a callable that formats an `Instant` (or an
+        integer number of nanoseconds) - compiled from `format_spec`, as
+        used by `format()`. Formatters are cached, so obtaining one for a
+        given spec more than once is cheap.
+        """
 
-                if show_plus:
+        formatter = _FORMATTERS.get(format_spec)
 
-                    fmt += '+'
+        if formatter is None:
 
-                if show_base:
+            formatter = InstantFormatter(format_spec)
 
-                    fmt += '#'
+            if len(_FORMATTERS) < _MAX_FORMATTERS:
 
-                fmt += typed[1]
+                _FORMATTERS[format_spec] = formatter
 
-                return format(instant, fmt)
-            else:
+        return formatter
 
-                return NotImplemented
-        else:
+    @staticmethod
+    def instant_to_string(
+        instant: Self | int,
+        format_spec: str = '',
+    ) -> str:
 
-            d = Instant._t_ns_to_d_utc(instant)
+        return Instant.formatter(format_spec)(instant)
 
-            return d.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    def isoformat(
+        self,
+        digits: int = 6,
+    ) -> str:
+        """
+        Formats the instant, as nanoseconds since the UNIX epoch, as an
+        ISO-8601 UTC timestamp with `digits` (0, 3, 6, or 9) fractional
+        digits (see `format_iso8601()`).
+        """
+
+        return format_iso8601(self._t, digits)
+
+    @staticmethod
+    def parse(timestamp: str) -> Self:
+        """
+        Creates a new instance from the ISO-8601 / RFC-3339 timestamp
+        `timestamp` (see `parse_iso8601()`), with full nanosecond precision;
+        raises `ValueError` if it is not a valid timestamp.
+        """
+
+        return Instant(parse_iso8601(timestamp))
+
+    @staticmethod
+    def parse_many(timestamps) -> array:
+        """
+        Parses each of `timestamps` as `parse()`, into an `array('q')` of
+        nanoseconds since the UNIX epoch (which may be wrapped, without
+        copying, by `InstantArray`).
+        """
+
+        return parse_iso8601_many(timestamps)
+
+    @staticmethod
+    def format_many(
+        instants,
+        digits: int = 6,
+    ) -> list[str]:
+        """
+        Formats each of `instants` - which may be an `InstantArray`, a NumPy
+        array, an `array('q')`, or any iterable of `Instant` or of integer
+        nanoseconds - as `isoformat()`.
+        """
+
+        return format_iso8601_many(instants, digits)
 
     def __format__(self, format_spec) -> str:
 
-        return Instant.instant_to_string(
-            self._t,
-            format_spec=format_spec,
-        )
+        formatter = _FORMATTERS.get(format_spec) or Instant.formatter(format_spec)
+
+        int_spec = formatter._int_spec
+
+        if int_spec is None:
+
+            return format_iso8601(self._t)
+
+        return format(self._t, int_spec)
 
     def __str__(self) -> str:
 
-        return Instant.instant_to_string(
-            self._t,
-            format_spec='',
-        )
+        return format_iso8601(self._t)
 
     def __repr__(self) -> str:
 
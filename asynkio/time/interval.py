@@ -2,13 +2,41 @@
 
 import asyncio
 import enum
+import time
 
+from .calibrator import (
+    BiasCalibrator,
+)
+from .clock import (
+    Clock,
+    MonotonicClock,
+    default_clock,
+)
 from .duration import (
     Duration,
 )
 from .instant import (
     Instant,
 )
+from .stats import (
+    IntervalStats,
+)
+from .timerfd import (
+    _TimerFd,
+    timerfd_available,
+)
+from .waiter import (
+    _CANCELLED,
+    _IDLE,
+    _PENDING,
+    _READY,
+    _STOPPED,
+    _WAITING,
+    Waiter,
+)
+from .wheel import (
+    TimerWheel,
+)
 
 
 class MissedTickBehaviour(enum.IntEnum):
@@ -77,6 +105,286 @@ class MissedTickBehaviour(enum.IntEnum):
 MissedTickBehavior = MissedTickBehaviour
 
 
+class _TickWaiter(Waiter):
+    """
+    Reusable awaitable returned by `Interval.__await__()`.
+
+    In precision mode (i.e. when `_guard_ns` is not `None`), the timer is
+    armed for the start of the guard window before the deadline, and on
+    expiry the waiter waits out the remainder of the window on
+    `time.perf_counter_ns()`: either spinning, which blocks the loop, or
+    re-checking on each pass of the loop.
+
+    With the `timerfd` backend, the waiter is not armed with a loop timer
+    but is woken by the interval's kernel timer; likewise, the waiter of a
+    subscriber to a `SharedInterval` is woken by the shared timer.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_interval',
+        '_guard_ns',
+        '_spin',
+        # variant fields:
+        '_as_instant',
+        '_deadline_ns',
+        '_delay_ns',
+        '_wake_ns',
+        '_target_ns',
+        '_cpu0_ns',
+        '_cpu_ns',
+        '_shared_wake_ns',
+    )
+
+    def __init__(
+        self,
+        interval,
+        guard_ns: int | None,
+        spin: bool,
+    ):
+
+        super().__init__()
+
+        self._interval = interval
+        self._guard_ns = guard_ns
+        self._spin = spin
+
+        self._as_instant = False
+        self._deadline_ns = 0
+        self._delay_ns = 0
+        self._wake_ns = 0
+        self._target_ns = None
+        self._cpu0_ns = 0
+        self._cpu_ns = 0
+        self._shared_wake_ns = None
+
+    def _start(
+        self,
+        deadline_ns: int,
+        delay_ns: int,
+        wheel,
+    ):
+
+        if _IDLE != self._state:
+
+            raise RuntimeError("interval is already being awaited")
+
+        self._state = _PENDING
+        self._deadline_ns = deadline_ns
+        self._delay_ns = delay_ns
+        self._wheel = wheel
+
+        return self
+
+    def _stop(self):
+
+        if self._as_instant and self._state in (_PENDING, _WAITING):
+
+            self._complete(_STOPPED)
+
+    def _disarm(self):
+
+        super()._disarm()
+
+        if self._shared_wake_ns is not None:
+
+            self._interval._shared._remove(self)
+
+    def _reset(self):
+
+        super()._reset()
+
+        self._as_instant = False
+        self._target_ns = None
+
+    def _fire(self):
+
+        if _WAITING != self._state:
+
+            return
+
+        if self._guard_ns is not None:
+
+            target_ns = self._target_ns
+
+            if target_ns is None:
+
+                # entering the guard window, so translate the deadline onto
+                # the performance counter (reading that second, so that the
+                # translation errs late rather than early)
+
+                remaining_ns = self._deadline_ns - self._interval._now_ns()
+
+                target_ns = self._target_ns = time.perf_counter_ns() + remaining_ns
+
+                self._cpu0_ns = time.thread_time_ns()
+
+            if self._spin:
+
+                while time.perf_counter_ns() < target_ns:
+
+                    pass
+            elif time.perf_counter_ns() < target_ns:
+
+                self._handle = self._loop.call_soon(self._fire_cb, context=self._timer_context)
+
+                return
+
+            self._cpu_ns += time.thread_time_ns() - self._cpu0_ns
+            self._target_ns = None
+        else:
+
+            calibrator = self._interval._calibrator
+
+            if calibrator is not None:
+
+                calibrator.observe(self._interval._now_ns() - self._wake_ns)
+
+        super()._fire()
+
+    def _on_timerfd(self):
+
+        if _WAITING == self._state and self._interval._now_ns() >= self._wake_ns:
+
+            self._fire()
+
+    def __next__(self):
+
+        state = self._state
+
+        if _PENDING == state:
+
+            delay_ns = self._delay_ns
+
+            if 0 == delay_ns:
+
+                if self._guard_ns is None:
+
+                    # complete on the next pass of the loop, as `sleep(0)`
+
+                    self._state = _READY
+
+                    return None
+
+                # already within the guard window
+
+                self._arm_soon(asyncio.get_running_loop())
+
+                return self
+
+            loop = asyncio.get_running_loop()
+
+            shared = self._interval._shared
+
+            if shared is not None:
+
+                shared._add(self, self._wake_ns, loop)
+
+                self._loop = loop
+                self._state = _WAITING
+                self._asyncio_future_blocking = True
+
+                return self
+
+            timerfd = self._interval._timerfd
+
+            if timerfd is not None and loop is not timerfd._loop and not timerfd._open(loop):
+
+                # the loop does not support readers, so fall back to loop
+                # timers
+
+                timerfd = self._interval._timerfd = None
+
+            if timerfd is not None:
+
+                timerfd._ensure(self._wake_ns)
+
+                self._loop = loop
+                self._state = _WAITING
+                self._asyncio_future_blocking = True
+
+                return self
+
+            self._arm(loop, loop.time() + delay_ns / 1_000_000_000)
+
+            return self
+
+        if _READY == state:
+
+            as_instant = self._as_instant
+
+            self._reset()
+
+            # the tick is consumed only now, so that an await that is
+            # cancelled does not lose it
+
+            interval = self._interval
+
+            interval._deadline_ns = self._deadline_ns + interval._period_ns
+
+            stats = interval._stats
+
+            if stats is not None:
+
+                now_ns = interval._now_ns()
+
+                stats._record_tick(now_ns - self._deadline_ns, now_ns - interval._recent_ns)
+
+            if as_instant:
+
+                raise StopIteration(Instant(self._deadline_ns))
+
+            raise StopIteration
+
+        if _STOPPED == state:
+
+            self._reset()
+
+            raise StopAsyncIteration
+
+        if _CANCELLED == state:
+
+            self._raise_cancelled()
+
+        raise RuntimeError("interval tick was not awaited by a task")
+
+
+class _Take:
+    """
+    Asynchronous iterator returned by `Interval.take()`.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_interval',
+        # variant fields:
+        '_remaining',
+    )
+
+    def __init__(
+        self,
+        interval,
+        n: int,
+    ):
+
+        self._interval = interval
+        self._remaining = n
+
+    def __aiter__(self):
+
+        return self
+
+    def __anext__(self):
+
+        if self._remaining <= 0:
+
+            raise StopAsyncIteration
+
+        self._remaining -= 1
+
+        return self._interval.__anext__()
+
+
 class Interval:
     """
     Supports wait operations with a certain periodicity and behaviour for
@@ -88,11 +396,22 @@ class Interval:
         '_period_ns',
         '_missed_tick_behaviour',
         '_name',
-        '_negative_bias',
-        '_reference_instant',
+        '_calibrator',
+        '_clock',
+        '_now_ns',
+        '_reference_ns',
+        '_wheel',
+        '_waiter',
+        '_stats',
+        '_shared',
+        '__weakref__',
         # variant fields:
-        '_recent_instant',
+        '_timerfd',
+        '_negative_bias',
+        '_deadline_ns',
+        '_recent_ns',
         '_event_count',
+        '_stopped',
     )
 
     def __init__(
@@ -101,29 +420,106 @@ class Interval:
         missed_tick_behaviour: MissedTickBehaviour = MissedTickBehaviour.SKIP,
         name=None,
         negative_bias=None,
+        wheel: TimerWheel | bool | None = None,
+        clock: Clock | None = None,
+        slack: Duration | int = 0,
+        precision: Duration | int | None = None,
+        spin: bool = False,
+        stats: IntervalStats | bool | None = None,
+        timerfd: bool = False,
     ):
         """
         Creates an instance, based on the given parameters.
+
+        `negative_bias` is the time by which each tick is scheduled early,
+        to compensate for the latency of the loop: an integer number of
+        nanoseconds; or `None`, for a default based on the period; or an
+        instance of `BiasCalibrator`, in which case the bias adapts to the
+        latency observed when each tick wakes up (bounded by the period).
+
+        If `wheel` is `True` the interval's ticks are driven by the running
+        loop's shared `TimerWheel` (see `TimerWheel.for_loop()`); if it is
+        an instance of `TimerWheel` they are driven by that wheel; otherwise
+        each tick is scheduled independently with `loop.call_at()`.
+
+        The interval measures time with `clock`, which defaults to the
+        monotonic clock, so that its schedule is unaffected by changes to
+        the system time (or, when created on a `VirtualEventLoop`, to that
+        loop's virtual clock; see `default_clock()`).
+
+        If `slack` is given, each tick may be delayed by up to `slack` so
+        that it shares a loop wake-up with other timers whose deadlines are
+        nearby (see `TimerCoalescer`); the instants for which the ticks are
+        scheduled are unaffected.
+
+        If `precision` is given, the interval operates in precision mode: it
+        sleeps on the loop until `precision` before each tick (in place of
+        `negative_bias`), and then waits out the remainder on the
+        performance counter, either by spinning (if `spin`), which blocks
+        the loop, or else by yielding to the loop until the tick is due. The
+        CPU time spent doing so is reported by `precision_cpu()`.
+
+        If `stats` is `True` the interval records its ticks in a new
+        instance of `IntervalStats`; if it is an instance of `IntervalStats`
+        it records them in that instance (which may be shared). The stats
+        are available from `stats()`.
+
+        If `timerfd` is `True`, and kernel timers are available (on Linux,
+        with Python 3.13+), and the interval's clock is the monotonic clock,
+        and the loop supports readers, the interval's ticks are driven by a
+        periodic kernel timer (a `timerfd`) registered with the loop, whose
+        expirations in excess of the wake-ups are reported by `overruns()`;
+        otherwise the interval falls back to loop timers (as reported by
+        `timerfd()`). `timerfd` may not be combined with `wheel`, `slack`,
+        or `precision`.
         """
 
         assert isinstance(
             period, (Duration, int)
         ), "`period` must be instance of `Duration` or `int` (which specifies nanoseconds)"
 
-        assert negative_bias is None or negative_bias < int(
-            period
+        assert (
+            isinstance(negative_bias, BiasCalibrator) or negative_bias is None or negative_bias < int(period)
         ), "invalid `negative_bias` ({negative_bias}) given the `period` ({period)}"
 
+        assert precision is None or 0 <= int(precision) < int(
+            period
+        ), f"invalid `precision` ({precision}) given the `period` ({period})"
+
+        assert not timerfd or (
+            not wheel and not slack and precision is None
+        ), "`timerfd` may not be combined with `wheel`, `slack`, or `precision`"
+
         self._period_ns = int(period)
         self._missed_tick_behaviour = missed_tick_behaviour
         self._name = str(name) if name else ''
+        self._calibrator = negative_bias if isinstance(negative_bias, BiasCalibrator) else None
         self._negative_bias = (
             negative_bias if isinstance(negative_bias, int) else 400_000 if self._period_ns > 100_000_000 else 0
         )
-        self._reference_instant = Instant.now()
 
-        self._recent_instant = None
+        if self._calibrator is not None:
+
+            self._negative_bias = min(self._calibrator._estimate_ns(), self._period_ns - 1)
+
+        self._clock = clock or default_clock()
+        self._now_ns = self._clock.now_ns
+        self._reference_ns = self._now_ns()
+        self._wheel = wheel if isinstance(wheel, TimerWheel) else True if wheel else None
+        self._waiter = _TickWaiter(self, None if precision is None else int(precision), spin)
+        self._waiter._slack_ns = int(slack)
+        self._stats = stats if isinstance(stats, IntervalStats) else IntervalStats() if stats else None
+        self._timerfd = (
+            _TimerFd(self, self._period_ns)
+            if timerfd and timerfd_available() and isinstance(self._clock, MonotonicClock)
+            else None
+        )
+        self._shared = None
+
+        self._deadline_ns = self._reference_ns + self._period_ns
+        self._recent_ns = None
         self._event_count = 0
+        self._stopped = False
 
     def __repr__(self):
 
@@ -134,92 +530,171 @@ class Interval:
             f"_missed_tick_behaviour: {self._missed_tick_behaviour:}; "
             f"_name: {self._name}; "
             f"_negative_bias: {self._negative_bias}; "
-            f"_reference_instant: {self._reference_instant:}; "
-            f"_recent_instant: {self._recent_instant:}; "
+            f"_clock: {self._clock!r}; "
+            f"_reference_ns: {self._reference_ns:,}; "
+            f"_deadline_ns: {self._deadline_ns:,}; "
+            f"_wheel: {self._wheel}; "
+            f"_slack_ns: {self._waiter._slack_ns:,}; "
+            f"_recent_ns: {self._recent_ns}; "
             f"_event_count: {self._event_count:,}; "
             ">"
         )
 
     def __await__(self):
         """
-        .
+        Obtains an awaitable - reused on every tick - that completes at the
+        interval's next tick.
         """
 
         self._event_count += 1
 
-        now = Instant.now()
+        now_ns = self._now_ns()
+
+        deadline_ns = self._next_deadline(now_ns)
+
+        stats = self._stats
+
+        if stats is not None and now_ns >= self._deadline_ns:
+
+            mtb = self._missed_tick_behaviour
+
+            stats._record_missed(
+                (deadline_ns - self._deadline_ns) // self._period_ns if MissedTickBehaviour.SKIP == mtb else 0,
+                MissedTickBehaviour.BURST == mtb,
+            )
+
+        # wake up to `negative_bias` early (or, in precision mode, at the
+        # start of the guard window), to compensate for the latency of the
+        # loop; since the deadline is absolute, this cannot accumulate
+
+        waiter = self._waiter
+        guard_ns = waiter._guard_ns
+
+        if guard_ns is None:
+
+            calibrator = self._calibrator
+
+            if calibrator is not None:
 
-        if self._missed_tick_behaviour == MissedTickBehaviour.DELAY:
+                # never so large as to wake for a tick before the previous
 
-            # `DELAY` behaviour:
-            #
-            # simply wait for given duration
+                self._negative_bias = min(calibrator._estimate_ns(), self._period_ns - 1)
 
-            self._recent_instant = now
+            delay_ns = deadline_ns - self._negative_bias - now_ns
+        else:
 
-            return asyncio.sleep((self._period_ns - self._negative_bias) / 1_000_000_000).__await__()
+            delay_ns = deadline_ns - guard_ns - now_ns
 
-        duration: Duration = now - self._reference_instant
-        duration_ns = duration.as_nanos()
+        if delay_ns < 0:
 
-        # calculate number of intervals (`q`) and remainder (`r`)
+            delay_ns = 0
 
-        q, r = divmod(duration_ns, self._period_ns)
+        self._recent_ns = now_ns
 
-        if self._missed_tick_behaviour == MissedTickBehavior.BURST:
+        waiter._start(deadline_ns, delay_ns, self._wheel)
 
-            # `BURST` behaviour:
-            #
-            # if we're behind the event count, then either ...
+        waiter._wake_ns = now_ns + delay_ns
 
-            if self._event_count <= q:
+        return waiter
 
-                # ... respond immediately if more than full interval, or ...
+    def _next_deadline(self, now_ns: int) -> int:
+        """
+        Determines the deadline of the tick for an await at `now_ns`.
+
+        The interval tracks the (absolute) deadline of its next tick, which
+        starts at `reference + period` and, when a tick completes, advances
+        to that tick's deadline plus `period`. Hence ticks that are on time
+        incur no cumulative drift, and no tick can complete more than once.
+        When a tick has already been missed, the deadline is determined by
+        the missed-tick behaviour:
+
+        - `BURST`: the missed tick completes immediately;
+        - `DELAY`: the tick is one period from now;
+        - `SKIP`: the tick is the next multiple of period (from the
+          reference instant) after now.
+        """
+
+        deadline_ns = self._deadline_ns
+
+        if now_ns < deadline_ns:
 
-                self._recent_instant = now
+            return deadline_ns
 
-                return asyncio.sleep(0).__await__()
+        mtb = self._missed_tick_behaviour
 
-            if self._event_count + 1 == q:
+        if MissedTickBehaviour.BURST == mtb:
 
-                # ... wait for last bit of interval, otherwise ...
+            return deadline_ns
 
-                self._recent_instant = now
+        if MissedTickBehaviour.DELAY == mtb:
 
-                return asyncio.sleep(r / 1_000_000_000).__await__()
+            return now_ns + self._period_ns
 
-            # ... drop into `SKIP`
+        return deadline_ns + ((now_ns - deadline_ns) // self._period_ns + 1) * self._period_ns
 
-        # `SKIP` behaviour:
-        #
-        # In principle, the algorithm is as simple as to subtract `r` - the
-        # remainder - from the period, obtaining the number of nanoseconds
-        # for the next (asynchronous) sleep in `p_ns`. However, the nature
-        # of asyncio is that we can't always be sure not to be slightly
-        # early, so we must also remember when we last ticked, and guard
-        # against an unwanted burst.
-        #
-        # This is handled by a simple mechanism: if `p_ns` is less than a
-        # fraction of the period, then we add a whole period to it.
+    def __aiter__(self):
 
-        if not self._recent_instant:
+        return self
+
+    def __anext__(self):
+        """
+        Obtains an awaitable - reused on every tick - that completes at the
+        interval's next tick, yielding the `Instant` (on the interval's
+        clock) for which that tick was scheduled; raises
+        `StopAsyncIteration` once the interval has been stopped.
+        """
 
-            self._recent_instant = now
+        if self._stopped:
 
-            return asyncio.sleep(self._period_ns / 1_000_000_000).__await__()
+            raise StopAsyncIteration
 
-        p_ns = self._period_ns - r
-        if p_ns > (self._negative_bias * 3 / 2):
+        waiter = self.__await__()
 
-            p_ns -= self._negative_bias
+        waiter._as_instant = True
 
-        if p_ns < (self._period_ns * 1 / 10):
+        return waiter
 
-            p_ns += self._period_ns
+    def take(self, n: int):
+        """
+        Obtains an asynchronous iterator over (at most) the next `n` ticks
+        of the interval, as for `async for`.
+        """
+
+        return _Take(self, n)
+
+    async def take_while(self, predicate):
+        """
+        Asynchronous generator over the ticks of the interval, as for
+        `async for`, for as long as `predicate(instant)` holds.
+        """
 
-        self._recent_instant = now
+        async for instant in self:
+
+            if not predicate(instant):
+
+                return
+
+            yield instant
+
+    def stop(self):
+        """
+        Stops iteration over the interval: any pending tick of an `async
+        for` completes immediately, and iteration ends.
+        """
+
+        self._stopped = True
+        self._waiter._stop()
+
+        if self._timerfd is not None:
+
+            self._timerfd._close()
+
+    def clock(self) -> Clock:
+        """
+        The interval's clock.
+        """
 
-        return asyncio.sleep(p_ns / 1_000_000_000).__await__()
+        return self._clock
 
     def event_count(self) -> int:
         """
@@ -251,11 +726,22 @@ class Interval:
 
     def negative_bias(self) -> Duration:
         """
-        The interval's negative bias.
+        The interval's negative bias; if adaptive, this is the estimate (as
+        bounded by the period) with which the most recent tick was
+        scheduled.
         """
 
         return Duration.from_nanos(self._negative_bias)
 
+    def overruns(self) -> int:
+        """
+        The number of expirations of the interval's kernel timer that did
+        not each wake the interval, i.e. the kernel's count of ticks missed
+        (`0` unless the `timerfd` backend is in use).
+        """
+
+        return 0 if self._timerfd is None else self._timerfd._overruns
+
     def period(self) -> Duration:
         """
         The interval's period.
@@ -263,17 +749,57 @@ class Interval:
 
         return Duration.from_nanos(self._period_ns)
 
+    def precision(self) -> Duration | None:
+        """
+        The interval's precision guard window, or `None` if it is not in
+        precision mode.
+        """
+
+        guard_ns = self._waiter._guard_ns
+
+        return None if guard_ns is None else Duration.from_nanos(guard_ns)
+
+    def precision_cpu(self) -> Duration:
+        """
+        The (thread) CPU time spent, in precision mode, waiting out the
+        guard windows before ticks.
+        """
+
+        return Duration.from_nanos(self._waiter._cpu_ns)
+
     def recent_instant(self) -> Instant:
         """
         The instance's most recent await instant.
         """
 
-        return self._recent_instant
+        return None if self._recent_ns is None else Instant(self._recent_ns)
 
     def reference_instant(self) -> Instant:
         """
         The instance's reference instant.
         """
 
-        return self._reference_instant
+        return Instant(self._reference_ns)
+
+    def slack(self) -> Duration:
+        """
+        The interval's slack.
+        """
+
+        return Duration.from_nanos(self._waiter._slack_ns)
+
+    def stats(self) -> IntervalStats | None:
+        """
+        The interval's stats, or `None` if it is not instrumented.
+        """
+
+        return self._stats
+
+    def timerfd(self) -> bool:
+        """
+        Indicates whether the interval's ticks are driven by a kernel timer
+        (see `Interval()`).
+        """
+
+        return self._timerfd is not None
 
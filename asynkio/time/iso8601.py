@@ -0,0 +1,388 @@
+# Definition of ISO-8601 formatting and parsing of instants.
+
+from array import array
+import re
+
+_FRACTIONS = {
+    0: (None, ''),
+    3: (1_000_000, '03d'),
+    6: (1_000, '06d'),
+    9: (1, '09d'),
+}
+
+# The formatted date and time of the most recently formatted second (which,
+# being a single tuple, is replaced atomically).
+
+_prefix_cache = (None, '')
+
+# The date and time (to the second), and the date, of the most recently
+# parsed timestamps, with the corresponding numbers of seconds and days
+# (each of which, being a single tuple, is replaced atomically).
+
+_seconds_cache = (None, 0)
+_date_cache = (None, 0)
+
+_FRACTION_SCALES = (
+    1_000_000_000,
+    100_000_000,
+    10_000_000,
+    1_000_000,
+    100_000,
+    10_000,
+    1_000,
+    100,
+    10,
+    1,
+)
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_RFC3339_RE = re.compile(
+    r'(\d{4}-\d{2}-\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(?:[Zz]|([+-])(\d{2}):(\d{2}))',
+    re.ASCII,
+)
+
+
+def _civil_from_days(days: int) -> tuple[int, int, int]:
+    """
+    Converts a number of days since 1970-01-01 into the (proleptic
+    Gregorian) `(year, month, day)`, using integer arithmetic only.
+
+    See
+    ---
+        https://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    """
+
+    z = days + 719_468
+    era = z // 146_097
+    doe = z - era * 146_097
+    yoe = (doe - doe // 1_460 + doe // 36_524 - doe // 146_096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + 3 if mp < 10 else mp - 9
+
+    return (yoe + era * 400 + (1 if m <= 2 else 0), m, d)
+
+
+def _days_from_civil(
+    year: int,
+    month: int,
+    day: int,
+) -> int:
+    """
+    Converts the (proleptic Gregorian) `year`, `month`, and `day` into the
+    number of days since 1970-01-01, using integer arithmetic only.
+
+    See
+    ---
+        https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    """
+
+    if month <= 2:
+
+        year -= 1
+
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+
+    return era * 146_097 + doe - 719_468
+
+
+def _parse_date(date: str) -> int:
+    """
+    Parses `YYYY-MM-DD` into the number of days since 1970-01-01.
+    """
+
+    digits = date[:4] + date[5:7] + date[8:]
+
+    if 10 != len(date) or '-' != date[4] or '-' != date[7] or not (digits.isdigit() and digits.isascii()):
+
+        raise ValueError(f"invalid date: {date!r}")
+
+    year = int(date[:4])
+    month = int(date[5:7])
+    day = int(date[8:])
+
+    if not 1 <= month <= 12:
+
+        raise ValueError(f"invalid month in date: {date!r}")
+
+    days_in_month = _DAYS_IN_MONTH[month]
+
+    if 2 == month and 0 == year % 4 and (0 != year % 100 or 0 == year % 400):
+
+        days_in_month = 29
+
+    if not 1 <= day <= days_in_month:
+
+        raise ValueError(f"invalid day in date: {date!r}")
+
+    return _days_from_civil(year, month, day)
+
+
+def _seconds(
+    h: int,
+    m: int,
+    s: int,
+    timestamp: str,
+) -> int:
+
+    if h > 23 or m > 59 or s > 59:
+
+        raise ValueError(f"invalid time in timestamp: {timestamp!r}")
+
+    return h * 3_600 + m * 60 + s
+
+
+def _parse_seconds(prefix: str) -> int | None:
+    """
+    Parses the fixed-width `YYYY-MM-DDTHH:MM:SS` into seconds since the
+    UNIX epoch, or returns `None` if `prefix` is not of that form.
+    """
+
+    global _date_cache
+
+    if 'T' != prefix[10] or ':' != prefix[13] or ':' != prefix[16]:
+
+        return None
+
+    hms = prefix[11:13] + prefix[14:16] + prefix[17:19]
+
+    if not (hms.isdigit() and hms.isascii()):
+
+        return None
+
+    date = prefix[:10]
+
+    cached_date, days = _date_cache
+
+    if date != cached_date:
+
+        days = _parse_date(date)
+
+        _date_cache = (date, days)
+
+    return days * 86_400 + _seconds(int(hms[:2]), int(hms[2:4]), int(hms[4:]), prefix)
+
+
+def _format_prefix(t_s: int) -> str:
+
+    days, t_s = divmod(t_s, 86_400)
+    h, t_s = divmod(t_s, 3_600)
+    m, s = divmod(t_s, 60)
+
+    year, month, day = _civil_from_days(days)
+
+    return f"{year:04d}-{month:02d}-{day:02d}T{h:02d}:{m:02d}:{s:02d}"
+
+
+def _fraction(digits: int) -> tuple:
+
+    fraction = _FRACTIONS.get(digits)
+
+    if fraction is None:
+
+        raise ValueError(f"digits must be 0, 3, 6, or 9: {digits!r}")
+
+    return fraction
+
+
+def format_iso8601(
+    t_ns: int,
+    digits: int = 6,
+) -> str:
+    """
+    Formats `t_ns`, in nanoseconds since the UNIX epoch, as an ISO-8601
+    UTC timestamp - `YYYY-MM-DDTHH:MM:SS[.f...]Z` - with `digits` (0, 3, 6,
+    or 9) fractional digits, truncated; raises `ValueError` for any other
+    `digits`.
+
+    Only integer arithmetic is used, and the date and time of the most
+    recently formatted second is cached, so that formatting instants
+    within the same second formats only the fraction.
+    """
+
+    global _prefix_cache
+
+    divisor, spec = _fraction(digits)
+
+    t_s, ns = divmod(t_ns, 1_000_000_000)
+
+    cached_s, prefix = _prefix_cache
+
+    if t_s != cached_s:
+
+        prefix = _format_prefix(t_s)
+
+        _prefix_cache = (t_s, prefix)
+
+    if divisor is None:
+
+        return prefix + 'Z'
+
+    return f"{prefix}.{ns // divisor:{spec}}Z"
+
+
+def format_iso8601_many(
+    instants,
+    digits: int = 6,
+) -> list[str]:
+    """
+    Formats each of `instants` - which may be an `InstantArray`, a NumPy
+    array, an `array('q')`, or any iterable of `Instant` or of integer
+    nanoseconds - as `format_iso8601()`.
+    """
+
+    divisor, spec = _fraction(digits)
+
+    values = instants.tolist() if hasattr(instants, 'tolist') else map(int, instants)
+
+    cached_s = None
+    prefix = ''
+    result = []
+    append = result.append
+
+    for t_ns in values:
+
+        t_s, ns = divmod(t_ns, 1_000_000_000)
+
+        if t_s != cached_s:
+
+            cached_s = t_s
+            prefix = _format_prefix(t_s)
+
+        if divisor is None:
+
+            append(prefix + 'Z')
+        else:
+
+            append(f"{prefix}.{ns // divisor:{spec}}Z")
+
+    return result
+
+
+def parse_iso8601(timestamp: str) -> int:
+    """
+    Parses the ISO-8601 / RFC-3339 timestamp `timestamp` -
+    `YYYY-MM-DDTHH:MM:SS[.f...](Z|+HH:MM|-HH:MM)` - into nanoseconds since
+    the UNIX epoch, exactly (fractional digits beyond nanoseconds are
+    truncated); raises `ValueError` if it is not a valid timestamp.
+
+    The fixed-width UTC form produced by `format_iso8601()` is parsed
+    without a regular expression, and the date and time of the most
+    recently parsed second (and the day number of the most recently parsed
+    date) are cached, so that parsing timestamps within the same second
+    parses only the fraction.
+    """
+
+    global _seconds_cache
+
+    n = len(timestamp)
+
+    if n >= 20 and 'Z' == timestamp[-1] and (20 == n or '.' == timestamp[19]):
+
+        prefix = timestamp[:19]
+
+        cached_prefix, t_s = _seconds_cache
+
+        if prefix != cached_prefix:
+
+            t_s = _parse_seconds(prefix)
+
+            if t_s is not None:
+
+                _seconds_cache = (prefix, t_s)
+
+        if t_s is not None:
+
+            if 20 == n:
+
+                return t_s * 1_000_000_000
+
+            fraction = timestamp[20:-1]
+
+            if fraction.isdigit() and fraction.isascii():
+
+                if len(fraction) > 9:
+
+                    fraction = fraction[:9]
+
+                return t_s * 1_000_000_000 + int(fraction) * _FRACTION_SCALES[len(fraction)]
+
+    match = _RFC3339_RE.fullmatch(timestamp)
+
+    if match is None:
+
+        raise ValueError(f"invalid ISO-8601 timestamp: {timestamp!r}")
+
+    date, h, m, s, fraction, sign, offset_h, offset_m = match.groups()
+
+    t_s = _parse_date(date) * 86_400 + _seconds(int(h), int(m), int(s), timestamp)
+
+    if sign is not None:
+
+        offset_s = _seconds(int(offset_h), int(offset_m), 0, timestamp)
+
+        t_s += -offset_s if '+' == sign else offset_s
+
+    t_ns = t_s * 1_000_000_000
+
+    if fraction:
+
+        fraction = fraction[:9]
+
+        t_ns += int(fraction) * _FRACTION_SCALES[len(fraction)]
+
+    return t_ns
+
+
+def parse_iso8601_many(timestamps) -> array:
+    """
+    Parses each of `timestamps` as `parse_iso8601()`, into an `array('q')`
+    of nanoseconds since the UNIX epoch.
+    """
+
+    result = array('q')
+    append = result.append
+
+    cached_prefix = None
+    t_ns = 0
+
+    for timestamp in timestamps:
+
+        # the fast path (as that of `parse_iso8601()`) for a fraction in the
+        # same second as the previous timestamp
+
+        n = len(timestamp)
+
+        if 20 < n < 31 and cached_prefix is not None and 'Z' == timestamp[-1] and timestamp.startswith(cached_prefix):
+
+            fraction = timestamp[20:-1]
+
+            if fraction.isdigit() and fraction.isascii():
+
+                append(t_ns + int(fraction) * _FRACTION_SCALES[len(fraction)])
+
+                continue
+
+        value = parse_iso8601(timestamp)
+
+        append(value)
+
+        if n > 20 and '.' == timestamp[19]:
+
+            prefix, t_s = _seconds_cache
+
+            if prefix is not None and timestamp.startswith(prefix):
+
+                cached_prefix = prefix + '.'
+                t_ns = t_s * 1_000_000_000
+            else:
+
+                cached_prefix = None
+
+    return result
+
@@ -0,0 +1,326 @@
+# Definition of `SharedInterval`.
+
+import asyncio
+import heapq
+
+from .calibrator import (
+    BiasCalibrator,
+)
+from .clock import (
+    Clock,
+    default_clock,
+)
+from .duration import (
+    Duration,
+)
+from .instant import (
+    Instant,
+)
+from .interval import (
+    Interval,
+    MissedTickBehaviour,
+)
+from .stats import (
+    IntervalStats,
+)
+
+
+class SharedInterval:
+    """
+    Interval schedule shared by many subscribers - each an `Interval`,
+    obtained from `subscribe()` - whose ticks fall on the same instants
+    (`reference + k * period`), such that one loop timer expiry wakes all
+    the subscribers waiting for a tick, in one pass.
+
+    Each subscriber keeps its own deadline and missed-tick behaviour: a
+    subscriber that falls behind catches up (or not) independently of the
+    others, and one whose ticks leave the shared grid (as with `DELAY`) is
+    woken by a timer of its own.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_period_ns',
+        '_missed_tick_behaviour',
+        '_name',
+        '_negative_bias',
+        '_clock',
+        '_now_ns',
+        '_reference_ns',
+        '_on_timer_cb',
+        # variant fields:
+        '_groups',
+        '_heap',
+        '_loop',
+        '_handle',
+        '_armed_ns',
+        '_subscriptions',
+        '_wakeups',
+    )
+
+    def __init__(
+        self,
+        period: Duration | int,
+        missed_tick_behaviour: MissedTickBehaviour = MissedTickBehaviour.SKIP,
+        name=None,
+        negative_bias: int | BiasCalibrator | None = None,
+        clock: Clock | None = None,
+    ):
+        """
+        Creates an instance, based on the given parameters, which have the
+        same meanings as for `Interval` (and are the defaults for its
+        subscribers).
+        """
+
+        assert isinstance(
+            period, (Duration, int)
+        ), "`period` must be instance of `Duration` or `int` (which specifies nanoseconds)"
+
+        assert (
+            isinstance(negative_bias, BiasCalibrator) or negative_bias is None or negative_bias < int(period)
+        ), f"invalid `negative_bias` ({negative_bias}) given the `period` ({period})"
+
+        self._period_ns = int(period)
+        self._missed_tick_behaviour = missed_tick_behaviour
+        self._name = str(name) if name else ''
+        self._negative_bias = negative_bias
+        self._clock = clock or default_clock()
+        self._now_ns = self._clock.now_ns
+        self._reference_ns = self._now_ns()
+        self._on_timer_cb = self._on_timer
+
+        self._groups = {}
+        self._heap = []
+        self._loop = None
+        self._handle = None
+        self._armed_ns = None
+        self._subscriptions = 0
+        self._wakeups = 0
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_period_ns: {self._period_ns:,}; "
+            f"_missed_tick_behaviour: {self._missed_tick_behaviour:}; "
+            f"_name: {self._name}; "
+            f"_clock: {self._clock!r}; "
+            f"_reference_ns: {self._reference_ns:,}; "
+            f"_groups: {len(self._groups):,}; "
+            f"_subscriptions: {self._subscriptions:,}; "
+            f"_wakeups: {self._wakeups:,}; "
+            ">"
+        )
+
+    def subscribe(
+        self,
+        missed_tick_behaviour: MissedTickBehaviour | None = None,
+        stats: IntervalStats | bool | None = None,
+    ) -> Interval:
+        """
+        Obtains a new subscriber: an `Interval` whose first tick is the next
+        tick of the shared schedule, with the given `missed_tick_behaviour`
+        (defaulting to that of the shared interval) and `stats` (as for
+        `Interval`).
+        """
+
+        interval = Interval(
+            self._period_ns,
+            self._missed_tick_behaviour if missed_tick_behaviour is None else missed_tick_behaviour,
+            name=self._name,
+            negative_bias=self._negative_bias,
+            clock=self._clock,
+            stats=stats,
+        )
+
+        # align the subscriber to the shared schedule
+
+        period_ns = self._period_ns
+        reference_ns = self._reference_ns
+
+        interval._reference_ns = reference_ns
+        interval._deadline_ns = reference_ns + ((interval._now_ns() - reference_ns) // period_ns + 1) * period_ns
+        interval._shared = self
+
+        self._subscriptions += 1
+
+        return interval
+
+    def _add(
+        self,
+        waiter,
+        wake_ns: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+
+        group = self._groups.get(wake_ns)
+
+        if group is None:
+
+            group = self._groups[wake_ns] = {}
+
+            heapq.heappush(self._heap, wake_ns)
+
+            if self._armed_ns is None or wake_ns < self._armed_ns or loop is not self._loop:
+
+                self._arm(loop, wake_ns)
+
+        group[waiter] = None
+
+        waiter._shared_wake_ns = wake_ns
+
+    def _remove(
+        self,
+        waiter,
+    ):
+
+        wake_ns = waiter._shared_wake_ns
+
+        waiter._shared_wake_ns = None
+
+        group = self._groups.get(wake_ns)
+
+        if group is not None:
+
+            group.pop(waiter, None)
+
+            if not group:
+
+                groups = self._groups
+                heap = self._heap
+
+                del groups[wake_ns]
+
+                if wake_ns == self._armed_ns:
+
+                    # the timer is armed for this group alone, so discard
+                    # the heap entries ahead of the next live group, and
+                    # re-arm for that group (or disarm, if there is none)
+
+                    while heap and heap[0] not in groups:
+
+                        heapq.heappop(heap)
+
+                    if heap:
+
+                        self._arm(self._loop, heap[0])
+                    else:
+
+                        self._handle.cancel()
+
+                        self._handle = None
+                        self._armed_ns = None
+
+                # other heap entries are discarded lazily, but the heap is
+                # rebuilt once they outnumber the live groups, so that they
+                # do not accumulate under cancellation churn
+
+                if len(heap) > 2 * len(groups):
+
+                    heap[:] = groups
+
+                    heapq.heapify(heap)
+
+    def _arm(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        wake_ns: int,
+    ):
+
+        if self._handle is not None:
+
+            self._handle.cancel()
+
+        self._loop = loop
+        self._armed_ns = wake_ns
+        self._handle = loop.call_at(self._clock.loop_time(wake_ns, loop), self._on_timer_cb)
+
+    def _on_timer(self):
+
+        armed_ns = self._armed_ns
+
+        self._handle = None
+        self._armed_ns = None
+        self._wakeups += 1
+
+        # the timer is due for the group for which it was armed, even if the
+        # clock reads fractionally earlier than the loop
+
+        due_ns = max(self._now_ns(), armed_ns)
+
+        groups = self._groups
+        heap = self._heap
+
+        while heap and heap[0] <= due_ns:
+
+            group = groups.pop(heapq.heappop(heap), None)
+
+            if group is None:
+
+                continue
+
+            for waiter in group:
+
+                waiter._shared_wake_ns = None
+
+                waiter._fire()
+
+        while heap and heap[0] not in groups:
+
+            heapq.heappop(heap)
+
+        if heap:
+
+            self._arm(self._loop, heap[0])
+
+    def clock(self) -> Clock:
+        """
+        The shared interval's clock.
+        """
+
+        return self._clock
+
+    def missed_tick_behaviour(self) -> MissedTickBehaviour:
+        """
+        The default missed-tick behaviour of subscribers.
+        """
+
+        return self._missed_tick_behaviour
+
+    def name(self) -> str:
+        """
+        The shared interval's name.
+        """
+
+        return self._name
+
+    def period(self) -> Duration:
+        """
+        The shared interval's period.
+        """
+
+        return Duration.from_nanos(self._period_ns)
+
+    def reference_instant(self) -> Instant:
+        """
+        The shared interval's reference instant, from which all ticks fall
+        at multiples of the period.
+        """
+
+        return Instant(self._reference_ns)
+
+    def subscriptions(self) -> int:
+        """
+        The number of subscribers obtained from `subscribe()`.
+        """
+
+        return self._subscriptions
+
+    def wakeups(self) -> int:
+        """
+        The number of times that the shared loop timer has fired.
+        """
+
+        return self._wakeups
+
@@ -0,0 +1,253 @@
+# Definition of `Sleep`, `sleep()`, and `sleep_until()`.
+
+import asyncio
+
+from .clock import (
+    Clock,
+    default_clock,
+    instant_clock,
+    map_ns,
+)
+from .duration import (
+    Duration,
+)
+from .instant import (
+    Instant,
+)
+from .waiter import (
+    _CANCELLED,
+    _IDLE,
+    _READY,
+    _WAITING,
+    Waiter,
+)
+
+
+class _SleepWaiter(Waiter):
+    """
+    Reusable awaitable returned by `Sleep.__await__()`.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_sleep',
+        # variant fields:
+        '_armed_ns',
+    )
+
+    def __init__(self, sleep):
+
+        super().__init__()
+
+        self._sleep = sleep
+
+        self._armed_ns = None
+
+    def _schedule(self, loop):
+
+        sleep = self._sleep
+        deadline_ns = sleep._deadline_ns
+
+        self._armed_ns = deadline_ns
+
+        self._arm(loop, sleep._clock.loop_time(deadline_ns, loop))
+
+    def _reschedule(self, deadline_ns: int):
+
+        if _WAITING == self._state and deadline_ns < self._armed_ns:
+
+            # an earlier deadline requires the timer to be re-armed now
+
+            self._disarm()
+            self._schedule(self._loop)
+
+    def _fire(self):
+
+        if _WAITING == self._state and self._sleep._deadline_ns > self._armed_ns:
+
+            # the deadline has been extended since the timer was armed
+
+            self._handle = None
+
+            self._schedule(self._loop)
+
+            return
+
+        super()._fire()
+
+    def __next__(self):
+
+        state = self._state
+
+        if _IDLE == state:
+
+            sleep = self._sleep
+
+            if sleep._deadline_ns <= sleep._clock.now_ns():
+
+                # complete on the next pass of the loop, as `sleep(0)`
+
+                self._state = _READY
+
+                return None
+
+            self._schedule(asyncio.get_running_loop())
+
+            return self
+
+        if _READY == state:
+
+            self._reset()
+
+            raise StopIteration
+
+        if _CANCELLED == state:
+
+            self._raise_cancelled()
+
+        raise RuntimeError("sleep is already being awaited")
+
+
+class Sleep:
+    """
+    Awaitable that completes at a deadline, as returned by `sleep()` and
+    `sleep_until()`.
+
+    The deadline may be changed, with `reset()`, whether or not the sleep
+    is being awaited, and the sleep may be awaited again once it has
+    completed. Moving the deadline later does not reschedule the loop
+    timer: when the timer fires before the (new) deadline it is simply
+    re-armed, so that a deadline that is repeatedly extended costs one
+    timer per expiry rather than one per extension.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_clock',
+        '_instant_clock',
+        '_waiter',
+        # variant fields:
+        '_deadline_ns',
+    )
+
+    def __init__(
+        self,
+        deadline: Instant | int,
+        clock: Clock | None = None,
+    ):
+        """
+        Creates an instance that completes at `deadline`, which may be an
+        `Instant` or an integer number of nanoseconds, on `clock` (which
+        defaults to `default_clock()`); when `clock` is not given, an
+        `Instant` is taken to be on the clock of `Instant.now()`, and is
+        mapped onto the default clock.
+        """
+
+        if clock is None:
+
+            clock = default_clock()
+            instants = instant_clock()
+
+            # instants - e.g. from `Instant.now()` - are on the clock of
+            # `Instant.now()`, and are mapped onto that of the sleep
+
+            self._instant_clock = None if instants is clock else instants
+        else:
+
+            self._instant_clock = None
+
+        self._clock = clock
+        self._waiter = _SleepWaiter(self)
+
+        self._deadline_ns = self._to_ns(deadline)
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_clock: {self._clock!r}; "
+            f"_deadline_ns: {self._deadline_ns:,}; "
+            ">"
+        )
+
+    def __await__(self):
+        """
+        Obtains an awaitable - reused on every await - that completes at the
+        deadline.
+        """
+
+        return self._waiter
+
+    def _to_ns(self, deadline: Instant | int) -> int:
+
+        instants = self._instant_clock
+
+        if instants is None or isinstance(deadline, int):
+
+            return int(deadline)
+
+        return map_ns(int(deadline), instants, self._clock)
+
+    def _to_instant(self, t_ns: int) -> Instant:
+
+        instants = self._instant_clock
+
+        return Instant(t_ns if instants is None else map_ns(t_ns, self._clock, instants))
+
+    def deadline(self) -> Instant:
+        """
+        The instant at which the sleep completes: on the sleep's clock, if
+        given, or else on the clock of `Instant.now()`.
+        """
+
+        return self._to_instant(self._deadline_ns)
+
+    def is_elapsed(self) -> bool:
+        """
+        Indicates whether the deadline has been reached.
+        """
+
+        return self._clock.now_ns() >= self._deadline_ns
+
+    def reset(self, deadline: Instant | int):
+        """
+        Changes the deadline to `deadline`, which may be an `Instant` or an
+        integer number of nanoseconds, as for the constructor.
+        """
+
+        deadline_ns = self._to_ns(deadline)
+
+        self._deadline_ns = deadline_ns
+
+        self._waiter._reschedule(deadline_ns)
+
+
+def sleep(
+    duration: Duration | int,
+    clock: Clock | None = None,
+) -> Sleep:
+    """
+    Obtains a `Sleep` that completes once `duration` - a `Duration` or an
+    integer number of nanoseconds - has elapsed.
+    """
+
+    now_ns = (clock or default_clock()).now_ns()
+
+    return Sleep(now_ns + int(duration), clock)
+
+
+def sleep_until(
+    deadline: Instant | int,
+    clock: Clock | None = None,
+) -> Sleep:
+    """
+    Obtains a `Sleep` that completes at `deadline` - an `Instant` or an
+    integer number of nanoseconds - on `clock` (which defaults to
+    `default_clock()`); when `clock` is not given, an `Instant` is taken to
+    be on the clock of `Instant.now()`, so that, e.g.,
+    `sleep_until(Instant.now() + duration)` waits for `duration`.
+    """
+
+    return Sleep(deadline, clock)
+
@@ -0,0 +1,229 @@
+# Definition of `IntervalStats`.
+
+from array import array
+from fractions import Fraction
+
+from .duration import (
+    Duration,
+)
+
+# Lateness is bucketed by the bit-length of its value in nanoseconds, such
+# that bucket `k` (for `k > 0`) counts lateness in `[2 ** (k - 1), 2 ** k)`
+# and bucket 0 counts ticks that were on time (or early).
+
+_NUM_BUCKETS = 64
+
+_TICKS = 0
+_MISSED = 1
+_SKIPPED = 2
+_BURST = 3
+_MAX_LATENESS = 4
+_ASLEEP = 5
+_NUM_COUNTERS = 6
+
+
+def nearest_rank(
+    p: float,
+    n: int,
+) -> int:
+    """
+    The (1-based) nearest rank of the `p`'th percentile of `n` ordered
+    values, i.e. `ceil(p * n / 100)` (and at least 1).
+
+    The ceiling is exact: `p` is taken as the decimal it is written as (so
+    that, e.g., 64.4 is not its binary approximation), and the rank is then
+    computed in integer arithmetic.
+    """
+
+    q = Fraction(str(p))
+
+    return max(1, -(-q.numerator * n // (q.denominator * 100)))
+
+
+class IntervalStats:
+    """
+    Instrumentation of the ticks of an `Interval` (or of several, if
+    shared): a log-bucketed histogram of tick lateness, counts of ticks
+    and of missed, skipped, and burst ticks, the maximum lateness, and the
+    total time spent asleep.
+
+    Lateness is the time from the instant for which a tick was scheduled
+    to the resumption of the awaiting task.
+
+    All values are held in preallocated arrays, so recording a tick creates
+    no objects, and reading requires no locking: each value is always
+    consistent, though values read in turn may straddle a tick.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_counters',
+        '_buckets',
+        # variant fields:
+    )
+
+    def __init__(self):
+        """
+        Creates an instance with all values zeroed.
+        """
+
+        self._counters = array('q', bytes(8 * _NUM_COUNTERS))
+        self._buckets = array('q', bytes(8 * _NUM_BUCKETS))
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"ticks: {self.ticks():,}; "
+            f"missed: {self.missed():,}; "
+            f"skipped: {self.skipped():,}; "
+            f"burst: {self.burst():,}; "
+            f"max_lateness: {self.max_lateness()}; "
+            f"asleep: {self.asleep()}; "
+            ">"
+        )
+
+    def reset(self):
+        """
+        Zeroes all values.
+        """
+
+        counters = self._counters
+        buckets = self._buckets
+
+        for i in range(_NUM_COUNTERS):
+
+            counters[i] = 0
+
+        for i in range(_NUM_BUCKETS):
+
+            buckets[i] = 0
+
+    def ticks(self) -> int:
+        """
+        The number of ticks recorded.
+        """
+
+        return self._counters[_TICKS]
+
+    def missed(self) -> int:
+        """
+        The number of awaits that occurred after the deadline of the tick
+        for which they were due, whatever the missed-tick behaviour.
+        """
+
+        return self._counters[_MISSED]
+
+    def skipped(self) -> int:
+        """
+        The number of ticks dropped by the `SKIP` missed-tick behaviour.
+        """
+
+        return self._counters[_SKIPPED]
+
+    def burst(self) -> int:
+        """
+        The number of ticks completed immediately to catch up, by the
+        `BURST` missed-tick behaviour.
+        """
+
+        return self._counters[_BURST]
+
+    def max_lateness(self) -> Duration:
+        """
+        The greatest lateness of any tick.
+        """
+
+        return Duration.from_nanos(self._counters[_MAX_LATENESS])
+
+    def asleep(self) -> Duration:
+        """
+        The total time from each await to the completion of its tick.
+        """
+
+        return Duration.from_nanos(self._counters[_ASLEEP])
+
+    def histogram(self) -> list[tuple[Duration, int]]:
+        """
+        The lateness histogram, as a list of `(upper_bound, count)` - where
+        `upper_bound` is the (exclusive) upper bound of the bucket - for
+        each bucket up to the highest that is occupied.
+        """
+
+        buckets = self._buckets.tolist()
+
+        while buckets and 0 == buckets[-1]:
+
+            buckets.pop()
+
+        return [(Duration.from_nanos(1 << k), count) for k, count in enumerate(buckets)]
+
+    def percentile(self, p: float) -> Duration:
+        """
+        The (exclusive) upper bound of the bucket containing the `p`'th
+        percentile of lateness, i.e. an estimate that is no more than twice
+        the actual value.
+        """
+
+        assert 0 <= p <= 100, "`p` must be in the range [0, 100]"
+
+        buckets = self._buckets.tolist()
+        total = sum(buckets)
+
+        if 0 == total:
+
+            return Duration.from_nanos(0)
+
+        rank = nearest_rank(p, total)
+        seen = 0
+
+        for k, count in enumerate(buckets):
+
+            seen += count
+
+            if seen >= rank:
+
+                return Duration.from_nanos(1 << k)
+
+        return Duration.from_nanos(1 << (_NUM_BUCKETS - 1))
+
+    def _record_missed(
+        self,
+        skipped: int,
+        burst: bool,
+    ):
+
+        counters = self._counters
+
+        counters[_MISSED] += 1
+        counters[_SKIPPED] += skipped
+
+        if burst:
+
+            counters[_BURST] += 1
+
+    def _record_tick(
+        self,
+        lateness_ns: int,
+        asleep_ns: int,
+    ):
+
+        counters = self._counters
+
+        counters[_TICKS] += 1
+        counters[_ASLEEP] += asleep_ns
+
+        if lateness_ns > 0:
+
+            if lateness_ns > counters[_MAX_LATENESS]:
+
+                counters[_MAX_LATENESS] = lateness_ns
+
+            k = lateness_ns.bit_length()
+
+            self._buckets[k if k < _NUM_BUCKETS else _NUM_BUCKETS - 1] += 1
+        else:
+
+            self._buckets[0] += 1
+
@@ -0,0 +1,288 @@
+# Definition of `Timeout`, `timeout()`, and `timeout_at()`.
+
+import asyncio
+
+from .clock import (
+    Clock,
+    default_clock,
+    instant_clock,
+    map_ns,
+)
+from .duration import (
+    Duration,
+)
+from .instant import (
+    Instant,
+)
+
+_CREATED = 0
+_ENTERED = 1
+_EXPIRING = 2
+_EXPIRED = 3
+_EXITED = 4
+
+
+class Timeout:
+    """
+    Asynchronous context manager that cancels the enclosing task if it has
+    not exited by a deadline, as returned by `timeout()` and `timeout_at()`.
+
+    On expiry the cancellation is converted into a `TimeoutError` (as for
+    `asyncio.timeout()`).
+
+    The deadline may be changed, with `reschedule()`, at any time. Moving
+    the deadline later does not reschedule the loop timer: when the timer
+    fires before the (new) deadline it is simply re-armed, so that a
+    deadline that is repeatedly extended costs one timer per expiry rather
+    than one per extension. An instance may be re-entered once it has
+    exited.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_clock',
+        '_instant_clock',
+        '_on_timer_cb',
+        # variant fields:
+        '_deadline_ns',
+        '_armed_ns',
+        '_state',
+        '_task',
+        '_loop',
+        '_handle',
+        '_cancelling',
+    )
+
+    def __init__(
+        self,
+        deadline: Instant | int | None,
+        clock: Clock | None = None,
+    ):
+        """
+        Creates an instance that expires at `deadline`, which may be an
+        `Instant` or an integer number of nanoseconds, on `clock` (which
+        defaults to `default_clock()`; when `clock` is not given, an
+        `Instant` is taken to be on the clock of `Instant.now()`, and is
+        mapped onto the default clock); if `deadline` is `None` the
+        instance does not expire until rescheduled.
+        """
+
+        if clock is None:
+
+            clock = default_clock()
+            instants = instant_clock()
+
+            # instants - e.g. from `Instant.now()` - are on the clock of
+            # `Instant.now()`, and are mapped onto that of the timeout
+
+            self._instant_clock = None if instants is clock else instants
+        else:
+
+            self._instant_clock = None
+
+        self._clock = clock
+        self._on_timer_cb = self._on_timer
+
+        self._deadline_ns = None if deadline is None else self._to_ns(deadline)
+        self._armed_ns = None
+        self._state = _CREATED
+        self._task = None
+        self._loop = None
+        self._handle = None
+        self._cancelling = 0
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_clock: {self._clock!r}; "
+            f"_deadline_ns: {self._deadline_ns}; "
+            f"_armed_ns: {self._armed_ns}; "
+            f"_state: {self._state}; "
+            ">"
+        )
+
+    def _to_ns(self, deadline: Instant | int) -> int:
+
+        instants = self._instant_clock
+
+        if instants is None or isinstance(deadline, int):
+
+            return int(deadline)
+
+        return map_ns(int(deadline), instants, self._clock)
+
+    def _to_instant(self, t_ns: int) -> Instant:
+
+        instants = self._instant_clock
+
+        return Instant(t_ns if instants is None else map_ns(t_ns, self._clock, instants))
+
+    def deadline(self) -> Instant | None:
+        """
+        The instant at which the timeout expires - on the timeout's clock,
+        if given, or else on the clock of `Instant.now()` - or `None` if it
+        does not expire.
+        """
+
+        return None if self._deadline_ns is None else self._to_instant(self._deadline_ns)
+
+    def expired(self) -> bool:
+        """
+        Indicates whether the timeout has expired (in its most recent use).
+        """
+
+        return self._state in (_EXPIRING, _EXPIRED)
+
+    def reschedule(self, deadline: Instant | int | None):
+        """
+        Changes the deadline to `deadline`, which may be an `Instant` or an
+        integer number of nanoseconds, as for the constructor, or `None` for
+        no deadline.
+        """
+
+        deadline_ns = None if deadline is None else self._to_ns(deadline)
+
+        self._deadline_ns = deadline_ns
+
+        if _ENTERED != self._state:
+
+            return
+
+        if deadline_ns is None:
+
+            self._disarm()
+        elif self._armed_ns is None or deadline_ns < self._armed_ns:
+
+            # an earlier deadline requires the timer to be re-armed now
+
+            self._disarm()
+            self._arm()
+
+    async def __aenter__(self) -> 'Timeout':
+
+        if _ENTERED == self._state or _EXPIRING == self._state:
+
+            raise RuntimeError("Timeout has already been entered")
+
+        task = asyncio.current_task()
+
+        if task is None:
+
+            raise RuntimeError("Timeout should be used inside a task")
+
+        self._state = _ENTERED
+        self._task = task
+        self._loop = task.get_loop()
+        self._cancelling = task.cancelling()
+
+        if self._deadline_ns is not None:
+
+            self._arm()
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type,
+        exc_val,
+        exc_tb,
+    ):
+
+        self._disarm()
+
+        task = self._task
+
+        self._task = None
+
+        if _EXPIRING == self._state:
+
+            self._state = _EXPIRED
+
+            if task.uncancel() <= self._cancelling and exc_type is asyncio.CancelledError:
+
+                raise TimeoutError from exc_val
+        else:
+
+            self._state = _EXITED
+
+        return None
+
+    def _arm(self):
+
+        deadline_ns = self._deadline_ns
+        loop = self._loop
+
+        self._armed_ns = deadline_ns
+
+        if deadline_ns <= self._clock.now_ns():
+
+            self._handle = loop.call_soon(self._on_timer_cb)
+        else:
+
+            self._handle = loop.call_at(self._clock.loop_time(deadline_ns, loop), self._on_timer_cb)
+
+    def _disarm(self):
+
+        if self._handle is not None:
+
+            self._handle.cancel()
+
+            self._handle = None
+
+        self._armed_ns = None
+
+    def _on_timer(self):
+
+        self._handle = None
+
+        if self._deadline_ns > self._armed_ns:
+
+            # the deadline has been extended since the timer was armed
+
+            self._arm()
+
+            return
+
+        self._armed_ns = None
+
+        self._task.cancel()
+
+        self._state = _EXPIRING
+
+
+def timeout(
+    duration: Duration | int | None,
+    clock: Clock | None = None,
+) -> Timeout:
+    """
+    Obtains a `Timeout` that expires once `duration` - a `Duration` or an
+    integer number of nanoseconds - has elapsed, or that does not expire if
+    `duration` is `None`.
+    """
+
+    if duration is None:
+
+        return Timeout(None, clock)
+
+    now_ns = (clock or default_clock()).now_ns()
+
+    return Timeout(now_ns + int(duration), clock)
+
+
+def timeout_at(
+    deadline: Instant | int | None,
+    clock: Clock | None = None,
+) -> Timeout:
+    """
+    Obtains a `Timeout` that expires at `deadline` - an `Instant` or an
+    integer number of nanoseconds - on `clock` (which defaults to
+    `default_clock()`; when `clock` is not given, an `Instant` is taken to
+    be on the clock of `Instant.now()`, so that, e.g.,
+    `timeout_at(Instant.now() + duration)` expires after `duration`), or
+    that does not expire if `deadline` is `None`.
+    """
+
+    return Timeout(deadline, clock)
+
@@ -0,0 +1,165 @@
+# Definition of `_TimerFd`, the Linux `timerfd` backend of `Interval`.
+
+import asyncio
+import os
+import sys
+import time
+import weakref
+
+try:
+
+    _timerfd_create = os.timerfd_create
+    _timerfd_settime_ns = os.timerfd_settime_ns
+
+    _TFD_FLAGS = os.TFD_NONBLOCK | os.TFD_CLOEXEC
+    _TFD_TIMER_ABSTIME = os.TFD_TIMER_ABSTIME
+    _CLOCK_MONOTONIC = time.CLOCK_MONOTONIC
+
+    _AVAILABLE = True
+except AttributeError:
+
+    # timerfd is available only on Linux, with Python 3.13+
+
+    _AVAILABLE = False
+
+
+def timerfd_available() -> bool:
+    """
+    Indicates whether kernel timers (`timerfd`) are available.
+    """
+
+    return _AVAILABLE
+
+
+class _TimerFd:
+    """
+    Periodic kernel timer, on `CLOCK_MONOTONIC` (i.e. the clock of
+    `time.monotonic_ns()`), registered as a reader with an event loop, that
+    wakes an interval's tick waiter.
+
+    The timer runs whether or not the interval is being awaited; reading it
+    yields the exact number of expirations since it was last read, of which
+    all but one are counted as overruns. The interval's deadline tracking
+    (and hence its missed-tick behaviour) is unaffected: the kernel timer
+    is merely the source of wake-ups, and is re-armed whenever a wake-up
+    does not fall on its grid (e.g. after a `DELAY`).
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_interval_ref',
+        '_period_ns',
+        # variant fields:
+        '_fd',
+        '_loop',
+        '_origin_ns',
+        '_expirations',
+        '_overruns',
+        '_finalizer',
+    )
+
+    def __init__(
+        self,
+        interval,
+        period_ns: int,
+    ):
+
+        self._interval_ref = weakref.ref(interval)
+        self._period_ns = period_ns
+
+        self._fd = None
+        self._loop = None
+        self._origin_ns = None
+        self._expirations = 0
+        self._overruns = 0
+        self._finalizer = None
+
+    def _open(
+        self,
+        loop: asyncio.AbstractEventLoop,
+    ) -> bool:
+        """
+        Creates the kernel timer and registers it with `loop`; returns
+        `False` if the loop does not support readers.
+        """
+
+        self._close()
+
+        fd = _timerfd_create(_CLOCK_MONOTONIC, flags=_TFD_FLAGS)
+
+        try:
+
+            loop.add_reader(fd, self._on_readable)
+        except NotImplementedError:
+
+            os.close(fd)
+
+            return False
+
+        self._fd = fd
+        self._loop = loop
+        self._finalizer = weakref.finalize(self._interval_ref(), _close, loop, fd)
+
+        return True
+
+    def _close(self):
+
+        if self._finalizer is not None:
+
+            self._finalizer()
+
+            self._finalizer = None
+
+        self._fd = None
+        self._loop = None
+        self._origin_ns = None
+
+    def _ensure(
+        self,
+        wake_ns: int,
+    ):
+        """
+        Ensures that the timer expires at `wake_ns`, re-arming it (with
+        `wake_ns` as its origin) unless `wake_ns` falls on its grid.
+        """
+
+        origin_ns = self._origin_ns
+
+        if origin_ns is None or wake_ns < origin_ns or 0 != (wake_ns - origin_ns) % self._period_ns:
+
+            _timerfd_settime_ns(self._fd, flags=_TFD_TIMER_ABSTIME, initial=wake_ns, interval=self._period_ns)
+
+            self._origin_ns = wake_ns
+
+    def _on_readable(self):
+
+        try:
+
+            data = os.read(self._fd, 8)
+        except BlockingIOError:
+
+            return
+
+        expirations = int.from_bytes(data, sys.byteorder)
+
+        self._expirations += expirations
+        self._overruns += expirations - 1
+
+        interval = self._interval_ref()
+
+        if interval is not None:
+
+            interval._waiter._on_timerfd()
+
+
+def _close(
+    loop: asyncio.AbstractEventLoop,
+    fd: int,
+):
+
+    if not loop.is_closed():
+
+        loop.remove_reader(fd)
+
+    os.close(fd)
+
@@ -0,0 +1,291 @@
+# Definition of `VirtualClock`, `VirtualEventLoop`, `pause()`, `resume()`,
+# `advance()`, and `run_virtual()`.
+
+import asyncio
+import math
+import selectors
+import time
+
+from .clock import (
+    _LOOP_CLOCKS,
+    Clock,
+)
+from .duration import (
+    Duration,
+)
+
+
+class VirtualClock(Clock):
+    """
+    Clock that reads the virtual time of a `VirtualEventLoop`.
+
+    Its epoch is such that, when the loop is created, it reads the wall
+    clock time, so that instants obtained from it (e.g. by `Instant.now()`)
+    are plausible wall clock instants.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_loop',
+        '_epoch_ns',
+        # variant fields:
+    )
+
+    def __init__(
+        self,
+        loop: 'VirtualEventLoop',
+        epoch_ns: int,
+    ):
+
+        self._loop = loop
+        self._epoch_ns = epoch_ns
+
+    def now_ns(self) -> int:
+
+        return self._epoch_ns + self._loop._now_ns()
+
+    def loop_time(
+        self,
+        t_ns: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> float:
+
+        if self._loop is loop:
+
+            return (t_ns - self._epoch_ns) / 1_000_000_000
+
+        return super().loop_time(t_ns, loop)
+
+
+class _VirtualSelector(selectors.BaseSelector):
+    """
+    Selector that, when its loop's time is paused and the loop has nothing
+    to do but wait for a timer, advances the virtual time to that timer
+    instead of waiting.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_selector',
+        # variant fields:
+        '_loop',
+    )
+
+    def __init__(self):
+
+        self._selector = selectors.DefaultSelector()
+
+        self._loop = None
+
+    def register(self, fileobj, events, data=None):
+
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout=None):
+
+        loop = self._loop
+
+        if 0 == timeout or loop is None or not loop._paused:
+
+            return self._selector.select(timeout)
+
+        # the loop is idle: service any I/O that is ready, or else (if a
+        # timer is pending) jump to the timer
+
+        events = self._selector.select(0)
+
+        if events:
+
+            return events
+
+        if timeout is None:
+
+            return self._selector.select(None)
+
+        loop._virtual_ns += math.ceil(timeout * 1_000_000_000)
+
+        return events
+
+    def close(self):
+
+        self._selector.close()
+
+    def get_key(self, fileobj):
+
+        return self._selector.get_key(fileobj)
+
+    def get_map(self):
+
+        return self._selector.get_map()
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop whose time is virtual, for deterministic testing of code
+    that is driven by time.
+
+    While the loop's time is paused (see `pause()`) it moves only when
+    advanced explicitly (see `advance()`) or when the loop has nothing to
+    do but wait for a timer, at which point it jumps to that timer; so
+    hours of ticks, sleeps, and timeouts complete in moments. While it is
+    not paused it moves at the rate of the monotonic clock.
+
+    While the loop runs, its `VirtualClock` is the default clock (see
+    `default_clock()`) and the source of `Instant.now()`, so `Interval`,
+    `sleep()`, `timeout()`, and so on, created within it, follow virtual
+    time.
+    """
+
+    def __init__(
+        self,
+        paused: bool = True,
+    ):
+        """
+        Creates an instance whose time starts at 0, and is initially paused
+        unless `paused` is `False`.
+        """
+
+        self._paused = paused
+        self._virtual_ns = 0
+        self._real_ns = time.monotonic_ns()
+
+        selector = _VirtualSelector()
+
+        super().__init__(selector)
+
+        selector._loop = self
+
+        self._virtual_clock = VirtualClock(self, time.time_ns())
+
+        _LOOP_CLOCKS[self] = self._virtual_clock
+
+    def time(self) -> float:
+
+        return self._now_ns() / 1_000_000_000
+
+    def clock(self) -> VirtualClock:
+        """
+        The loop's virtual clock.
+        """
+
+        return self._virtual_clock
+
+    def is_paused(self) -> bool:
+        """
+        Indicates whether the loop's time is paused.
+        """
+
+        return self._paused
+
+    def pause(self):
+        """
+        Pauses the loop's time.
+        """
+
+        if not self._paused:
+
+            self._virtual_ns = self._now_ns()
+            self._paused = True
+
+    def resume(self):
+        """
+        Resumes the loop's time, which then moves at the rate of the
+        monotonic clock.
+        """
+
+        if self._paused:
+
+            self._real_ns = time.monotonic_ns()
+            self._paused = False
+
+    def _now_ns(self) -> int:
+
+        if self._paused:
+
+            return self._virtual_ns
+
+        return self._virtual_ns + (time.monotonic_ns() - self._real_ns)
+
+
+def _running_virtual_loop() -> VirtualEventLoop:
+
+    loop = asyncio.get_running_loop()
+
+    if not isinstance(loop, VirtualEventLoop):
+
+        raise RuntimeError("time can be controlled only on a VirtualEventLoop")
+
+    return loop
+
+
+def pause():
+    """
+    Pauses the time of the running loop, which must be a `VirtualEventLoop`.
+    """
+
+    _running_virtual_loop().pause()
+
+
+def resume():
+    """
+    Resumes the time of the running loop, which must be a
+    `VirtualEventLoop`.
+    """
+
+    _running_virtual_loop().resume()
+
+
+async def advance(duration: Duration | int):
+    """
+    Advances the paused time of the running loop, which must be a
+    `VirtualEventLoop`, by `duration` - a `Duration` or an integer number
+    of nanoseconds - firing, in order, the timers that fall due, and then
+    yields once so that the tasks they wake may run.
+    """
+
+    loop = _running_virtual_loop()
+
+    if not loop._paused:
+
+        raise RuntimeError("time can be advanced only while paused")
+
+    # the wait for a timer at the new time is what advances the time, so
+    # that intermediate timers fire at their own times
+
+    future = loop.create_future()
+
+    handle = loop.call_at((loop._virtual_ns + int(duration)) / 1_000_000_000, future.set_result, None)
+
+    try:
+
+        await future
+    finally:
+
+        handle.cancel()
+
+    await asyncio.sleep(0)
+
+
+def run_virtual(
+    main,
+    paused: bool = True,
+    debug: bool | None = None,
+):
+    """
+    Runs the coroutine `main` to completion, as `asyncio.run()`, on a new
+    `VirtualEventLoop` whose time is initially paused unless `paused` is
+    `False`, and returns its result.
+    """
+
+    with asyncio.Runner(debug=debug, loop_factory=lambda: VirtualEventLoop(paused)) as runner:
+
+        return runner.run(main)
+
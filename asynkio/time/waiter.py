@@ -0,0 +1,326 @@
+# Definition of `Waiter`.
+
+import asyncio
+import contextvars
+
+from .coalescer import (
+    TimerCoalescer,
+)
+from .wheel import (
+    TimerEntry,
+    TimerWheel,
+)
+
+_IDLE = 0
+_PENDING = 1
+_WAITING = 2
+_READY = 3
+_CANCELLED = 4
+_STOPPED = 5
+
+
+class Waiter(TimerEntry):
+    """
+    Base for reusable awaitables that complete at a deadline.
+
+    A waiter is both the iterator driven by the awaiting coroutine and the
+    future-like object yielded to the awaiting task, so waiting allocates
+    no futures or coroutines. The wait is scheduled directly with
+    `loop.call_at()` (or with a `TimerWheel`), and on expiry the task is
+    woken from within that timer callback. A waiter with slack is instead
+    scheduled with the loop's shared `TimerCoalescer` (or with slack in the
+    `TimerWheel`).
+
+    Subclasses define `__next__()`, which on the first step arms the waiter
+    (with `_arm()`) and yields `self`, and on the second step consumes the
+    outcome.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_fire_cb',
+        '_timer_context',
+        # variant fields:
+        '_asyncio_future_blocking',
+        '_state',
+        '_wheel',
+        '_slack_ns',
+        '_loop',
+        '_handle',
+        '_callback',
+        '_context',
+        '_cancel_message',
+    )
+
+    def __init__(self):
+
+        super().__init__()
+
+        self._fire_cb = self._fire
+        self._timer_context = contextvars.Context()
+
+        # `None` other than while being awaited, so that an idle waiter is
+        # not taken for a future (e.g. by `asyncio.ensure_future()`)
+
+        self._asyncio_future_blocking = None
+        self._state = _IDLE
+        self._wheel = None
+        self._slack_ns = 0
+        self._loop = None
+        self._handle = None
+        self._callback = None
+        self._context = None
+        self._cancel_message = None
+
+    def _arm(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        when: float,
+    ):
+        """
+        Arms the waiter to fire at `when`, on the loop's clock, and marks
+        it as waiting.
+        """
+
+        self._loop = loop
+
+        wheel = self._wheel
+
+        if wheel is None:
+
+            if 0 == self._slack_ns:
+
+                self._handle = loop.call_at(when, self._fire_cb, context=self._timer_context)
+            else:
+
+                coalescer = TimerCoalescer.for_loop(loop)
+
+                self._handle = coalescer.call_at(int(when * 1_000_000_000), self._slack_ns, self._fire_cb)
+        else:
+
+            if wheel is True:
+
+                wheel = self._wheel = TimerWheel.for_loop(loop)
+
+            wheel._insert(self, int(when * 1_000_000_000), self._slack_ns)
+
+        self._state = _WAITING
+        self._asyncio_future_blocking = True
+
+    def _arm_soon(
+        self,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        """
+        Arms the waiter to fire on the next pass of the loop, and marks it
+        as waiting.
+        """
+
+        self._loop = loop
+        self._handle = loop.call_soon(self._fire_cb, context=self._timer_context)
+
+        self._state = _WAITING
+        self._asyncio_future_blocking = True
+
+    def _disarm(self):
+
+        if self._handle is not None:
+
+            self._handle.cancel()
+
+            self._handle = None
+
+        if self._wheel_slot is not None:
+
+            self._wheel._remove(self)
+
+    def _reset(self):
+
+        self._asyncio_future_blocking = None
+        self._state = _IDLE
+        self._callback = None
+        self._context = None
+        self._cancel_message = None
+
+    def _complete(
+        self,
+        state: int,
+    ):
+        """
+        Completes the wait, other than by expiry, with the given `state`,
+        scheduling the awaiting task's wake-up.
+        """
+
+        self._disarm()
+
+        self._state = state
+
+        callback = self._callback
+
+        if callback is not None:
+
+            self._loop.call_soon(callback, self, context=self._context)
+
+            self._callback = None
+            self._context = None
+
+    def _fire(self):
+
+        if _WAITING != self._state:
+
+            return
+
+        self._state = _READY
+        self._handle = None
+
+        callback = self._callback
+
+        if callback is not None:
+
+            context = self._context
+
+            self._callback = None
+            self._context = None
+
+            # already running in a loop callback, so wake the task directly
+            # rather than via another `call_soon()`
+
+            if context is None:
+
+                callback(self)
+            else:
+
+                context.run(callback, self)
+
+    def _raise_cancelled(self):
+
+        message = self._cancel_message
+
+        self._reset()
+
+        raise asyncio.CancelledError(*(() if message is None else (message,)))
+
+    # iterator protocol (for the awaiting coroutine)
+
+    def __await__(self):
+
+        return self
+
+    def __iter__(self):
+
+        return self
+
+    def __next__(self):
+
+        raise NotImplementedError
+
+    def send(self, value):
+
+        return self.__next__()
+
+    def throw(
+        self,
+        typ,
+        val=None,
+        tb=None,
+    ):
+
+        self._disarm()
+        self._reset()
+
+        if val is None:
+
+            val = typ() if isinstance(typ, type) else typ
+
+        if tb is not None:
+
+            val = val.with_traceback(tb)
+
+        raise val
+
+    def close(self):
+
+        self._disarm()
+        self._reset()
+
+    # future protocol (for the awaiting task)
+
+    def get_loop(self):
+
+        return self._loop
+
+    def done(self) -> bool:
+
+        return self._state in (_READY, _CANCELLED, _STOPPED)
+
+    def cancelled(self) -> bool:
+
+        return _CANCELLED == self._state
+
+    def result(self):
+
+        if _READY == self._state:
+
+            return None
+
+        if _CANCELLED == self._state:
+
+            message = self._cancel_message
+
+            raise asyncio.CancelledError(*(() if message is None else (message,)))
+
+        if _STOPPED == self._state:
+
+            return None
+
+        raise asyncio.InvalidStateError("Result is not ready.")
+
+    def exception(self):
+
+        self.result()
+
+        return None
+
+    def add_done_callback(
+        self,
+        fn,
+        *,
+        context=None,
+    ):
+
+        if self.done():
+
+            self._loop.call_soon(fn, self, context=context)
+
+            return
+
+        if self._callback is not None:
+
+            raise RuntimeError("a waiter may be awaited by only one task at a time")
+
+        self._callback = fn
+        self._context = context
+
+    def remove_done_callback(self, fn) -> int:
+
+        if self._callback is not None and self._callback == fn:
+
+            self._callback = None
+            self._context = None
+
+            return 1
+
+        return 0
+
+    def cancel(self, msg=None) -> bool:
+
+        if _WAITING != self._state:
+
+            return False
+
+        self._cancel_message = msg
+
+        self._complete(_CANCELLED)
+
+        return True
+
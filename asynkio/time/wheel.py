@@ -0,0 +1,615 @@
+# Definition of `TimerWheel`.
+
+import asyncio
+import weakref
+
+from .coalescer import (
+    slack_deadline,
+)
+from .duration import (
+    Duration,
+)
+
+# The wheel has `_NUM_LEVELS` levels, each of `_LEVEL_MULT` slots. A slot at
+# level `L` spans `_LEVEL_MULT ** L` ticks, so the whole wheel spans
+# `_LEVEL_MULT ** _NUM_LEVELS` ticks (~2.2 years at 1ms resolution).
+
+_LEVEL_BITS = 6
+_LEVEL_MULT = 1 << _LEVEL_BITS
+_NUM_LEVELS = 6
+_SLOT_MASK = _LEVEL_MULT - 1
+_OCCUPIED_MASK = (1 << _LEVEL_MULT) - 1
+_MAX_TICKS = (1 << (_LEVEL_BITS * _NUM_LEVELS)) - 1
+
+_WHEELS = weakref.WeakKeyDictionary()
+
+
+class TimerEntry:
+    """
+    Base for objects that may be registered with a `TimerWheel`.
+
+    Subclasses define `_fire()`, which is called (on the event loop) when
+    the entry's deadline is reached.
+    """
+
+    __slots__ = (
+        '_wheel_tick',
+        '_wheel_slot',
+        '_wheel_level',
+        '_wheel_index',
+    )
+
+    def __init__(self):
+
+        self._wheel_tick = -1
+        self._wheel_slot = None
+        self._wheel_level = -1
+        self._wheel_index = -1
+
+    def _fire(self):
+
+        raise NotImplementedError
+
+
+class WheelHandle(TimerEntry):
+    """
+    Handle to a callback scheduled with `TimerWheel.call_at()` or
+    `TimerWheel.call_later()`.
+    """
+
+    __slots__ = (
+        '_wheel',
+        '_callback',
+        '_args',
+    )
+
+    def __init__(
+        self,
+        wheel,
+        callback,
+        args,
+    ):
+
+        super().__init__()
+
+        self._wheel = wheel
+        self._callback = callback
+        self._args = args
+
+    def __repr__(self):
+
+        return f"<{self.__module__}.{self.__class__.__name__}: _wheel_tick={self._wheel_tick}>"
+
+    def _fire(self):
+
+        self._callback(*self._args)
+
+    def cancel(self) -> bool:
+        """
+        Cancels the callback, if it has not yet been called; returns `True`
+        if it was cancelled.
+        """
+
+        return self._wheel._remove(self)
+
+    def pending(self) -> bool:
+        """
+        Indicates whether the callback is still waiting to be called.
+        """
+
+        return self._wheel_slot is not None
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel (in the style of Tokio's) that drives any
+    number of timers from a single event-loop timer.
+
+    Insertion and removal are O(1). Expiry costs O(1) per timer plus, for
+    timers further out than one level-0 rotation, a bounded number of
+    cascades to lower levels.
+
+    Deadlines are expressed in nanoseconds on the event loop's clock (i.e.
+    `loop.time()` scaled to nanoseconds), and are rounded up to the wheel's
+    resolution, so that timers never fire early. A wheel with slack also
+    moves each deadline later, by up to the slack, onto a boundary shared
+    with nearby deadlines (see `slack_deadline()`), so that they are
+    handled by a single loop wake-up.
+    """
+
+    __slots__ = (
+        # invariant fields:
+        '_resolution_ns',
+        '_slack_ns',
+        '_levels',
+        '_occupied',
+        # variant fields:
+        '_loop_ref',
+        '_elapsed',
+        '_due',
+        '_len',
+        '_handle',
+        '_armed_tick',
+        '_fired',
+        '_wakeups',
+        '_coalesced',
+    )
+
+    def __init__(
+        self,
+        resolution: Duration | int = 1_000_000,
+        loop: asyncio.AbstractEventLoop | None = None,
+        slack: Duration | int = 0,
+    ):
+        """
+        Creates an instance with the given `resolution` (which defaults to
+        1ms) and `slack` (which defaults to none), optionally bound to
+        `loop`; if `loop` is not given the wheel binds to the running loop
+        when first used.
+        """
+
+        assert isinstance(
+            resolution, (Duration, int)
+        ), "`resolution` must be instance of `Duration` or `int` (which specifies nanoseconds)"
+
+        assert int(resolution) > 0, "`resolution` must be positive"
+
+        self._resolution_ns = int(resolution)
+        self._slack_ns = int(slack)
+        self._levels = [[{} for _ in range(_LEVEL_MULT)] for _ in range(_NUM_LEVELS)]
+        self._occupied = [0] * _NUM_LEVELS
+
+        self._loop_ref = None
+        self._elapsed = 0
+        self._due = {}
+        self._len = 0
+        self._handle = None
+        self._armed_tick = None
+        self._fired = 0
+        self._wakeups = 0
+        self._coalesced = 0
+
+        if loop is not None:
+
+            self._bind(loop)
+
+    @staticmethod
+    def for_loop(loop: asyncio.AbstractEventLoop | None = None) -> 'TimerWheel':
+        """
+        Obtains the wheel shared by all users of `loop` (or of the running
+        loop, if `loop` is not given), creating it if necessary.
+        """
+
+        if loop is None:
+
+            loop = asyncio.get_running_loop()
+
+        wheel = _WHEELS.get(loop)
+
+        if wheel is None:
+
+            wheel = TimerWheel(loop=loop)
+
+            _WHEELS[loop] = wheel
+
+        return wheel
+
+    def __repr__(self):
+
+        return (
+            ""
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"_resolution_ns: {self._resolution_ns:,}; "
+            f"_elapsed: {self._elapsed:,}; "
+            f"_len: {self._len:,}; "
+            f"_armed_tick: {self._armed_tick}; "
+            f"_wakeups: {self._wakeups:,}; "
+            f"_coalesced: {self._coalesced:,}; "
+            ">"
+        )
+
+    def __len__(self) -> int:
+        """
+        The number of timers currently registered.
+        """
+
+        return self._len
+
+    def resolution(self) -> Duration:
+        """
+        The wheel's resolution, i.e. the span of a level-0 slot.
+        """
+
+        return Duration.from_nanos(self._resolution_ns)
+
+    def slack(self) -> Duration:
+        """
+        The wheel's slack, i.e. by how much it may delay any timer in order
+        to coalesce it with others.
+        """
+
+        return Duration.from_nanos(self._slack_ns)
+
+    def wakeups(self) -> int:
+        """
+        The number of loop wake-ups in which the wheel has fired timers.
+        """
+
+        return self._wakeups
+
+    def coalesced_wakeups(self) -> int:
+        """
+        The number of timers that have fired in a loop wake-up shared with
+        another timer, i.e. the number of loop wake-ups that have been
+        saved.
+        """
+
+        return self._coalesced
+
+    def loop_time_ns(self) -> int:
+        """
+        The current time of the wheel's loop, in nanoseconds.
+        """
+
+        return int(self._loop().time() * 1_000_000_000)
+
+    def call_at(
+        self,
+        deadline_ns: int,
+        callback,
+        *args,
+    ) -> WheelHandle:
+        """
+        Arranges for `callback(*args)` to be called at (or, by up to the
+        wheel's resolution, after) `deadline_ns` on the loop's clock.
+        """
+
+        handle = WheelHandle(self, callback, args)
+
+        self._insert(handle, deadline_ns)
+
+        return handle
+
+    def call_later(
+        self,
+        delay: Duration | int,
+        callback,
+        *args,
+    ) -> WheelHandle:
+        """
+        Arranges for `callback(*args)` to be called after `delay` (which may
+        be a `Duration` or an integer number of nanoseconds).
+        """
+
+        return self.call_at(self.loop_time_ns() + int(delay), callback, *args)
+
+    def _bind(self, loop):
+
+        self._loop_ref = weakref.ref(loop)
+        self._elapsed = int(loop.time() * 1_000_000_000) // self._resolution_ns
+
+    def _loop(self):
+
+        loop_ref = self._loop_ref
+
+        if loop_ref is None:
+
+            loop = asyncio.get_running_loop()
+
+            self._bind(loop)
+
+            return loop
+
+        loop = loop_ref()
+
+        if loop is None:
+
+            raise RuntimeError("the event loop to which the timer wheel was bound no longer exists")
+
+        return loop
+
+    def _insert(
+        self,
+        entry: TimerEntry,
+        deadline_ns: int,
+        slack_ns: int = 0,
+    ):
+
+        loop = self._loop()
+
+        if 0 == self._len and not self._due:
+
+            # when idle, catch up with the loop so that new entries are
+            # placed relative to the present rather than a stale past
+
+            self._elapsed = max(self._elapsed, int(loop.time() * 1_000_000_000) // self._resolution_ns)
+
+        slack_ns = max(slack_ns, self._slack_ns)
+
+        if slack_ns:
+
+            deadline_ns = slack_deadline(deadline_ns, slack_ns)
+
+        tick = -(-deadline_ns // self._resolution_ns)
+
+        expiration = self._place(entry, tick)
+
+        if self._armed_tick is None or expiration < self._armed_tick:
+
+            self._arm(loop, expiration)
+
+    def _place(
+        self,
+        entry: TimerEntry,
+        tick: int,
+    ) -> int:
+        """
+        Places `entry` in the appropriate slot (or the due list) and returns
+        the tick at which that slot expires.
+        """
+
+        elapsed = self._elapsed
+
+        self._len += 1
+
+        entry._wheel_tick = tick
+
+        if tick <= elapsed:
+
+            self._due[entry] = None
+
+            entry._wheel_slot = self._due
+            entry._wheel_level = -1
+            entry._wheel_index = -1
+
+            return elapsed
+
+        if tick - elapsed > _MAX_TICKS:
+
+            tick = elapsed + _MAX_TICKS
+
+        level = (((elapsed ^ tick) | _SLOT_MASK).bit_length() - 1) // _LEVEL_BITS
+
+        if level >= _NUM_LEVELS:
+
+            level = _NUM_LEVELS - 1
+
+        shift = level * _LEVEL_BITS
+        index = (tick >> shift) & _SLOT_MASK
+        slot = self._levels[level][index]
+
+        slot[entry] = None
+
+        self._occupied[level] |= 1 << index
+
+        entry._wheel_slot = slot
+        entry._wheel_level = level
+        entry._wheel_index = index
+
+        return max(elapsed + 1, (tick >> shift) << shift)
+
+    def _remove(
+        self,
+        entry: TimerEntry,
+    ) -> bool:
+
+        slot = entry._wheel_slot
+
+        if slot is None:
+
+            return False
+
+        del slot[entry]
+
+        entry._wheel_slot = None
+
+        self._len -= 1
+
+        level = entry._wheel_level
+
+        if not slot and level >= 0 and self._levels[level][entry._wheel_index] is slot:
+
+            self._occupied[level] &= ~(1 << entry._wheel_index)
+
+        if 0 == self._len and self._handle is not None:
+
+            self._handle.cancel()
+
+            self._handle = None
+            self._armed_tick = None
+
+        return True
+
+    def _next_expiration(self) -> tuple[int, int, int] | None:
+        """
+        Determines the `(level, index, tick)` of the next slot to expire, or
+        `None` if the wheel is empty.
+        """
+
+        elapsed = self._elapsed
+
+        for level in range(_NUM_LEVELS):
+
+            occupied = self._occupied[level]
+
+            if occupied:
+
+                shift = level * _LEVEL_BITS
+                slot_range = 1 << shift
+                level_range = slot_range << _LEVEL_BITS
+
+                now_index = (elapsed >> shift) & _SLOT_MASK
+                rotated = ((occupied >> now_index) | (occupied << (_LEVEL_MULT - now_index))) & _OCCUPIED_MASK
+                index = (now_index + (rotated & -rotated).bit_length() - 1) & _SLOT_MASK
+
+                tick = (elapsed & ~(level_range - 1)) + index * slot_range
+
+                if tick <= elapsed:
+
+                    # only possible at the top level, for entries beyond
+                    # the span of the wheel
+
+                    tick += level_range
+
+                return (level, index, tick)
+
+        return None
+
+    def _arm(
+        self,
+        loop,
+        tick: int,
+    ):
+
+        if self._handle is not None:
+
+            self._handle.cancel()
+
+        self._armed_tick = tick
+        self._handle = loop.call_at(tick * self._resolution_ns / 1_000_000_000, self._on_timer)
+
+    def _on_timer(self):
+
+        self._handle = None
+
+        armed_tick = self._armed_tick
+
+        self._armed_tick = None
+
+        loop = self._loop()
+
+        # the loop may run a timer marginally before its due time, so never
+        # treat the present as earlier than the tick for which we armed
+
+        now_tick = max(armed_tick, int(loop.time() * 1_000_000_000) // self._resolution_ns)
+
+        self._fired = 0
+
+        self._run_due(loop)
+
+        while True:
+
+            expiration = self._next_expiration()
+
+            if expiration is None:
+
+                break
+
+            level, index, tick = expiration
+
+            if tick > now_tick:
+
+                break
+
+            self._expire_slot(loop, level, index, tick)
+
+            self._run_due(loop)
+
+        if self._elapsed < now_tick:
+
+            self._elapsed = now_tick
+
+        if self._fired:
+
+            self._wakeups += 1
+            self._coalesced += self._fired - 1
+
+        # callbacks may have (re-)armed the timer while earlier entries were
+        # still in the wheel, so always re-arm for the true next expiration
+
+        expiration = self._next_expiration()
+
+        if expiration is None:
+
+            if self._handle is not None:
+
+                self._handle.cancel()
+
+                self._handle = None
+                self._armed_tick = None
+        elif expiration[2] != self._armed_tick:
+
+            self._arm(loop, expiration[2])
+
+    def _expire_slot(
+        self,
+        loop,
+        level: int,
+        index: int,
+        tick: int,
+    ):
+
+        slots = self._levels[level]
+        slot = slots[index]
+
+        slots[index] = {}
+
+        self._occupied[level] &= ~(1 << index)
+        self._elapsed = tick
+
+        # iterate over a snapshot, since callbacks may remove other entries
+        # of the same slot
+
+        for entry in list(slot):
+
+            if entry._wheel_slot is not slot:
+
+                continue
+
+            self._len -= 1
+
+            entry._wheel_slot = None
+
+            if entry._wheel_tick <= tick:
+
+                self._fire(loop, entry)
+            else:
+
+                # cascade to a lower level
+
+                self._place(entry, entry._wheel_tick)
+
+    def _run_due(self, loop):
+
+        while self._due:
+
+            due = self._due
+
+            self._due = {}
+
+            for entry in list(due):
+
+                if entry._wheel_slot is not due:
+
+                    continue
+
+                self._len -= 1
+
+                entry._wheel_slot = None
+
+                self._fire(loop, entry)
+
+    def _fire(
+        self,
+        loop,
+        entry: TimerEntry,
+    ):
+
+        self._fired += 1
+
+        try:
+
+            entry._fire()
+        except (SystemExit, KeyboardInterrupt):
+
+            raise
+        except BaseException as exc:
+
+            loop.call_exception_handler(
+                {
+                    'message': f"exception in timer-wheel callback {entry!r}",
+                    'exception': exc,
+                    'handle': entry,
+                }
+            )
+
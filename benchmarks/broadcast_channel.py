@@ -0,0 +1,181 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/broadcast_channel.py
+#
+# Purpose:  Measures the throughput and memory of fanning messages out to
+#           many receivers, with an `asyncio.Queue` per receiver and with
+#           `broadcast.channel()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/broadcast_channel.py [ <receivers> [ <messages> ] ]
+
+Throughput: one producer sends the given number of messages, yielding to
+the loop after each 64, to the given number of receivers, each of which
+receives every message.
+
+Memory: the memory (as measured by `tracemalloc`) held for 1,024 messages
+sent and not yet received by any receiver.
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from asynkio.sync import (
+    broadcast,
+)
+
+CAPACITY = 1_024
+BURST = 64
+
+
+async def _queues_throughput(
+    receivers: int,
+    messages: int,
+) -> float:
+
+    queues = [asyncio.Queue() for _ in range(receivers)]
+
+    async def consumer(queue):
+
+        get = queue.get
+
+        for _ in range(messages):
+
+            await get()
+
+    tasks = [asyncio.create_task(consumer(queue)) for queue in queues]
+
+    await asyncio.sleep(0)
+
+    t_0 = time.perf_counter()
+
+    for i in range(messages):
+
+        for queue in queues:
+
+            queue.put_nowait(i)
+
+        if 0 == (i + 1) % BURST:
+
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+
+    return time.perf_counter() - t_0
+
+
+async def _broadcast_throughput(
+    receivers: int,
+    messages: int,
+) -> float:
+
+    tx, rx = broadcast.channel(CAPACITY)
+
+    async def consumer(receiver):
+
+        recv = receiver.recv
+
+        for _ in range(messages):
+
+            await recv()
+
+    tasks = [asyncio.create_task(consumer(rx))]
+    tasks += [asyncio.create_task(consumer(tx.subscribe())) for _ in range(receivers - 1)]
+
+    await asyncio.sleep(0)
+
+    t_0 = time.perf_counter()
+
+    send = tx.send
+
+    for i in range(messages):
+
+        send(i)
+
+        if 0 == (i + 1) % BURST:
+
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+
+    return time.perf_counter() - t_0
+
+
+def _queues_memory(receivers: int) -> int:
+
+    tracemalloc.start()
+
+    queues = [asyncio.Queue() for _ in range(receivers)]
+    base = tracemalloc.get_traced_memory()[0]
+
+    for i in range(CAPACITY):
+
+        for queue in queues:
+
+            queue.put_nowait(i)
+
+    used = tracemalloc.get_traced_memory()[0] - base
+
+    tracemalloc.stop()
+
+    return used
+
+
+def _broadcast_memory(receivers: int) -> int:
+
+    tracemalloc.start()
+
+    tx, rx = broadcast.channel(CAPACITY)
+    others = [tx.subscribe() for _ in range(receivers - 1)]  # noqa: F841
+    base = tracemalloc.get_traced_memory()[0]
+
+    for i in range(CAPACITY):
+
+        tx.send(i)
+
+    used = tracemalloc.get_traced_memory()[0] - base
+
+    tracemalloc.stop()
+
+    return used
+
+
+def main(
+    receivers: int,
+    messages: int,
+):
+
+    print(f"{'mode':<22}  {'time (s)':>8}  {'deliveries/s':>14}  {'memory (KiB)':>12}")
+
+    for label, throughput, memory in (
+        ('asyncio.Queue each', _queues_throughput, _queues_memory),
+        ('broadcast', _broadcast_throughput, _broadcast_memory),
+    ):
+
+        secs = asyncio.run(throughput(receivers, messages))
+        used = memory(receivers)
+
+        print(f"{label:<22}  {secs:>8.3f}  {receivers * messages / secs:>14,.0f}  {used / 1_024:>12,.1f}")
+
+
+if __name__ == "__main__":
+
+    receivers = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    main(receivers, messages)
+
@@ -0,0 +1,156 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/cache_ttl.py
+#
+# Purpose:  Measures the time and memory taken to insert, look up, and
+#           expire many entries with `TTLCache`, and with a `dict` whose
+#           entries are each expired by a `loop.call_later()` timer.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/cache_ttl.py [ <count> ]
+
+e.g.
+
+    python benchmarks/cache_ttl.py 1000000
+
+The entries are given a TTL of one second; the expiry time is the CPU time
+spent while waiting for them all to expire.
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from asynkio.cache import (
+    TTLCache,
+)
+from asynkio.time import (
+    Duration,
+)
+
+TTL = Duration.from_secs(1)
+SWEEP_PERIOD = Duration.from_millis(100)
+
+
+def _timings(timings: dict) -> str:
+
+    return "  ".join(f"{name}: {Duration.from_nanos(int(secs * 1_000_000_000))}" for name, secs in timings.items())
+
+
+class _TimerPerKeyCache:
+
+    def __init__(self, ttl_s: float):
+
+        self.loop = asyncio.get_running_loop()
+        self.ttl_s = ttl_s
+        self.data = {}
+
+    def set(self, key, value):
+
+        entry = self.data.get(key)
+
+        if entry is not None:
+
+            entry[1].cancel()
+
+        self.data[key] = (value, self.loop.call_later(self.ttl_s, self.data.pop, key, None))
+
+    def get(self, key, default=None):
+
+        entry = self.data.get(key)
+
+        return default if entry is None else entry[0]
+
+    def __len__(self):
+
+        return len(self.data)
+
+
+async def _run(
+    count: int,
+    make_cache,
+) -> dict:
+
+    cache = make_cache()
+    timings = {}
+
+    t_0 = time.perf_counter()
+
+    for i in range(count):
+
+        cache.set(i, i)
+
+    t_1 = time.perf_counter()
+
+    for i in range(count):
+
+        cache.get(i)
+
+    t_2 = time.perf_counter()
+
+    timings['set'] = t_1 - t_0
+    timings['get'] = t_2 - t_1
+
+    cpu_0 = time.process_time()
+
+    await asyncio.sleep(TTL.as_secs_f() + 3 * SWEEP_PERIOD.as_secs_f())
+
+    timings['expiry (CPU)'] = time.process_time() - cpu_0
+
+    assert 0 == len(cache), f"{len(cache)} entries remain"
+
+    return timings
+
+
+async def _memory(
+    count: int,
+    make_cache,
+) -> int:
+
+    tracemalloc.start()
+
+    cache = make_cache()
+
+    for i in range(count):
+
+        cache.set(i, None)
+
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    del cache
+
+    return size
+
+
+def main(count: int):
+
+    for label, make_cache in (
+        ('TTLCache', lambda: TTLCache(TTL, sweep_period=SWEEP_PERIOD)),
+        ('call_later', lambda: _TimerPerKeyCache(TTL.as_secs_f())),
+    ):
+
+        timings = asyncio.run(_run(count, make_cache))
+        size = asyncio.run(_memory(count, make_cache))
+
+        print(f"{label:<10}  {_timings(timings)}  memory: {size / count:.0f} B/entry")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+
@@ -0,0 +1,78 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/clock_sources.py
+#
+# Purpose:  Measures the per-call cost of each `Clock` implementation, and
+#           of `Instant.now()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/clock_sources.py [ <iterations> ]
+"""
+
+import asyncio
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Instant,
+    LoopClock,
+    MonotonicClock,
+    PerfCounterClock,
+    WallClock,
+)
+
+
+def _measure(
+    f,
+    iterations: int,
+) -> Duration:
+
+    t0 = time.perf_counter_ns()
+
+    for _ in range(iterations):
+
+        f()
+
+    t1 = time.perf_counter_ns()
+
+    return Duration.from_nanos((t1 - t0) // iterations)
+
+
+async def _main(iterations: int):
+
+    loop = asyncio.get_running_loop()
+
+    cases = [
+        ('MonotonicClock().now_ns', MonotonicClock().now_ns),
+        ('PerfCounterClock().now_ns', PerfCounterClock().now_ns),
+        ('WallClock().now_ns', WallClock().now_ns),
+        ('LoopClock(loop).now_ns', LoopClock(loop).now_ns),
+        ('LoopClock().now_ns', LoopClock().now_ns),
+        ('Instant.now()', Instant.now),
+        ('Instant.now(MonotonicClock())', lambda clock=MonotonicClock(): Instant.now(clock)),
+    ]
+
+    print(f"{'source':<32}  {'per call':>10}")
+
+    for label, f in cases:
+
+        print(f"{label:<32}  {str(_measure(f, iterations)):>10}")
+
+
+if __name__ == "__main__":
+
+    asyncio.run(_main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
+
@@ -0,0 +1,210 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/delay_queue.py
+#
+# Purpose:  Measures the time and memory taken to insert, reset, remove,
+#           and expire many keyed items with a `DelayQueue`, and with one
+#           `loop.call_at()` timer per key.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/delay_queue.py [ <count> ]
+
+e.g.
+
+    python benchmarks/delay_queue.py 1000000
+
+Items expire over one second; a tenth of them are removed, and all are
+reset once before they expire.
+"""
+
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+
+from asynkio.time import (
+    DelayQueue,
+    Duration,
+)
+
+SPAN_NS = 1_000_000_000
+
+
+def _timings(timings: dict) -> str:
+
+    return "  ".join(f"{name}: {Duration.from_nanos(int(secs * 1_000_000_000))}" for name, secs in timings.items())
+
+
+async def _run_delay_queue(offsets: list[int]) -> dict:
+
+    count = len(offsets)
+    queue = DelayQueue()
+    timings = {}
+
+    t_0 = time.perf_counter()
+
+    keys = [queue.insert(i, offset) for i, offset in enumerate(offsets)]
+
+    t_1 = time.perf_counter()
+
+    for key, offset in zip(keys, reversed(offsets)):
+
+        queue.reset(key, offset)
+
+    t_2 = time.perf_counter()
+
+    for key in keys[::10]:
+
+        queue.remove(key)
+
+    t_3 = time.perf_counter()
+
+    expired = 0
+
+    async for _ in queue:
+
+        expired += 1
+
+        if 0 == len(queue):
+
+            break
+
+    t_4 = time.perf_counter()
+
+    timings['insert'] = t_1 - t_0
+    timings['reset'] = t_2 - t_1
+    timings['remove'] = t_3 - t_2
+    timings['expire'] = t_4 - t_3
+
+    assert count - len(keys[::10]) == expired
+
+    return timings
+
+
+async def _run_call_at(offsets: list[int]) -> dict:
+
+    loop = asyncio.get_running_loop()
+    count = len(offsets)
+    done = loop.create_future()
+    values = [None] * count
+    remaining = [count - len(range(0, count, 10))]
+    timings = {}
+
+    def expire(i):
+
+        values[i] = None
+
+        remaining[0] -= 1
+
+        if 0 == remaining[0]:
+
+            done.set_result(None)
+
+    t_0 = time.perf_counter()
+
+    now = loop.time()
+    handles = [loop.call_at(now + offset / 1e9, expire, i) for i, offset in enumerate(offsets)]
+
+    t_1 = time.perf_counter()
+
+    now = loop.time()
+
+    for i, offset in enumerate(reversed(offsets)):
+
+        handles[i].cancel()
+        handles[i] = loop.call_at(now + offset / 1e9, expire, i)
+
+    t_2 = time.perf_counter()
+
+    for i in range(0, count, 10):
+
+        handles[i].cancel()
+
+    t_3 = time.perf_counter()
+
+    await done
+
+    t_4 = time.perf_counter()
+
+    timings['insert'] = t_1 - t_0
+    timings['reset'] = t_2 - t_1
+    timings['remove'] = t_3 - t_2
+    timings['expire'] = t_4 - t_3
+
+    return timings
+
+
+def _memory_delay_queue(offsets: list[int]) -> int:
+
+    tracemalloc.start()
+
+    queue = DelayQueue()
+    keys = [queue.insert(i, offset) for i, offset in enumerate(offsets)]
+
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    del keys, queue
+
+    return size
+
+
+def _memory_call_at(offsets: list[int]) -> int:
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        tracemalloc.start()
+
+        now = loop.time()
+        handles = [loop.call_at(now + offset / 1e9, int, i) for i, offset in enumerate(offsets)]
+
+        size, _ = tracemalloc.get_traced_memory()
+
+        tracemalloc.stop()
+
+        for handle in handles:
+
+            handle.cancel()
+
+        return size
+
+    return asyncio.run(main())
+
+
+def main(count: int):
+
+    rng = random.Random(count)
+
+    offsets = [rng.randrange(SPAN_NS // 10, SPAN_NS) for _ in range(count)]
+
+    for label, run, memory in (
+        ('DelayQueue', _run_delay_queue, _memory_delay_queue),
+        ('call_at', _run_call_at, _memory_call_at),
+    ):
+
+        timings = asyncio.run(run(offsets))
+        size = memory(offsets)
+
+        print(f"{label:<10}  {_timings(timings)}  memory: {size / count:.0f} B/item")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+
@@ -0,0 +1,80 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/instant_format.py
+#
+# Purpose:  Measures the cost of formatting `Instant`s as ISO-8601, by way
+#           of `datetime` (the former implementation) and by way of
+#           `Instant.isoformat()` and `Instant.format_many()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/instant_format.py [ <count> ]
+
+The instants are a millisecond apart, as for timestamps of log lines.
+"""
+
+from datetime import (
+    UTC,
+    datetime,
+)
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Instant,
+    InstantArray,
+)
+
+
+def _via_datetime(t_ns: int) -> str:
+
+    return datetime.fromtimestamp(t_ns / 1_000_000_000.0, tz=UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _measure(
+    f,
+    count: int,
+) -> Duration:
+
+    t0 = time.perf_counter_ns()
+
+    f()
+
+    t1 = time.perf_counter_ns()
+
+    return Duration.from_nanos((t1 - t0) // count)
+
+
+def main(count: int):
+
+    t_ns = time.time_ns()
+    values = [t_ns + i * 1_000_000 for i in range(count)]
+    instants = [Instant(v) for v in values]
+    array = InstantArray(values)
+
+    for label, f in (
+        ('datetime.strftime', lambda: [_via_datetime(v) for v in values]),
+        ('str(Instant)', lambda: [str(instant) for instant in instants]),
+        ('Instant.isoformat(9)', lambda: [instant.isoformat(9) for instant in instants]),
+        ('Instant.format_many()', lambda: Instant.format_many(array)),
+    ):
+
+        print(f"{label:<24}  {str(_measure(f, count)):>10} per instant")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+
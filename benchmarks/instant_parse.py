@@ -0,0 +1,82 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/instant_parse.py
+#
+# Purpose:  Measures the rate at which ISO-8601 timestamps are parsed into
+#           nanoseconds, by way of `datetime.fromisoformat()` and by way of
+#           `Instant.parse()` and `Instant.parse_many()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/instant_parse.py [ <count> ]
+
+The timestamps are a millisecond apart, as for timestamps of log lines, in
+the form produced by `str(Instant)` and, for comparison, with an offset.
+"""
+
+from datetime import (
+    datetime,
+)
+import sys
+import time
+
+from asynkio.time import (
+    Instant,
+)
+
+
+def _via_datetime(timestamp: str) -> int:
+
+    # lossy: `datetime` has microsecond precision
+
+    d = datetime.fromisoformat(timestamp)
+
+    return int(d.timestamp()) * 1_000_000_000 + d.microsecond * 1_000
+
+
+def _measure(
+    f,
+    count: int,
+) -> float:
+
+    t0 = time.perf_counter()
+
+    f()
+
+    t1 = time.perf_counter()
+
+    return count / (t1 - t0)
+
+
+def main(count: int):
+
+    t_ns = time.time_ns()
+    utc = Instant.format_many([t_ns + i * 1_000_000 for i in range(count)], 9)
+    offset = [timestamp[:-1] + "+10:00" for timestamp in utc]
+
+    for label, f in (
+        ("datetime.fromisoformat", lambda: [_via_datetime(timestamp) for timestamp in utc]),
+        ("Instant.parse", lambda: [Instant.parse(timestamp) for timestamp in utc]),
+        ("Instant.parse_many", lambda: Instant.parse_many(utc)),
+        ("datetime (+10:00)", lambda: [_via_datetime(timestamp) for timestamp in offset]),
+        ("Instant.parse_many (+10:00)", lambda: Instant.parse_many(offset)),
+    ):
+
+        print(f"{label:<28}  {_measure(f, count):>14,.0f} lines/s")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+
@@ -0,0 +1,94 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/interval_precision.py
+#
+# Purpose:  Measures the tick lateness (jitter) of a short-period
+#           `Interval`, and the CPU time it spends, in its default mode and
+#           in precision mode (yielding, and spinning).
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/interval_precision.py [ <period> [ <guard> [ <n> ] ] ]
+
+The period and the precision guard are in microseconds, and `n` is the
+number of ticks measured.
+
+Lateness is the time from the instant for which each tick was scheduled
+to the resumption of the iterating task.
+"""
+
+import asyncio
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Interval,
+)
+
+
+async def _run(
+    ticks: int,
+    **kwargs,
+) -> tuple[list[int], float, Duration]:
+
+    interval = Interval(negative_bias=0, **kwargs)
+
+    lateness = []
+
+    cpu_0 = time.process_time()
+
+    async for instant in interval.take(ticks):
+
+        lateness.append(time.monotonic_ns() - int(instant))
+
+    cpu_1 = time.process_time()
+
+    return sorted(lateness), cpu_1 - cpu_0, interval.precision_cpu()
+
+
+def main(
+    period_us: int,
+    guard_us: int,
+    ticks: int,
+):
+
+    period = Duration.from_micros(period_us)
+    guard = Duration.from_micros(guard_us)
+
+    print(f"{'mode':<10}  {'p50':>10}  {'p99':>10}  {'max':>10}  {'CPU (s)':>8}  {'guard CPU':>10}")
+
+    for label, kwargs in (
+        ('default', {}),
+        ('yield', {'precision': guard}),
+        ('spin', {'precision': guard, 'spin': True}),
+    ):
+
+        lateness, cpu, guard_cpu = asyncio.run(_run(ticks, period=period, **kwargs))
+
+        p50 = Duration.from_nanos(lateness[len(lateness) // 2])
+        p99 = Duration.from_nanos(lateness[len(lateness) * 99 // 100])
+        p100 = Duration.from_nanos(lateness[-1])
+
+        print(f"{label:<10}  {str(p50):>10}  {str(p99):>10}  {str(p100):>10}  {cpu:>8.3f}  {str(guard_cpu):>10}")
+
+
+if __name__ == "__main__":
+
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1_000,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 1_000,
+    )
+
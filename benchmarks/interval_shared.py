@@ -0,0 +1,117 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/interval_shared.py
+#
+# Purpose:  Measures the CPU time per tick of many tasks ticking at the
+#           same period, each with its own `Interval` or each subscribed
+#           to one `SharedInterval`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/interval_shared.py [ <count> ... ]
+
+e.g.
+
+    python benchmarks/interval_shared.py 1000 10000
+"""
+
+import asyncio
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Interval,
+    SharedInterval,
+)
+
+PERIOD = Duration.from_millis(100)
+RUN_SECS = 2.0
+
+
+async def _ticker(
+    interval: Interval,
+    counts: list,
+    index: int,
+):
+
+    while True:
+
+        await interval
+
+        counts[index] += 1
+
+
+async def _run(
+    count: int,
+    shared: bool,
+) -> tuple[int, float, int | None]:
+
+    counts = [0] * count
+
+    if shared:
+
+        source = SharedInterval(PERIOD, negative_bias=0)
+        intervals = [source.subscribe() for _ in range(count)]
+    else:
+
+        source = None
+        intervals = [Interval(PERIOD, negative_bias=0) for _ in range(count)]
+
+    tasks = [asyncio.create_task(_ticker(interval, counts, i)) for i, interval in enumerate(intervals)]
+
+    # let all tickers settle into their schedules before measuring
+
+    await asyncio.sleep(PERIOD.as_secs_f() * 2)
+
+    ticks_0 = sum(counts)
+    wakeups_0 = source.wakeups() if source else None
+    cpu_0 = time.process_time()
+
+    await asyncio.sleep(RUN_SECS)
+
+    cpu_1 = time.process_time()
+    ticks_1 = sum(counts)
+    wakeups = source.wakeups() - wakeups_0 if source else None
+
+    for task in tasks:
+
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return ticks_1 - ticks_0, cpu_1 - cpu_0, wakeups
+
+
+def main(counts: list[int]):
+
+    print(f"{'intervals':>10}  {'driver':<14}  {'ticks':>10}  {'timers':>10}  {'CPU (s)':>8}  {'CPU/tick':>10}")
+
+    for count in counts:
+
+        for shared in (False, True):
+
+            ticks, cpu, wakeups = asyncio.run(_run(count, shared))
+
+            driver = 'SharedInterval' if shared else 'Interval'
+            timers = ticks if wakeups is None else wakeups
+            per_tick = Duration.from_nanos(int(cpu * 1_000_000_000 / ticks)) if ticks else None
+
+            print(f"{count:>10,}  {driver:<14}  {ticks:>10,}  {timers:>10,}  {cpu:>8.3f}  {str(per_tick):>10}")
+
+
+if __name__ == "__main__":
+
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000])
+
@@ -0,0 +1,126 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/interval_slack.py
+#
+# Purpose:  Measures the number of event-loop wake-ups (i.e. selector
+#           polls) for many `Interval`s with nearby periods, with and
+#           without timer slack.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/interval_slack.py [ <count> [ <slack-us> ... ] ]
+
+e.g.
+
+    python benchmarks/interval_slack.py 100 0 100 1000
+"""
+
+import asyncio
+import random
+import sys
+
+from asynkio.time import (
+    Duration,
+    Interval,
+    MissedTickBehaviour,
+    TimerCoalescer,
+)
+
+PERIOD = Duration.from_millis(50)
+RUN_SECS = 2.0
+
+
+async def _ticker(
+    interval: Interval,
+    counts: list,
+    index: int,
+):
+
+    async for _ in interval:
+
+        counts[index] += 1
+
+
+async def _run(
+    count: int,
+    slack_ns: int,
+) -> tuple[int, int, int]:
+
+    loop = asyncio.get_running_loop()
+    rng = random.Random(count)
+
+    # periods of 50ms +/- 50us, as from independently-configured services
+
+    counts = [0] * count
+
+    tasks = [
+        asyncio.create_task(
+            _ticker(
+                Interval(
+                    int(PERIOD) + rng.randrange(-50_000, 50_000),
+                    missed_tick_behaviour=MissedTickBehaviour.SKIP,
+                    negative_bias=0,
+                    slack=slack_ns,
+                ),
+                counts,
+                i,
+            )
+        )
+        for i in range(count)
+    ]
+
+    selector = loop._selector
+    select = selector.select
+    polls = [0]
+
+    def counting_select(*args, **kwargs):
+
+        polls[0] += 1
+
+        return select(*args, **kwargs)
+
+    selector.select = counting_select
+
+    await asyncio.sleep(RUN_SECS)
+
+    for task in tasks:
+
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return sum(counts), polls[0], TimerCoalescer.for_loop().coalesced_wakeups()
+
+
+def main(
+    count: int,
+    slacks_us: list[int],
+):
+
+    print(f"{'intervals':>10}  {'slack':>8}  {'ticks':>8}  {'wake-ups':>9}  {'coalesced':>9}")
+
+    for slack_us in slacks_us:
+
+        ticks, polls, coalesced = asyncio.run(_run(count, slack_us * 1_000))
+
+        print(f"{count:>10,}  {str(Duration.from_micros(slack_us)):>8}  {ticks:>8,}  {polls:>9,}  {coalesced:>9,}")
+
+
+if __name__ == "__main__":
+
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+        [int(arg) for arg in sys.argv[2:]] or [0, 100, 1_000],
+    )
+
@@ -0,0 +1,206 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/interval_tick.py
+#
+# Purpose:  Measures the tick rate and per-tick memory allocation of
+#           `Interval`, compared with the previous implementation (which
+#           built `Instant`/`Duration` objects and an `asyncio.sleep()`
+#           coroutine on every tick).
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/interval_tick.py [ <ticks> ]
+
+Each tick uses a 1ns period, so the rate is bound by the cost of the tick
+path rather than by waiting. Memory is measured with `tracemalloc`:
+
+- "in-flight" is the number of memory blocks (and bytes) allocated while a
+  tick is pending, i.e. the objects created for each tick;
+- "net B/tick" is the growth in traced memory over the run of ticks,
+  divided by the number of ticks (i.e. memory retained per tick).
+
+The `TimerWheel` case is excluded from the rate measurement, since its
+tick rate is bound by the wheel's (1ms) resolution.
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from asynkio.time import (
+    Duration,
+    Instant,
+    Interval,
+    MissedTickBehaviour,
+)
+
+
+class _PreviousInterval:
+    """
+    The tick path of `Interval` prior to the use of `loop.call_at()`.
+    """
+
+    def __init__(self, period_ns: int):
+
+        self._period_ns = period_ns
+        self._negative_bias = 0
+        self._reference_instant = Instant.now()
+        self._recent_instant = None
+        self._event_count = 0
+
+    def __await__(self):
+
+        self._event_count += 1
+
+        now = Instant.now()
+
+        duration: Duration = now - self._reference_instant
+        duration_ns = duration.as_nanos()
+
+        q, r = divmod(duration_ns, self._period_ns)
+
+        self._recent_instant = now
+
+        return asyncio.sleep((self._period_ns - self._negative_bias) / 1_000_000_000).__await__()
+
+
+async def _tick(
+    interval,
+    ticks: int,
+):
+
+    for _ in range(ticks):
+
+        await interval
+
+
+async def _measure_rate(
+    make_interval,
+    ticks: int,
+) -> tuple[float, float]:
+
+    # warm up (and let any lazily-created state settle)
+
+    await _tick(make_interval(), 1_000)
+
+    interval = make_interval()
+
+    t0 = time.perf_counter_ns()
+
+    await _tick(interval, ticks)
+
+    t1 = time.perf_counter_ns()
+
+    tracemalloc.start()
+
+    base, _ = tracemalloc.get_traced_memory()
+
+    await _tick(interval, ticks)
+
+    current, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return ticks * 1_000_000_000 / (t1 - t0), (current - base) / ticks
+
+
+async def _measure_in_flight(
+    interval,
+    repeats: int,
+) -> tuple[float, float]:
+
+    loop = asyncio.get_running_loop()
+
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ]
+
+    snapshots = []
+
+    def take_snapshot():
+
+        snapshots.append(tracemalloc.take_snapshot().filter_traces(filters))
+
+    blocks = 0
+    size = 0
+
+    tracemalloc.start()
+
+    # the first round is a warm-up, to exclude lazily-created state (such
+    # as the loop's shared `TimerWheel`)
+
+    for i in range(1 + repeats):
+
+        snapshots.clear()
+
+        # the second snapshot is taken once the tick is pending
+
+        loop.call_soon(take_snapshot)
+
+        take_snapshot()
+
+        await interval
+
+        if i:
+
+            for stat in snapshots[1].compare_to(snapshots[0], 'filename'):
+
+                blocks += stat.count_diff
+                size += stat.size_diff
+
+    tracemalloc.stop()
+
+    return blocks / repeats, size / repeats
+
+
+def main(ticks: int):
+
+    cases = [
+        ('previous (asyncio.sleep)', _PreviousInterval),
+        ('Interval (call_at)', lambda period: Interval(period, MissedTickBehaviour.DELAY, negative_bias=0)),
+        (
+            'Interval (stats)',
+            lambda period: Interval(period, MissedTickBehaviour.DELAY, negative_bias=0, stats=True),
+        ),
+        (
+            'Interval (TimerWheel)',
+            lambda period: Interval(period, MissedTickBehaviour.DELAY, negative_bias=0, wheel=True),
+        ),
+    ]
+
+    print(f"{'implementation':<26}  {'ticks/s':>10}  {'net B/tick':>10}  {'in-flight':>18}")
+
+    for label, make in cases:
+
+        if 'TimerWheel' in label:
+
+            rate, net = None, None
+        else:
+
+            rate, net = asyncio.run(_measure_rate(lambda make=make: make(1), ticks))
+
+        blocks, size = asyncio.run(_measure_in_flight(make(1_000_000), 20))
+
+        rate_s = '-' if rate is None else f"{rate:,.0f}"
+        net_s = '-' if net is None else f"{net:.2f}"
+        in_flight_s = f"{blocks:.1f} blocks, {size:,.0f}B"
+
+        print(f"{label:<26}  {rate_s:>10}  {net_s:>10}  {in_flight_s:>18}")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
+
@@ -0,0 +1,115 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/interval_timerfd.py
+#
+# Purpose:  Measures the tick lateness (jitter) and CPU time of a periodic
+#           loop driven by `asyncio.sleep()`, by `Interval` with loop
+#           timers, and by `Interval` with the `timerfd` backend.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/interval_timerfd.py [ <period-us> [ <ticks> ] ]
+
+Lateness is the time from the instant for which each tick was scheduled
+to the resumption of the iterating task. The `timerfd` backend requires
+Linux and Python 3.13+; elsewhere that case falls back to loop timers, as
+is reported.
+"""
+
+import asyncio
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Interval,
+)
+
+
+async def _run_asyncio_sleep(
+    period_ns: int,
+    ticks: int,
+) -> list[int]:
+
+    lateness = []
+
+    deadline_ns = time.monotonic_ns()
+
+    for _ in range(ticks):
+
+        deadline_ns += period_ns
+
+        await asyncio.sleep(max(0, deadline_ns - time.monotonic_ns()) / 1_000_000_000)
+
+        lateness.append(time.monotonic_ns() - deadline_ns)
+
+    return lateness
+
+
+async def _run_interval(
+    period_ns: int,
+    ticks: int,
+    timerfd: bool,
+) -> list[int]:
+
+    interval = Interval(period_ns, negative_bias=0, timerfd=timerfd)
+
+    if timerfd and not interval.timerfd():
+
+        print("(timerfd is not available: falling back to loop timers)")
+
+    lateness = []
+
+    async for instant in interval.take(ticks):
+
+        lateness.append(time.monotonic_ns() - int(instant))
+
+    return lateness
+
+
+def main(
+    period_us: int,
+    ticks: int,
+):
+
+    period_ns = period_us * 1_000
+
+    print(f"{'mode':<14}  {'p50':>10}  {'p99':>10}  {'max':>10}  {'CPU (s)':>8}")
+
+    for label, coro in (
+        ('asyncio.sleep', lambda: _run_asyncio_sleep(period_ns, ticks)),
+        ('call_at', lambda: _run_interval(period_ns, ticks, False)),
+        ('timerfd', lambda: _run_interval(period_ns, ticks, True)),
+    ):
+
+        cpu_0 = time.process_time()
+
+        lateness = sorted(asyncio.run(coro()))
+
+        cpu_1 = time.process_time()
+
+        p50 = Duration.from_nanos(lateness[len(lateness) // 2])
+        p99 = Duration.from_nanos(lateness[len(lateness) * 99 // 100])
+        p100 = Duration.from_nanos(lateness[-1])
+
+        print(f"{label:<14}  {str(p50):>10}  {str(p99):>10}  {str(p100):>10}  {cpu_1 - cpu_0:>8.3f}")
+
+
+if __name__ == "__main__":
+
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2_000,
+    )
+
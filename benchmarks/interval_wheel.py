@@ -0,0 +1,179 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/interval_wheel.py
+#
+# Purpose:  Compares the CPU cost per tick of many concurrent periodic
+#           tickers driven by `asyncio.sleep()` (as was `Interval`
+#           originally), by independent `loop.call_at()` timers, and by the
+#           shared `TimerWheel`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/interval_wheel.py [ <count> ... ]
+
+e.g.
+
+    python benchmarks/interval_wheel.py 10000 100000
+
+The baseline (the `asyncio.sleep` rows) is as `Interval` was originally:
+each ticker awaits `asyncio.sleep()` for the remainder of its period.
+Without a wheel, each `Interval` schedules its own timer with
+`loop.call_at()` (the `loop.call_at` rows); with one, all are driven by
+the loop's `TimerWheel`. The `vs sleep` column is the CPU per tick
+relative to the baseline.
+
+Against the baseline, both drivers cut the CPU per tick: at 10,000
+intervals e.g. 21.40µs with `asyncio.sleep()`, 14.16µs with
+`loop.call_at()` (0.66x), and 15.13µs with the wheel (0.71x) - between
+which two the difference is within noise. The wheel pays only when the
+loop's timer heap becomes the bottleneck: at 100,000 intervals - where no
+driver keeps up with the 500ms period - it delivered the most ticks
+(212,138 in 3s, versus 156,985 with `loop.call_at()` and 93,937 with
+`asyncio.sleep()`) at the least CPU per tick (21.34µs, 0.33x, versus
+27.61µs, 0.43x, and 64.73µs).
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Interval,
+    MissedTickBehaviour,
+)
+
+PERIOD = Duration.from_millis(500)
+RUN_SECS = 3.0
+
+
+async def _sleep_ticker(
+    phase_s: float,
+    counts: list,
+    index: int,
+):
+
+    await asyncio.sleep(phase_s)
+
+    loop = asyncio.get_running_loop()
+    period_s = PERIOD.as_secs_f()
+    deadline_s = loop.time() + period_s
+
+    while True:
+
+        await asyncio.sleep(max(0, deadline_s - loop.time()))
+
+        counts[index] += 1
+
+        # as `MissedTickBehaviour.DELAY`
+
+        deadline_s = max(deadline_s, loop.time()) + period_s
+
+
+async def _ticker(
+    interval: Interval,
+    phase_s: float,
+    counts: list,
+    index: int,
+):
+
+    await asyncio.sleep(phase_s)
+
+    while True:
+
+        await interval
+
+        counts[index] += 1
+
+
+async def _run(
+    count: int,
+    wheel: bool | None,
+) -> tuple[int, float]:
+
+    rng = random.Random(count)
+
+    counts = [0] * count
+
+    if wheel is None:
+
+        tasks = [asyncio.create_task(_sleep_ticker(rng.random() * PERIOD.as_secs_f(), counts, i)) for i in range(count)]
+    else:
+
+        tasks = [
+            asyncio.create_task(
+                _ticker(
+                    Interval(PERIOD, missed_tick_behaviour=MissedTickBehaviour.DELAY, negative_bias=0, wheel=wheel),
+                    rng.random() * PERIOD.as_secs_f(),
+                    counts,
+                    i,
+                )
+            )
+            for i in range(count)
+        ]
+
+    # let all tickers settle into their schedules before measuring
+
+    await asyncio.sleep(PERIOD.as_secs_f() * 2)
+
+    ticks_0 = sum(counts)
+    cpu_0 = time.process_time()
+
+    await asyncio.sleep(RUN_SECS)
+
+    cpu_1 = time.process_time()
+    ticks_1 = sum(counts)
+
+    for task in tasks:
+
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return ticks_1 - ticks_0, cpu_1 - cpu_0
+
+
+def main(counts: list[int]):
+
+    print(f"{'intervals':>10}  {'driver':<14}  {'ticks':>10}  {'CPU (s)':>8}  {'CPU/tick':>10}  {'vs sleep':>8}")
+
+    for count in counts:
+
+        baseline = None
+
+        for driver, wheel in (
+            ('asyncio.sleep', None),
+            ('loop.call_at', False),
+            ('TimerWheel', True),
+        ):
+
+            ticks, cpu = asyncio.run(_run(count, wheel))
+
+            per_tick = cpu / ticks if ticks else None
+
+            if baseline is None:
+
+                baseline = per_tick
+
+            relative = f"{per_tick / baseline:.2f}x" if per_tick and baseline else '-'
+            per_tick = Duration.from_nanos(int(per_tick * 1_000_000_000)) if per_tick else None
+
+            print(f"{count:>10,}  {driver:<14}  {ticks:>10,}  {cpu:>8.3f}  {str(per_tick):>10}  {relative:>8}")
+
+
+if __name__ == "__main__":
+
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
+
@@ -0,0 +1,146 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/mpsc_channel.py
+#
+# Purpose:  Measures the throughput of a single producer and a single
+#           consumer, through `asyncio.Queue` and through `mpsc.channel()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/mpsc_channel.py [ <items> ]
+
+The producer sends the given number of items into a channel of capacity
+1,024, and the consumer receives them: from an `asyncio.Queue` (`put()` /
+`get()`); from an `mpsc` channel one at a time (`send()` / `recv()`); and
+from an `mpsc` channel in batches of up to 256 (`send()` / `recv_many()`).
+The best of several runs is reported.
+"""
+
+import asyncio
+import sys
+import time
+
+from asynkio.sync import (
+    mpsc,
+)
+
+CAPACITY = 1_024
+BATCH = 256
+RUNS = 5
+
+
+async def _queue(n: int) -> float:
+
+    queue = asyncio.Queue(CAPACITY)
+
+    async def producer():
+
+        put = queue.put
+
+        for i in range(n):
+
+            await put(i)
+
+        await put(None)
+
+    t_0 = time.perf_counter()
+
+    task = asyncio.create_task(producer())
+
+    get = queue.get
+
+    while await get() is not None:
+
+        pass
+
+    await task
+
+    return time.perf_counter() - t_0
+
+
+async def _mpsc_recv(n: int) -> float:
+
+    tx, rx = mpsc.channel(CAPACITY)
+
+    async def producer():
+
+        with tx:
+
+            send = tx.send
+
+            for i in range(n):
+
+                await send(i)
+
+    t_0 = time.perf_counter()
+
+    task = asyncio.create_task(producer())
+
+    async for _ in rx:
+
+        pass
+
+    await task
+
+    return time.perf_counter() - t_0
+
+
+async def _mpsc_recv_many(n: int) -> float:
+
+    tx, rx = mpsc.channel(CAPACITY)
+
+    async def producer():
+
+        with tx:
+
+            send = tx.send
+
+            for i in range(n):
+
+                await send(i)
+
+    t_0 = time.perf_counter()
+
+    task = asyncio.create_task(producer())
+
+    batch = []
+
+    while await rx.recv_many(batch, BATCH):
+
+        batch.clear()
+
+    await task
+
+    return time.perf_counter() - t_0
+
+
+def main(n: int):
+
+    print(f"{'mode':<20}  {'time (s)':>8}  {'items/s':>12}")
+
+    for label, fn in (
+        ('asyncio.Queue', _queue),
+        ('mpsc recv()', _mpsc_recv),
+        ('mpsc recv_many()', _mpsc_recv_many),
+    ):
+
+        secs = min(asyncio.run(fn(n)) for _ in range(RUNS))
+
+        print(f"{label:<20}  {secs:>8.3f}  {n / secs:>12,.0f}")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+
@@ -0,0 +1,132 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/rate_limiter.py
+#
+# Purpose:  Measures the time per check, and the memory per key, of
+#           `RateLimiter` over many keys, checked singly and in batches.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/rate_limiter.py [ <keys> [ <checks> ] ]
+
+e.g.
+
+    python benchmarks/rate_limiter.py 1000000 5000000
+
+Checks are made for keys chosen at random; each measurement is the best of
+five runs.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from asynkio.sync import (
+    RateLimiter,
+)
+from asynkio.time import (
+    Duration,
+)
+
+BATCH = 1_000
+RUNS = 5
+
+
+def _per_check(
+    secs: float,
+    checks: int,
+) -> Duration:
+
+    return Duration.from_nanos(int(secs * 1_000_000_000 / checks))
+
+
+def _run_single(
+    limiter: RateLimiter,
+    keys: list[int],
+) -> float:
+
+    try_acquire = limiter.try_acquire
+
+    t_0 = time.perf_counter()
+
+    for key in keys:
+
+        try_acquire(key)
+
+    return time.perf_counter() - t_0
+
+
+def _run_many(
+    limiter: RateLimiter,
+    keys: list[int],
+) -> float:
+
+    try_acquire_many = limiter.try_acquire_many
+
+    t_0 = time.perf_counter()
+
+    for i in range(0, len(keys), BATCH):
+
+        try_acquire_many(keys[i : i + BATCH])
+
+    return time.perf_counter() - t_0
+
+
+def main(
+    count: int,
+    checks: int,
+):
+
+    rng = random.Random(count)
+
+    keys = [rng.randrange(count) for _ in range(checks)]
+
+    limiter = RateLimiter(100, Duration.from_secs(1))
+
+    # populate the state of every key
+
+    limiter.try_acquire_many(range(count))
+
+    print(f"{'mode':<22}  {'checks':>10}  {'time (s)':>8}  {'per check':>10}")
+
+    for label, run in (
+        ('try_acquire', _run_single),
+        (f'try_acquire_many/{BATCH}', _run_many),
+    ):
+
+        secs = min(run(limiter, keys) for _ in range(RUNS))
+
+        print(f"{label:<22}  {checks:>10,}  {secs:>8.3f}  {str(_per_check(secs, checks)):>10}")
+
+    tracemalloc.start()
+
+    limiter = RateLimiter(100, Duration.from_secs(1))
+
+    limiter.try_acquire_many(range(count))
+
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    print(f"memory: {size / count:.0f} B/key ({count:,} keys)")
+
+
+if __name__ == "__main__":
+
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000,
+    )
+
@@ -0,0 +1,193 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/stream_shaper.py
+#
+# Purpose:  Measures the throughput and latency of writes over a loopback
+#           TCP connection, unshaped and through `ShapedWriter`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/stream_shaper.py [ <megabytes> ]
+
+Throughput is measured for the given volume written in 1 KiB pieces:
+unshaped; shaped at a rate too high to bind (i.e. the overhead of the
+shaper); and shaped at 20 MB/s. Latency - from write to receipt - is
+measured for small messages written every 2ms, within the budget.
+"""
+
+import asyncio
+import sys
+import time
+
+from asynkio.io import (
+    ShapedWriter,
+)
+from asynkio.time import (
+    Duration,
+)
+
+PIECE = b'x' * 1_024
+MESSAGES = 500
+MESSAGE_INTERVAL_S = 0.002
+
+
+async def _connect(on_data):
+
+    done = asyncio.Event()
+
+    async def on_connection(reader, writer):
+
+        while data := await reader.read(262_144):
+
+            on_data(data)
+
+        done.set()
+
+        writer.close()
+
+    server = await asyncio.start_server(on_connection, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    _, writer = await asyncio.open_connection('127.0.0.1', port)
+
+    return server, writer, done
+
+
+async def _throughput(
+    total: int,
+    rate: int | None,
+) -> tuple[float, int]:
+
+    received = [0]
+
+    def on_data(data):
+
+        received[0] += len(data)
+
+    server, writer, done = await _connect(on_data)
+
+    out = writer if rate is None else ShapedWriter(writer, rate=rate)
+
+    t_0 = time.perf_counter()
+
+    for i in range(total // len(PIECE)):
+
+        out.write(PIECE)
+
+        if 0 == i % 64:
+
+            await out.drain()
+
+    await out.drain()
+
+    if rate is None:
+
+        writer.close()
+
+        await writer.wait_closed()
+    else:
+
+        await out.aclose()
+
+    await done.wait()
+
+    secs = time.perf_counter() - t_0
+
+    server.close()
+
+    await server.wait_closed()
+
+    return secs, received[0]
+
+
+async def _latency(shaped: bool) -> list[int]:
+
+    latencies = []
+
+    def on_data(data):
+
+        now_ns = time.perf_counter_ns()
+
+        for line in data.split(b'\n'):
+
+            if line:
+
+                latencies.append(now_ns - int(line))
+
+    server, writer, done = await _connect(on_data)
+
+    out = ShapedWriter(writer, rate=1_000_000) if shaped else writer
+
+    for _ in range(MESSAGES):
+
+        out.write(b'%d\n' % time.perf_counter_ns())
+
+        await asyncio.sleep(MESSAGE_INTERVAL_S)
+
+    if shaped:
+
+        await out.aclose()
+    else:
+
+        writer.close()
+
+        await writer.wait_closed()
+
+    await done.wait()
+
+    server.close()
+
+    await server.wait_closed()
+
+    return sorted(latencies)
+
+
+def main(megabytes: int):
+
+    total = megabytes * 1_000_000
+
+    print(f"{'mode':<22}  {'time (s)':>8}  {'MB/s':>8}")
+
+    for label, rate in (
+        ('unshaped', None),
+        ('shaped (unbound)', 10**12),
+        ('shaped (20 MB/s)', 20_000_000),
+    ):
+
+        secs, received = asyncio.run(_throughput(total, rate))
+
+        assert received >= total - len(PIECE)
+
+        print(f"{label:<22}  {secs:>8.3f}  {received / secs / 1_000_000:>8.1f}")
+
+    print()
+    print(f"{'mode':<22}  {'p50':>10}  {'p99':>10}")
+
+    for label, shaped in (
+        ('unshaped', False),
+        ('shaped (1 MB/s)', True),
+    ):
+
+        latencies = asyncio.run(_latency(shaped))
+
+        p50 = Duration.from_nanos(latencies[len(latencies) // 2])
+        p99 = Duration.from_nanos(latencies[len(latencies) * 99 // 100])
+
+        print(f"{label:<22}  {str(p50):>10}  {str(p99):>10}")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
+
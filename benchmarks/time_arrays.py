@@ -0,0 +1,108 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/time_arrays.py
+#
+# Purpose:  Measures bulk time arithmetic with `DurationArray` and
+#           `InstantArray` (over `array('q')`, and over NumPy if it is
+#           installed) against loops over `Duration` and `Instant` objects.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/time_arrays.py [ <count> ]
+"""
+
+import random
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Instant,
+    InstantArray,
+)
+
+try:
+
+    import numpy
+except ImportError:
+
+    numpy = None
+
+
+def _measure(f) -> Duration:
+
+    t0 = time.perf_counter_ns()
+
+    f()
+
+    t1 = time.perf_counter_ns()
+
+    return Duration.from_nanos(t1 - t0)
+
+
+def main(count: int):
+
+    rng = random.Random(0)
+
+    t_ns = time.time_ns()
+    raw = [t_ns + i * 1_000_000 + rng.randrange(1_000_000) for i in range(count)]
+    offset = Duration.from_millis(5)
+
+    instants = [Instant(v) for v in raw]
+    arrays = [('array', InstantArray(raw))]
+
+    if numpy is not None:
+
+        arrays.append(('numpy', InstantArray(numpy.array(raw, dtype=numpy.int64))))
+
+    cases = [
+        (
+            'objects',
+            {
+                'instant + duration': lambda: [i + offset for i in instants],
+                'diff().as_millis()': lambda: [(b - a).as_millis() for a, b in zip(instants, instants[1:])],
+                'max(diff())': lambda: max((b - a for a, b in zip(instants, instants[1:])), key=int),
+                'p99(diff())': lambda: sorted((b - a).as_nanos() for a, b in zip(instants, instants[1:]))[
+                    (count - 1) * 99 // 100
+                ],
+            },
+        )
+    ]
+
+    for label, array in arrays:
+
+        cases.append(
+            (
+                label,
+                {
+                    'instant + duration': lambda array=array: array + offset,
+                    'diff().as_millis()': lambda array=array: array.diff().as_millis(),
+                    'max(diff())': lambda array=array: array.diff().max(),
+                    'p99(diff())': lambda array=array: array.diff().percentile(99),
+                },
+            )
+        )
+
+    print(f"{count:,} timestamps")
+    print(f"{'operation':<20}" + "".join(f"  {label:>10}" for label, _ in cases))
+
+    for operation in cases[0][1]:
+
+        print(f"{operation:<20}" + "".join(f"  {str(_measure(ops[operation])):>10}" for _, ops in cases))
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+
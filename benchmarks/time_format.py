@@ -0,0 +1,88 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/time_format.py
+#
+# Purpose:  Measures the per-call cost of formatting `Duration`s and
+#           `Instant`s - with `str()`, `format()`, and (where available)
+#           compiled formatters.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/time_format.py [ <iterations> ]
+
+Each case reports the best of five runs.
+"""
+
+import sys
+import time
+
+from asynkio.time import (
+    Duration,
+    Instant,
+)
+
+
+def _measure(
+    f,
+    args,
+    repeats: int = 5,
+) -> Duration:
+
+    best_ns = None
+
+    for _ in range(repeats):
+
+        t0 = time.perf_counter_ns()
+
+        for arg in args:
+
+            f(arg)
+
+        t1 = time.perf_counter_ns()
+
+        if best_ns is None or t1 - t0 < best_ns:
+
+            best_ns = t1 - t0
+
+    return Duration.from_nanos(best_ns // len(args))
+
+
+def main(iterations: int):
+
+    durations = [Duration.from_nanos(i * 7_919 % 10_000_000_000 + 1) for i in range(iterations)]
+    instants = [Instant(time.time_ns() + i * 1_000_000) for i in range(iterations)]
+
+    cases = [
+        ('str(Duration)', str, durations),
+        ("format(Duration, '+')", lambda d: format(d, '+'), durations),
+        ('str(Instant)', str, instants),
+        ("format(Instant, 'x')", lambda i: format(i, 'x'), instants),
+    ]
+
+    if hasattr(Duration, 'formatter'):
+
+        cases += [
+            ("Duration.formatter('+')", Duration.formatter('+'), durations),
+            ("Instant.formatter('x')", Instant.formatter('x'), instants),
+        ]
+
+    for label, f, args in cases:
+
+        print(f"{label:<26}  {str(_measure(f, args)):>10}")
+
+
+if __name__ == "__main__":
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+
@@ -0,0 +1,122 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     benchmarks/timeout_reschedule.py
+#
+# Purpose:  Compares the cost of entering, and repeatedly extending, a
+#           timeout with `asyncio.timeout()` versus
+#           `asynkio.time.timeout()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+"""
+Run:
+
+    python benchmarks/timeout_reschedule.py [ <count> [ <extensions> ] ]
+
+Each of `count` timeouts is entered and then extended `extensions` times
+(as, say, for an idle timeout that is pushed back on each read), and the
+number of loop timers armed - i.e. calls to `loop.call_at()` - is counted.
+"""
+
+import asyncio
+import sys
+import time
+
+from asynkio.time import (
+    timeout,
+)
+
+TIMEOUT_NS = 10_000_000_000
+
+
+async def _run_asyncio(
+    count: int,
+    extensions: int,
+):
+
+    loop = asyncio.get_running_loop()
+
+    for _ in range(count):
+
+        async with asyncio.timeout(TIMEOUT_NS / 1_000_000_000) as t:
+
+            for _ in range(extensions):
+
+                t.reschedule(loop.time() + TIMEOUT_NS / 1_000_000_000)
+
+
+async def _run_asynkio(
+    count: int,
+    extensions: int,
+):
+
+    now_ns = time.monotonic_ns
+
+    for _ in range(count):
+
+        async with timeout(TIMEOUT_NS) as t:
+
+            for _ in range(extensions):
+
+                t.reschedule(now_ns() + TIMEOUT_NS)
+
+
+async def _measure(
+    run,
+    count: int,
+    extensions: int,
+) -> tuple[float, int]:
+
+    loop = asyncio.get_running_loop()
+    call_at = loop.call_at
+    timers = [0]
+
+    def counting_call_at(*args, **kwargs):
+
+        timers[0] += 1
+
+        return call_at(*args, **kwargs)
+
+    loop.call_at = counting_call_at
+
+    t0 = time.perf_counter_ns()
+
+    await run(count, extensions)
+
+    t1 = time.perf_counter_ns()
+
+    return (t1 - t0) / count, timers[0]
+
+
+def main(
+    count: int,
+    extensions: int,
+):
+
+    print(f"{'implementation':<16}  {'ns/timeout':>12}  {'timers':>10}")
+
+    for label, run in (
+        ('asyncio.timeout', _run_asyncio),
+        ('asynkio timeout', _run_asynkio),
+    ):
+
+        per_timeout_ns, timers = asyncio.run(_measure(run, count, extensions))
+
+        print(f"{label:<16}  {per_timeout_ns:>12,.0f}  {timers:>10,}")
+
+
+if __name__ == "__main__":
+
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
+
@@ -0,0 +1,236 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_cache_ttl.py
+#
+# Purpose:  Unit-test for `asynkio.cache.TTLCache`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.cache import (
+    TTLCache,
+)
+from asynkio.time import (
+    Duration,
+    run_virtual,
+    sleep,
+)
+
+MS = 1_000_000
+
+
+class _ManualClock:
+
+    def __init__(self):
+
+        self.t_ns = 0
+
+    def now_ns(self) -> int:
+
+        return self.t_ns
+
+
+def test_TTLCache_get_and_set_count_hits_and_misses():
+
+    clock = _ManualClock()
+    cache = TTLCache(10 * MS, clock=clock)
+
+    assert None is cache.get('a')
+
+    cache.set('a', 1)
+
+    assert 1 == cache.get('a')
+    assert 'a' in cache
+    assert 1 == cache.hits()
+    assert 1 == cache.misses()
+
+    clock.t_ns = 10 * MS
+
+    # expired, but not yet swept
+
+    assert 'a' not in cache
+    assert 'missing' == cache.get('a', 'missing')
+    assert 0 == len(cache)
+    assert 1 == cache.expirations()
+    assert 2 == cache.misses()
+
+
+def test_TTLCache_sweep_removes_only_expired_entries():
+
+    clock = _ManualClock()
+    cache = TTLCache(Duration.from_millis(10), sweep_period=5 * MS, clock=clock)
+
+    for i in range(100):
+
+        cache.set(i, i, ttl=(i % 4 + 1) * 10 * MS)
+
+    # replaced with a longer TTL, so not expired with its first bucket
+
+    cache.set(0, 'zero', ttl=100 * MS)
+
+    clock.t_ns = 9 * MS
+
+    assert 0 == cache.sweep()
+
+    clock.t_ns = 15 * MS
+
+    assert 24 == cache.sweep()
+
+    clock.t_ns = 25 * MS
+
+    assert 25 == cache.sweep()
+    assert 51 == len(cache)
+    assert 'zero' == cache.get(0)
+    assert 2 == cache.get(2)
+
+    clock.t_ns = 1_000 * MS
+
+    assert 51 == cache.sweep()
+    assert 0 == len(cache)
+    assert 100 == cache.expirations()
+
+
+def test_TTLCache_evicts_least_recently_used():
+
+    cache = TTLCache(Duration.from_secs(60), maxsize=3, clock=_ManualClock())
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('c', 3)
+
+    assert 1 == cache.get('a')
+
+    cache.set('d', 4)
+
+    assert None is cache.get('b')
+    assert [1, 3, 4] == [cache.get(key) for key in 'acd']
+    assert 1 == cache.evictions()
+    assert 3 == len(cache)
+
+
+def test_TTLCache_get_or_load_is_single_flight():
+
+    async def main():
+
+        cache = TTLCache(Duration.from_secs(1))
+        calls = []
+
+        async def loader(key):
+
+            calls.append(key)
+
+            await sleep(10 * MS)
+
+            return key * 2
+
+        results = await asyncio.gather(*(cache.get_or_load(21, loader) for _ in range(100)))
+
+        assert 42 == await cache.get_or_load(21, loader)
+
+        cache.close()
+
+        return results, calls, cache
+
+    results, calls, cache = run_virtual(main())
+
+    assert [42] * 100 == results
+    assert [21] == calls
+    assert 1 == cache.loads()
+    assert 100 == cache.misses()
+    assert 1 == cache.hits()
+
+
+def test_TTLCache_get_or_load_does_not_cache_exceptions():
+
+    async def main():
+
+        cache = TTLCache(Duration.from_secs(1))
+
+        async def failing(key):
+
+            await sleep(MS)
+
+            raise LookupError(key)
+
+        async def loader(key):
+
+            return 'ok'
+
+        outcomes = await asyncio.gather(*(cache.get_or_load('k', failing) for _ in range(3)), return_exceptions=True)
+
+        value = await cache.get_or_load('k', loader)
+
+        cache.close()
+
+        return outcomes, value, cache.loads()
+
+    outcomes, value, loads = run_virtual(main())
+
+    assert all(isinstance(outcome, LookupError) for outcome in outcomes)
+    assert 'ok' == value
+    assert 2 == loads
+
+
+def test_TTLCache_get_or_load_survives_cancellation_of_first_caller():
+
+    async def main():
+
+        cache = TTLCache(Duration.from_secs(1))
+
+        async def loader(key):
+
+            await sleep(10 * MS)
+
+            return 'loaded'
+
+        first = asyncio.create_task(cache.get_or_load('k', loader))
+        second = asyncio.create_task(cache.get_or_load('k', loader))
+
+        await sleep(MS)
+
+        first.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+
+            await first
+
+        value = await second
+
+        cache.close()
+
+        return value, cache.loads()
+
+    assert ('loaded', 1) == run_virtual(main())
+
+
+def test_TTLCache_sweeps_periodically_within_loop():
+
+    async def main():
+
+        async with TTLCache(50 * MS, sweep_period=10 * MS) as cache:
+
+            for i in range(1_000):
+
+                cache.set(i, i)
+
+            await sleep(45 * MS)
+
+            assert 1_000 == len(cache)
+
+            await sleep(20 * MS)
+
+            return len(cache), cache.expirations()
+
+    assert (0, 1_000) == run_virtual(main())
+
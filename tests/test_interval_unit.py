@@ -1,9 +1,13 @@
 #! /usr/bin/env python3
 
 import asyncio
-from unittest.mock import patch
+import random
+import time
+
+import pytest
 
 from asynkio.time import (
+    Clock,
     Duration,
     Instant,
     Interval,
@@ -14,29 +18,55 @@ REF = 10_000_000_000
 PERIOD_NS = 1_000_000_000
 
 
-async def _await_interval(interval):
+async def _await_interval(interval, sleeps):
+    """
+    Awaits `interval` on a loop whose time stands still at 0.0 and whose
+    timers fire immediately, recording the requested sleep (0 if the tick
+    was immediate).
+    """
+
+    loop = asyncio.get_running_loop()
+    whens = []
+
+    def call_at(when, callback, *args, context=None):
+
+        whens.append(when)
+
+        return loop.call_soon(callback, *args, context=context)
+
+    loop.time = lambda: 0.0
+    loop.call_at = call_at
 
     await interval
 
+    sleeps.append(whens[0] if whens else 0)
 
-def _run_await(interval):
 
-    asyncio.run(_await_interval(interval))
+def _run_await(interval, sleeps):
 
+    asyncio.run(_await_interval(interval, sleeps))
 
-def _build_interval(now_values, build_interval):
+
+class _FakeClock(Clock):
     """
-    Builds an interval under mocked time without awaiting it.
+    Clock that returns, in turn, each of the given instants.
     """
 
-    now_iter = iter(now_values)
+    def __init__(self, now_values):
+
+        self._now_iter = iter(now_values)
+
+    def now_ns(self):
 
-    def next_now():
+        return int(next(self._now_iter))
 
-        return next(now_iter)
 
-    with patch('asynkio.time.interval.Instant.now', side_effect=next_now):
-        return build_interval()
+def _build_interval(now_values, build_interval):
+    """
+    Builds an interval under mocked time without awaiting it.
+    """
+
+    return build_interval(_FakeClock(now_values))
 
 
 def _run_interval(now_values, build_interval, await_count=1):
@@ -46,34 +76,20 @@ def _run_interval(now_values, build_interval, await_count=1):
     """
 
     sleeps = []
-    now_iter = iter(now_values)
-
-    async def fake_sleep(seconds):
-
-        sleeps.append(seconds)
-
-    def next_now():
 
-        return next(now_iter)
+    interval = build_interval(_FakeClock(now_values))
 
-    with patch('asynkio.time.interval.Instant.now', side_effect=next_now):
-        with patch(
-            'asynkio.time.interval.asyncio.sleep',
-            side_effect=fake_sleep,
-        ):
-            interval = build_interval()
+    for _ in range(await_count):
+        _run_await(interval, sleeps)
 
-            for _ in range(await_count):
-                _run_await(interval)
-
-            return interval, sleeps
+    return interval, sleeps
 
 
 def test_Interval_init_period_from_duration():
 
     interval = _build_interval(
         [Instant(REF)],
-        lambda: Interval(Duration.from_secs(1), negative_bias=0),
+        lambda clock: Interval(Duration.from_secs(1), negative_bias=0, clock=clock),
     )
 
     assert PERIOD_NS == interval.period().as_nanos()
@@ -83,7 +99,7 @@ def test_Interval_init_period_from_int():
 
     interval = _build_interval(
         [Instant(REF)],
-        lambda: Interval(PERIOD_NS, negative_bias=0),
+        lambda clock: Interval(PERIOD_NS, negative_bias=0, clock=clock),
     )
 
     assert PERIOD_NS == interval.period().as_nanos()
@@ -93,7 +109,7 @@ def test_Interval_negative_bias_default_large_period():
 
     interval = _build_interval(
         [Instant(REF)],
-        lambda: Interval(PERIOD_NS),
+        lambda clock: Interval(PERIOD_NS, clock=clock),
     )
 
     assert 400_000 == interval.negative_bias().as_nanos()
@@ -103,7 +119,7 @@ def test_Interval_negative_bias_default_small_period():
 
     interval = _build_interval(
         [Instant(REF)],
-        lambda: Interval(50_000_000),
+        lambda clock: Interval(50_000_000, clock=clock),
     )
 
     assert 0 == interval.negative_bias().as_nanos()
@@ -113,11 +129,12 @@ def test_Interval_accessors():
 
     interval = _build_interval(
         [Instant(REF)],
-        lambda: Interval(
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.DELAY,
             name='tick',
             negative_bias=0,
+            clock=clock,
         ),
     )
 
@@ -130,27 +147,38 @@ def test_Interval_accessors():
 
 
 def test_Interval_DELAY_await_sleep():
+    """
+    An await that is on time sleeps until the next deadline (less the
+    bias); one that is late sleeps a full period (less the bias).
+    """
 
     _, sleeps = _run_interval(
-        [Instant(REF), Instant(REF + 123)],
-        lambda: Interval(
+        [
+            Instant(REF),
+            Instant(REF + 123),
+            Instant(REF + 2_500_000_000),
+        ],
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.DELAY,
             negative_bias=100_000_000,
+            clock=clock,
         ),
+        await_count=2,
     )
 
-    assert [0.9] == sleeps
+    assert [(PERIOD_NS - 123 - 100_000_000) / 1_000_000_000, 0.9] == sleeps
 
 
 def test_Interval_SKIP_first_await():
 
     interval, sleeps = _run_interval(
         [Instant(REF), Instant(REF)],
-        lambda: Interval(
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.SKIP,
             negative_bias=0,
+            clock=clock,
         ),
     )
 
@@ -167,10 +195,11 @@ def test_Interval_SKIP_second_await_at_period_boundary():
             Instant(REF),
             Instant(REF + PERIOD_NS),
         ],
-        lambda: Interval(
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.SKIP,
             negative_bias=0,
+            clock=clock,
         ),
         await_count=2,
     )
@@ -180,20 +209,21 @@ def test_Interval_SKIP_second_await_at_period_boundary():
 
 def test_Interval_SKIP_await_with_remainder():
     """
-    First await always sleeps a full period; subsequent awaits target the
-    next period boundary from the reference (period - remainder).
+    First await sleeps a full period; subsequent awaits target the next
+    deadline, i.e. the next period boundary from the reference.
     """
 
     _, sleeps = _run_interval(
         [
             Instant(REF),
             Instant(REF),
-            Instant(REF + 500_000_000),
+            Instant(REF + 1_500_000_000),
         ],
-        lambda: Interval(
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.SKIP,
             negative_bias=0,
+            clock=clock,
         ),
         await_count=2,
     )
@@ -203,25 +233,26 @@ def test_Interval_SKIP_await_with_remainder():
 
 def test_Interval_SKIP_applies_negative_bias():
     """
-    First await sleeps a full period (no bias); later awaits subtract
-    `negative_bias` from the sleep when far enough from the boundary.
+    Every await subtracts `negative_bias` from the sleep, waking early
+    without moving the deadline.
     """
 
     _, sleeps = _run_interval(
         [
             Instant(REF),
             Instant(REF),
-            Instant(REF),
+            Instant(REF + 900_000_000),
         ],
-        lambda: Interval(
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.SKIP,
             negative_bias=100_000_000,
+            clock=clock,
         ),
         await_count=2,
     )
 
-    assert [1.0, 0.9] == sleeps
+    assert [0.9, 1.0] == sleeps
 
 
 def test_Interval_BURST_catch_up_then_wait():
@@ -235,10 +266,11 @@ def test_Interval_BURST_catch_up_then_wait():
             Instant(late),
             Instant(late),
         ],
-        lambda: Interval(
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.BURST,
             negative_bias=0,
+            clock=clock,
         ),
         await_count=3,
     )
@@ -256,10 +288,11 @@ def test_Interval_event_count_increments():
             Instant(REF + PERIOD_NS),
             Instant(REF + 2 * PERIOD_NS),
         ],
-        lambda: Interval(
+        lambda clock: Interval(
             PERIOD_NS,
             missed_tick_behaviour=MissedTickBehaviour.SKIP,
             negative_bias=0,
+            clock=clock,
         ),
         await_count=3,
     )
@@ -274,3 +307,470 @@ def test_MissedTickBehaviour_try_parse():
     assert MissedTickBehaviour.DELAY == MissedTickBehaviour.try_parse('Delay')
     assert None is MissedTickBehaviour.try_parse('unknown')
 
+
+def test_Interval_await_reuses_awaitable():
+
+    interval = Interval(Duration.from_millis(1))
+
+    async def main():
+
+        await interval
+
+        first = interval.__await__()
+
+        first.close()
+
+        await interval
+
+        second = interval.__await__()
+
+        second.close()
+
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert first is second
+    assert 4 == interval.event_count()
+
+
+def test_Interval_await_ticks_on_real_loop():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        interval = Interval(Duration.from_millis(5), missed_tick_behaviour=MissedTickBehaviour.DELAY)
+
+        t0 = loop.time()
+
+        for _ in range(3):
+
+            await interval
+
+        return loop.time() - t0
+
+    elapsed = asyncio.run(main())
+
+    assert elapsed >= 0.015
+
+
+def test_Interval_cancel_while_waiting():
+
+    for wheel in (None, True):
+
+        interval = Interval(Duration.from_secs(10), wheel=wheel)
+
+        async def main():
+
+            task = asyncio.create_task(_await_once(interval))
+
+            await asyncio.sleep(0.001)
+
+            task.cancel("stop")
+
+            try:
+
+                await task
+            except asyncio.CancelledError as x:
+
+                return x.args
+
+        assert ("stop",) == asyncio.run(main())
+
+        # the interval may be awaited again after cancellation
+
+        interval = Interval(Duration.from_millis(1), wheel=wheel)
+
+        asyncio.run(_await_once(interval))
+
+        assert 1 == interval.event_count()
+
+
+def test_Interval_cancel_does_not_consume_tick():
+
+    interval = Interval(Duration.from_secs(10))
+
+    async def main():
+
+        task = asyncio.create_task(_await_once(interval))
+
+        await asyncio.sleep(0.001)
+
+        task.cancel()
+
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(main())
+
+    assert int(interval.reference_instant()) + 10_000_000_000 == interval._deadline_ns
+
+
+def test_Interval_cancel_removes_wheel_entry():
+
+    from asynkio.time import TimerWheel
+
+    async def main():
+
+        interval = Interval(Duration.from_secs(10), wheel=True)
+
+        task = asyncio.create_task(_await_once(interval))
+
+        await asyncio.sleep(0.001)
+
+        pending_before = len(TimerWheel.for_loop())
+
+        task.cancel()
+
+        await asyncio.gather(task, return_exceptions=True)
+
+        return pending_before, len(TimerWheel.for_loop())
+
+    assert (1, 0) == asyncio.run(main())
+
+
+def test_Interval_concurrent_await_is_rejected():
+
+    async def main():
+
+        interval = Interval(Duration.from_secs(10))
+
+        task = asyncio.create_task(_await_once(interval))
+
+        await asyncio.sleep(0.001)
+
+        try:
+
+            await interval
+        except RuntimeError as x:
+
+            return str(x)
+        finally:
+
+            task.cancel()
+
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert "interval is already being awaited" == asyncio.run(main())
+
+
+async def _await_once(interval):
+
+    await interval
+
+
+def test_Interval_async_for_take_yields_scheduled_instants():
+
+    async def main():
+
+        interval = Interval(Duration.from_millis(2), missed_tick_behaviour=MissedTickBehaviour.DELAY)
+
+        ticks = []
+
+        async for instant in interval.take(3):
+
+            assert isinstance(instant, Instant)
+
+            ticks.append((int(instant), interval.clock().now_ns()))
+
+        return ticks
+
+    ticks = asyncio.run(main())
+
+    assert 3 == len(ticks)
+
+    for scheduled_ns, woken_ns in ticks:
+
+        # woken no earlier than scheduled, less any negative bias (0 here)
+
+        assert scheduled_ns <= woken_ns
+
+    assert ticks[0][0] < ticks[1][0] < ticks[2][0]
+
+
+def test_Interval_async_for_SKIP_first_tick_is_one_period_after_reference():
+
+    async def main():
+
+        interval = Interval(Duration.from_millis(3), negative_bias=0)
+
+        async for instant in interval:
+
+            return int(instant) - int(interval.reference_instant())
+
+    assert asyncio.run(main()) >= 3_000_000
+
+
+def test_Interval_take_zero():
+
+    async def main():
+
+        interval = Interval(Duration.from_secs(10))
+
+        return [instant async for instant in interval.take(0)], interval.event_count()
+
+    assert ([], 0) == asyncio.run(main())
+
+
+def test_Interval_take_while():
+
+    async def main():
+
+        interval = Interval(Duration.from_millis(1), missed_tick_behaviour=MissedTickBehaviour.BURST)
+
+        limit = int(interval.reference_instant()) + 5_000_000
+
+        return [instant async for instant in interval.take_while(lambda instant: int(instant) <= limit)]
+
+    ticks = asyncio.run(main())
+
+    assert 1 <= len(ticks) <= 5
+
+
+def test_Interval_stop_from_within_iteration():
+
+    async def main():
+
+        interval = Interval(Duration.from_millis(1))
+
+        count = 0
+
+        async for _ in interval:
+
+            count += 1
+
+            if 3 == count:
+
+                interval.stop()
+
+        return count
+
+    assert 3 == asyncio.run(main())
+
+
+def test_Interval_stop_ends_pending_tick():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        interval = Interval(Duration.from_secs(10))
+
+        loop.call_later(0.005, interval.stop)
+
+        t0 = loop.time()
+
+        ticks = [instant async for instant in interval]
+
+        return ticks, loop.time() - t0
+
+    ticks, elapsed = asyncio.run(main())
+
+    assert [] == ticks
+    assert elapsed < 5
+
+
+class _SimulatedClock(Clock):
+    """
+    Clock whose time only moves when told.
+    """
+
+    def __init__(self, t_ns):
+
+        self.t_ns = t_ns
+
+    def now_ns(self):
+
+        return self.t_ns
+
+
+async def _simulate_ticks(interval, clock, ticks, rng, stall_rate):
+    """
+    Iterates `ticks` ticks of `interval` on a loop driven by `clock`, on
+    which every timer fires late by up to a fifth of a period, and the
+    consumer works for up to a tenth of a period per tick, stalling for up
+    to four periods with probability `stall_rate`. Returns a list of
+    `(deadline, fired, awaited)` for each tick.
+    """
+
+    loop = asyncio.get_running_loop()
+    period_ns = interval.period().as_nanos()
+
+    def call_at(when, callback, *args, context=None):
+
+        clock.t_ns = max(clock.t_ns, round(when * 1_000_000_000)) + rng.randrange(period_ns // 5)
+
+        return loop.call_soon(callback, *args, context=context)
+
+    loop.time = lambda: clock.t_ns / 1_000_000_000
+    loop.call_at = call_at
+
+    records = []
+
+    async for instant in interval.take(ticks):
+
+        fired = clock.t_ns
+
+        if rng.random() < stall_rate:
+
+            clock.t_ns += rng.randrange(4 * period_ns)
+        else:
+
+            clock.t_ns += rng.randrange(period_ns // 10)
+
+        records.append((int(instant), fired, clock.t_ns))
+
+    return records
+
+
+def _expected_next_deadline(mtb, reference_ns, period_ns, deadline_ns, awaited_ns):
+
+    if awaited_ns < deadline_ns + period_ns or MissedTickBehaviour.BURST == mtb:
+
+        return deadline_ns + period_ns
+
+    if MissedTickBehaviour.DELAY == mtb:
+
+        return awaited_ns + period_ns
+
+    return reference_ns + ((awaited_ns - reference_ns) // period_ns + 1) * period_ns
+
+
+def _check_simulated_ticks(mtb, stall_rate, seed):
+
+    period_ns = 1_000_000
+    bias_ns = 50_000
+    ticks = 20_000
+
+    clock = _SimulatedClock(REF)
+    rng = random.Random(seed)
+    interval = Interval(period_ns, missed_tick_behaviour=mtb, negative_bias=bias_ns, clock=clock)
+
+    records = asyncio.run(_simulate_ticks(interval, clock, ticks, rng, stall_rate))
+
+    assert ticks == len(records)
+    assert REF + period_ns == records[0][0]
+
+    for (deadline, fired, awaited), (next_deadline, _, _) in zip(records, records[1:]):
+
+        # never fires more than the bias early, and never fires twice
+        assert fired >= deadline - bias_ns
+        assert next_deadline > deadline
+        assert _expected_next_deadline(mtb, REF, period_ns, deadline, awaited) == next_deadline
+
+    return records
+
+
+def test_Interval_simulated_jitter_has_zero_drift():
+
+    for mtb in MissedTickBehaviour:
+
+        records = _check_simulated_ticks(mtb, 0.0, seed=int(mtb))
+
+        # however late each tick fires, the n'th tick's deadline is exactly
+        # n periods from the reference
+
+        assert [REF + (i + 1) * 1_000_000 for i in range(len(records))] == [deadline for deadline, _, _ in records]
+
+
+def test_Interval_simulated_stalls_BURST():
+
+    records = _check_simulated_ticks(MissedTickBehaviour.BURST, 0.05, seed=1)
+
+    assert REF + len(records) * 1_000_000 == records[-1][0]
+
+
+def test_Interval_simulated_stalls_DELAY():
+
+    _check_simulated_ticks(MissedTickBehaviour.DELAY, 0.05, seed=2)
+
+
+def test_Interval_simulated_stalls_SKIP():
+
+    records = _check_simulated_ticks(MissedTickBehaviour.SKIP, 0.05, seed=3)
+
+    for deadline, fired, _ in records:
+
+        # ticks stay on the grid, and a missed tick is never fired late
+
+        assert 0 == (deadline - REF) % 1_000_000
+        assert fired < deadline + 1_000_000
+
+
+def test_Interval_precision_accessors():
+
+    interval = Interval(Duration.from_millis(10))
+
+    assert interval.precision() is None
+    assert 0 == interval.precision_cpu().as_nanos()
+
+    interval = Interval(Duration.from_millis(10), precision=Duration.from_millis(2))
+
+    assert 2_000_000 == interval.precision().as_nanos()
+
+
+def test_Interval_precision_must_be_less_than_period():
+
+    with pytest.raises(AssertionError):
+
+        Interval(Duration.from_millis(10), precision=Duration.from_millis(10))
+
+
+def _run_precision_ticks(spin):
+    """
+    Iterates 5 ticks of an interval in precision mode alongside a task
+    that counts passes of the loop, returning, for each tick, the lateness
+    of its completion relative to its scheduled instant, along with the
+    interval and the pass count.
+    """
+
+    async def main():
+
+        interval = Interval(Duration.from_millis(5), negative_bias=0, precision=Duration.from_millis(2), spin=spin)
+
+        passes = [0]
+
+        async def count_passes():
+
+            while True:
+
+                passes[0] += 1
+
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(count_passes())
+
+        lateness = []
+
+        async for instant in interval.take(5):
+
+            lateness.append(time.monotonic_ns() - int(instant))
+
+        task.cancel()
+
+        return lateness, interval, passes[0]
+
+    return asyncio.run(main())
+
+
+def test_Interval_precision_spin_is_never_early():
+
+    lateness, interval, _ = _run_precision_ticks(spin=True)
+
+    assert 5 == len(lateness)
+    assert all(0 <= late_ns for late_ns in lateness)
+    assert interval.precision_cpu().as_nanos() > 0
+
+
+def test_Interval_precision_yield_is_never_early_and_lets_loop_run():
+
+    lateness, interval, passes = _run_precision_ticks(spin=False)
+
+    assert 5 == len(lateness)
+    assert all(0 <= late_ns for late_ns in lateness)
+    assert interval.precision_cpu().as_nanos() > 0
+
+    # the loop keeps running other tasks while within the guard window
+
+    assert passes > 5
+
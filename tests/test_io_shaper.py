@@ -0,0 +1,215 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_io_shaper.py
+#
+# Purpose:  Unit-test for `asynkio.io.ShapedWriter`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.io import (
+    ShapedWriter,
+)
+from asynkio.time import (
+    default_clock,
+    run_virtual,
+)
+
+MS = 1_000_000
+
+
+class _RecordingWriter:
+
+    def __init__(self):
+
+        self.clock = default_clock()
+        self.t0_ns = self.clock.now_ns()
+        self.chunks = []
+        self.drains = 0
+        self.closed = False
+
+    def write(self, data):
+
+        self.chunks.append((self.clock.now_ns() - self.t0_ns, bytes(data)))
+
+    async def drain(self):
+
+        self.drains += 1
+
+    def close(self):
+
+        self.closed = True
+
+
+def test_ShapedWriter_writes_burst_immediately():
+
+    async def main():
+
+        writer = _RecordingWriter()
+        shaper = ShapedWriter(writer, rate=1_000, burst=100)
+
+        shaper.write(b'x' * 100)
+
+        await shaper.drain()
+
+        return writer
+
+    writer = run_virtual(main())
+
+    assert [(0, b'x' * 100)] == writer.chunks
+    assert 1 == writer.drains
+
+
+def test_ShapedWriter_paces_to_rate():
+
+    async def main():
+
+        writer = _RecordingWriter()
+        shaper = ShapedWriter(writer, rate=10_000, burst=1_000)
+
+        shaper.write(b'x' * 5_000)
+
+        await shaper.drain()
+
+        return writer, shaper
+
+    writer, shaper = run_virtual(main())
+
+    # a burst, and then a burst each 100ms (to within the nanosecond lost to
+    # the loop's floating-point time)
+
+    assert [1_000] * 5 == [len(chunk) for _, chunk in writer.chunks]
+
+    for i, (elapsed_ns, _) in enumerate(writer.chunks):
+
+        assert 0 <= elapsed_ns - i * 100 * MS <= 1
+
+    assert 5_000 == shaper.bytes_written()
+    assert 5 == shaper.chunks_written()
+    assert 0 == shaper.pending()
+
+
+def test_ShapedWriter_coalesces_small_writes():
+
+    async def main():
+
+        writer = _RecordingWriter()
+        shaper = ShapedWriter(writer, rate=1_000, burst=100)
+
+        # exhaust the budget, then write many small pieces while waiting
+
+        shaper.write(b'a' * 100)
+
+        await asyncio.sleep(0)
+
+        for _ in range(50):
+
+            shaper.write(b'b')
+
+        await shaper.drain()
+
+        return writer
+
+    writer = run_virtual(main())
+
+    assert [b'a' * 100, b'b' * 50] == [chunk for _, chunk in writer.chunks]
+    assert 50 * MS <= writer.chunks[1][0] <= 50 * MS + 1
+
+
+def test_ShapedWriter_raises_writer_exceptions():
+
+    class _FailingWriter:
+
+        def write(self, data):
+
+            raise ConnectionResetError()
+
+    async def main():
+
+        shaper = ShapedWriter(_FailingWriter(), rate=1_000)
+
+        shaper.write(b'x')
+
+        with pytest.raises(ConnectionResetError):
+
+            await shaper.drain()
+
+        with pytest.raises(ConnectionResetError):
+
+            shaper.write(b'y')
+
+    run_virtual(main())
+
+
+def test_ShapedWriter_aclose_drains_and_closes():
+
+    async def main():
+
+        writer = _RecordingWriter()
+        shaper = ShapedWriter(writer, rate=1_000, burst=10)
+
+        shaper.writelines([b'0123456789', b'abcde'])
+
+        await shaper.aclose()
+
+        return writer
+
+    writer = run_virtual(main())
+
+    assert writer.closed
+    assert b'0123456789abcde' == b''.join(chunk for _, chunk in writer.chunks)
+
+
+def test_ShapedWriter_over_loopback():
+
+    async def main():
+
+        received = bytearray()
+        done = asyncio.Event()
+
+        async def on_connection(reader, writer):
+
+            while data := await reader.read(65_536):
+
+                received.extend(data)
+
+            done.set()
+
+            writer.close()
+
+        server = await asyncio.start_server(on_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        _, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        shaper = ShapedWriter(writer, rate=1_000_000, burst=10_000)
+
+        payload = bytes(range(256)) * 200
+
+        shaper.write(payload)
+
+        await shaper.aclose()
+        await done.wait()
+
+        server.close()
+
+        await server.wait_closed()
+
+        return payload, bytes(received), shaper.chunks_written()
+
+    payload, received, chunks = asyncio.run(main())
+
+    assert payload == received
+    assert chunks >= 6
+
@@ -0,0 +1,207 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_sync_broadcast.py
+#
+# Purpose:  Unit-test for `asynkio.sync.broadcast`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.sync import (
+    ChannelClosed,
+    ChannelEmpty,
+    Lagged,
+    broadcast,
+)
+
+
+def test_broadcast_every_receiver_receives_every_value():
+
+    async def main():
+
+        tx, rx_1 = broadcast.channel(8)
+        rx_2 = tx.subscribe()
+
+        assert 2 == tx.send('a')
+        assert 2 == tx.send('b')
+
+        return [await rx_1.recv(), await rx_1.recv()], [await rx_2.recv(), await rx_2.recv()]
+
+    assert (['a', 'b'], ['a', 'b']) == asyncio.run(main())
+
+
+def test_broadcast_subscribe_receives_only_later_values():
+
+    async def main():
+
+        tx, rx = broadcast.channel(8)
+
+        tx.send(1)
+
+        late = tx.subscribe()
+
+        tx.send(2)
+
+        assert 1 == len(late)
+
+        return late.try_recv(), rx.try_recv(), rx.try_recv()
+
+    assert (2, 1, 2) == asyncio.run(main())
+
+
+def test_broadcast_slow_receiver_is_Lagged_and_skips_to_oldest():
+
+    tx, rx = broadcast.channel(4)
+
+    for i in range(10):
+
+        tx.send(i)
+
+    assert 4 == len(rx)
+
+    with pytest.raises(Lagged) as exc:
+
+        rx.try_recv()
+
+    assert 6 == exc.value.n
+    assert [6, 7, 8, 9] == [rx.try_recv() for _ in range(4)]
+
+    with pytest.raises(ChannelEmpty):
+
+        rx.try_recv()
+
+
+def test_broadcast_recv_and_iteration_are_Lagged_alike():
+
+    async def main():
+
+        tx, rx_1 = broadcast.channel(2)
+        rx_2 = tx.subscribe()
+
+        for i in range(5):
+
+            tx.send(i)
+
+        tx.close()
+
+        with pytest.raises(Lagged) as exc_1:
+
+            await rx_1.recv()
+
+        with pytest.raises(Lagged) as exc_2:
+
+            await rx_2.__anext__()
+
+        return exc_1.value.n, exc_2.value.n, [await rx_1.recv(), await rx_1.recv()], [value async for value in rx_2]
+
+    assert (3, 3, [3, 4], [3, 4]) == asyncio.run(main())
+
+
+def test_broadcast_sends_between_receives_cost_one_wakeup():
+
+    async def main():
+
+        tx, rx = broadcast.channel(16)
+
+        task = asyncio.create_task(rx.recv())
+
+        await asyncio.sleep(0)
+
+        for i in range(5):
+
+            tx.send(i)
+
+        first = await task
+
+        return first, [rx.try_recv() for _ in range(4)]
+
+    assert (0, [1, 2, 3, 4]) == asyncio.run(main())
+
+
+def test_broadcast_iteration_ends_when_senders_closed():
+
+    async def main():
+
+        tx, rx = broadcast.channel(8)
+
+        async def consume(receiver):
+
+            return [value async for value in receiver]
+
+        tasks = [asyncio.create_task(consume(rx))] + [asyncio.create_task(consume(tx.subscribe())) for _ in range(3)]
+
+        await asyncio.sleep(0)
+
+        with tx:
+
+            for i in range(5):
+
+                tx.send(i)
+
+                await asyncio.sleep(0)
+
+        return await asyncio.gather(*tasks)
+
+    assert [[0, 1, 2, 3, 4]] * 4 == asyncio.run(main())
+
+
+def test_broadcast_closed_channel_and_receiver():
+
+    async def main():
+
+        tx, rx = broadcast.channel(2)
+        other = tx.subscribe()
+
+        tx.send('x')
+        other.close()
+
+        assert 1 == tx.receiver_count()
+
+        tx.close()
+
+        with pytest.raises(ChannelClosed):
+
+            tx.send('y')
+
+        assert 'x' == await rx.recv()
+
+        with pytest.raises(ChannelClosed):
+
+            await rx.recv()
+
+    asyncio.run(main())
+
+
+def test_broadcast_cancelled_recv_loses_nothing():
+
+    async def main():
+
+        tx, rx = broadcast.channel(4)
+
+        task = asyncio.create_task(rx.recv())
+
+        await asyncio.sleep(0)
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+
+            await task
+
+        tx.send('x')
+
+        return await rx.recv()
+
+    assert 'x' == asyncio.run(main())
+
@@ -0,0 +1,244 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_sync_mpsc.py
+#
+# Purpose:  Unit-test for `asynkio.sync.mpsc`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.sync import (
+    ChannelClosed,
+    ChannelEmpty,
+    ChannelFull,
+    mpsc,
+)
+from asynkio.time import (
+    Duration,
+    run_virtual,
+)
+
+
+def test_mpsc_try_send_and_try_recv():
+
+    async def main():
+
+        tx, rx = mpsc.channel(2)
+
+        tx.try_send(1)
+        tx.try_send(2)
+
+        with pytest.raises(ChannelFull) as exc:
+
+            tx.try_send(3)
+
+        assert (3,) == exc.value.args
+        assert 0 == tx.capacity()
+        assert 2 == len(rx)
+        assert 1 == rx.try_recv()
+        assert 2 == rx.try_recv()
+
+        with pytest.raises(ChannelEmpty):
+
+            rx.try_recv()
+
+        tx.close()
+
+        with pytest.raises(ChannelClosed):
+
+            rx.try_recv()
+
+    asyncio.run(main())
+
+
+def test_mpsc_recv_completes_without_yielding_when_item_buffered():
+
+    async def main():
+
+        tx, rx = mpsc.channel(4)
+
+        await tx.send('a')
+
+        loop = asyncio.get_running_loop()
+        steps = []
+
+        loop.call_soon(steps.append, 'other')
+
+        value = await rx.recv()
+
+        steps.append(value)
+
+        return steps.copy()
+
+    assert ['a'] == asyncio.run(main())
+
+
+def test_mpsc_send_waits_for_capacity_in_order():
+
+    async def main():
+
+        tx, rx = mpsc.channel(1)
+
+        await tx.send(0)
+
+        async def sender(i):
+
+            await tx.send(i)
+
+        tasks = [asyncio.create_task(sender(i)) for i in range(1, 6)]
+
+        received = [await rx.recv() for _ in range(6)]
+
+        await asyncio.gather(*tasks)
+
+        return received
+
+    assert [0, 1, 2, 3, 4, 5] == asyncio.run(main())
+
+
+def test_mpsc_recv_many_drains_in_one_wakeup():
+
+    async def main():
+
+        tx, rx = mpsc.channel(100)
+
+        batch = []
+
+        async def producer():
+
+            for i in range(10):
+
+                tx.try_send(i)
+
+        task = asyncio.create_task(rx.recv_many(batch, 6))
+
+        await asyncio.sleep(0)
+        await producer()
+
+        n = await task
+
+        m = await rx.recv_many(batch, 6)
+
+        tx.close()
+
+        return n, m, batch, await rx.recv_many(batch, 6)
+
+    assert (6, 4, list(range(10)), 0) == asyncio.run(main())
+
+
+def test_mpsc_iteration_ends_when_all_senders_closed():
+
+    async def main():
+
+        tx, rx = mpsc.channel(3)
+
+        async def producer(sender, base):
+
+            with sender:
+
+                for i in range(5):
+
+                    await sender.send(base + i)
+
+        tasks = [
+            asyncio.create_task(producer(tx.clone(), 100)),
+            asyncio.create_task(producer(tx, 200)),
+        ]
+
+        received = [value async for value in rx]
+
+        await asyncio.gather(*tasks)
+
+        return received
+
+    received = asyncio.run(main())
+
+    assert [100, 101, 102, 103, 104] == [value for value in received if value < 200]
+    assert [200, 201, 202, 203, 204] == [value for value in received if value >= 200]
+
+
+def test_mpsc_receiver_close_fails_waiting_senders_but_keeps_buffer():
+
+    async def main():
+
+        tx, rx = mpsc.channel(1)
+
+        await tx.send('kept')
+
+        task = asyncio.create_task(tx.send('rejected'))
+
+        await asyncio.sleep(0)
+
+        rx.close()
+
+        with pytest.raises(ChannelClosed) as exc:
+
+            await task
+
+        assert ('rejected',) == exc.value.args
+        assert tx.is_closed()
+        assert 'kept' == await rx.recv()
+
+        with pytest.raises(ChannelClosed):
+
+            await rx.recv()
+
+    asyncio.run(main())
+
+
+def test_mpsc_send_timeout():
+
+    async def main():
+
+        tx, rx = mpsc.channel(1)
+
+        await tx.send_timeout(1, Duration.from_millis(10))
+
+        with pytest.raises(TimeoutError):
+
+            await tx.send_timeout(2, Duration.from_millis(10))
+
+        # the timed-out send does not hold a slot
+
+        assert 1 == await rx.recv()
+
+        tx.try_send(3)
+
+        return await rx.recv()
+
+    assert 3 == run_virtual(main())
+
+
+def test_mpsc_cancelled_recv_loses_nothing():
+
+    async def main():
+
+        tx, rx = mpsc.channel(4)
+
+        task = asyncio.create_task(rx.recv())
+
+        await asyncio.sleep(0)
+
+        tx.try_send('x')
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+
+            await task
+
+        return await rx.recv()
+
+    assert 'x' == asyncio.run(main())
+
@@ -0,0 +1,195 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_sync_rate_limiter.py
+#
+# Purpose:  Unit-test for `asynkio.sync.RateLimiter`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.sync import (
+    RateLimiter,
+)
+from asynkio.time import (
+    Duration,
+    Instant,
+    run_virtual,
+)
+
+MS = 1_000_000
+
+
+class _ManualClock:
+
+    def __init__(self):
+
+        self.t_ns = 0
+
+    def now_ns(self) -> int:
+
+        return self.t_ns
+
+
+def test_RateLimiter_permits_burst_then_rate():
+
+    clock = _ManualClock()
+    limiter = RateLimiter(10, Duration.from_secs(1), clock=clock)
+
+    assert Duration.from_millis(100) == limiter.emission_interval()
+    assert [True] * 10 + [False] == [limiter.try_acquire() for _ in range(11)]
+    assert Duration.from_millis(100) == limiter.retry_after()
+
+    clock.t_ns = 99 * MS
+
+    assert not limiter.try_acquire()
+
+    clock.t_ns = 100 * MS
+
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_RateLimiter_keys_are_independent():
+
+    clock = _ManualClock()
+    limiter = RateLimiter(2, 10 * MS, burst=1, clock=clock)
+
+    assert limiter.try_acquire('a')
+    assert not limiter.try_acquire('a')
+    assert limiter.try_acquire('b')
+    assert 2 == len(limiter)
+    assert 5 * MS == int(limiter.tat('a'))
+    assert None is limiter.tat('c')
+
+
+def test_RateLimiter_acquire_n():
+
+    clock = _ManualClock()
+    limiter = RateLimiter(4, 40 * MS, clock=clock)
+
+    assert limiter.try_acquire(n=3)
+    assert not limiter.try_acquire(n=2)
+    assert limiter.try_acquire(n=1)
+    assert Duration.from_millis(20) == limiter.retry_after(n=2)
+
+    with pytest.raises(ValueError):
+
+        limiter.try_acquire(n=5)
+
+
+def test_RateLimiter_try_acquire_many_matches_try_acquire():
+
+    clock = _ManualClock()
+    one = RateLimiter(3, 30 * MS, clock=clock)
+    many = RateLimiter(3, 30 * MS, clock=clock)
+
+    keys = [i % 7 for i in range(50)]
+
+    for t in (0, 5, 10, 25, 60):
+
+        clock.t_ns = t * MS
+
+        assert [one.try_acquire(key) for key in keys] == many.try_acquire_many(keys)
+
+
+def test_RateLimiter_purge_discards_idle_keys():
+
+    clock = _ManualClock()
+    limiter = RateLimiter(1, 10 * MS, clock=clock)
+
+    limiter.try_acquire_many(range(100))
+
+    clock.t_ns = 5 * MS
+
+    assert limiter.try_acquire_many([100]) == [True]
+    assert 0 == limiter.purge()
+
+    clock.t_ns = 10 * MS
+
+    assert 100 == limiter.purge()
+    assert 1 == len(limiter)
+
+
+def test_RateLimiter_acquire_waits_exactly():
+
+    async def main():
+
+        limiter = RateLimiter(5, Duration.from_millis(50), burst=1)
+        clock = limiter.clock()
+
+        t0 = clock.now_ns()
+
+        instants = []
+
+        for _ in range(5):
+
+            await limiter.acquire()
+
+            instants.append(clock.now_ns() - t0)
+
+        return instants
+
+    # to within the nanosecond lost to the loop's floating-point time
+
+    for i, elapsed_ns in enumerate(run_virtual(main())):
+
+        assert 0 <= elapsed_ns - i * 10 * MS <= 1
+
+
+def test_RateLimiter_acquire_is_fifo_and_refunds_cancelled():
+
+    async def main():
+
+        limiter = RateLimiter(1, 10 * MS, burst=1)
+        clock = limiter.clock()
+
+        t0 = clock.now_ns()
+
+        order = []
+
+        async def acquirer(name):
+
+            await limiter.acquire('k')
+
+            order.append((name, clock.now_ns() - t0))
+
+        await limiter.acquire('k')
+
+        tasks = [asyncio.create_task(acquirer(name)) for name in 'abc']
+
+        await asyncio.sleep(0)
+
+        # 'a' and 'b' are reserved at 10ms and 20ms, and 'c' at 30ms, until
+        # 'b' is cancelled
+
+        tasks[1].cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        return order, int(limiter.tat('k')) - t0
+
+    order, tat_ns = run_virtual(main())
+
+    assert [('a', 10 * MS), ('c', 30 * MS)] == order
+    assert 30 * MS == tat_ns
+
+
+def test_RateLimiter_tat_is_an_Instant():
+
+    limiter = RateLimiter(1, MS, clock=_ManualClock())
+
+    limiter.try_acquire()
+
+    assert isinstance(limiter.tat(), Instant)
+
@@ -0,0 +1,180 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_sync_watch.py
+#
+# Purpose:  Unit-test for `asynkio.sync.watch`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.sync import (
+    ChannelClosed,
+    watch,
+)
+
+
+def test_watch_borrow_and_versions():
+
+    tx, rx = watch.channel({'level': 1})
+
+    config = rx.borrow()
+
+    assert config is tx.borrow()
+    assert 0 == tx.version()
+    assert not rx.has_changed()
+
+    tx.send({'level': 2})
+
+    assert 1 == tx.version()
+    assert rx.has_changed()
+    assert {'level': 2} == rx.borrow()
+    assert rx.has_changed()
+    assert {'level': 2} == rx.borrow_and_update()
+    assert not rx.has_changed()
+    assert {'level': 2} == tx.send_replace({'level': 3})
+
+
+def test_watch_changed_does_not_wake_without_a_send():
+
+    async def main():
+
+        tx, rx = watch.channel(0)
+
+        task = asyncio.create_task(rx.changed())
+
+        for _ in range(5):
+
+            await asyncio.sleep(0)
+
+        assert not task.done()
+
+        tx.send(1)
+
+        await task
+
+        return rx.borrow()
+
+    assert 1 == asyncio.run(main())
+
+
+def test_watch_many_sends_coalesce_into_one_wakeup():
+
+    async def main():
+
+        tx, rx = watch.channel(0)
+
+        seen = []
+
+        async def watcher():
+
+            async for value in rx:
+
+                seen.append(value)
+
+        task = asyncio.create_task(watcher())
+
+        await asyncio.sleep(0)
+
+        for i in range(1, 101):
+
+            tx.send(i)
+
+        await asyncio.sleep(0)
+
+        for i in range(101, 104):
+
+            tx.send(i)
+
+        tx.close()
+
+        await task
+
+        return seen
+
+    assert [100, 103] == asyncio.run(main())
+
+
+def test_watch_every_receiver_is_notified():
+
+    async def main():
+
+        tx, rx = watch.channel('a')
+
+        receivers = [rx, tx.subscribe(), rx.clone()]
+
+        async def wait(receiver):
+
+            await receiver.changed()
+
+            return receiver.borrow()
+
+        tasks = [asyncio.create_task(wait(receiver)) for receiver in receivers]
+
+        await asyncio.sleep(0)
+
+        tx.send('b')
+
+        return tx.receiver_count(), await asyncio.gather(*tasks)
+
+    assert (3, ['b', 'b', 'b']) == asyncio.run(main())
+
+
+def test_watch_changed_after_close():
+
+    async def main():
+
+        tx, rx = watch.channel(0)
+
+        tx.send(1)
+        tx.close()
+
+        # the unseen value is still reported
+
+        await rx.changed()
+
+        with pytest.raises(ChannelClosed):
+
+            await rx.changed()
+
+        with pytest.raises(ChannelClosed):
+
+            tx.send(2)
+
+        rx.mark_changed()
+
+        await rx.changed()
+
+        return rx.borrow()
+
+    assert 1 == asyncio.run(main())
+
+
+def test_watch_close_wakes_waiting_receiver():
+
+    async def main():
+
+        tx, rx = watch.channel(0)
+
+        task = asyncio.create_task(rx.changed())
+
+        await asyncio.sleep(0)
+
+        tx.close()
+
+        with pytest.raises(ChannelClosed):
+
+            await task
+
+    asyncio.run(main())
+
@@ -0,0 +1,167 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_arrays.py
+#
+# Purpose:  Unit-test for `asynkio.time.DurationArray` and
+#           `asynkio.time.InstantArray`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+from array import array
+
+import pytest
+
+from asynkio.time import (
+    Duration,
+    DurationArray,
+    Instant,
+    InstantArray,
+)
+
+_VALUES = [1_500_000_000, -2, 3_000_001_000, 0, 999]
+
+
+def test_DurationArray_matches_Duration():
+
+    durations = [Duration.from_nanos(v) for v in _VALUES]
+    a = DurationArray.from_durations(durations)
+
+    assert len(_VALUES) == len(a)
+    assert durations == list(a)
+    assert [d.as_micros() for d in durations] == a.as_micros().tolist()
+    assert [d.as_millis() for d in durations] == a.as_millis().tolist()
+    assert [d.as_secs() for d in durations] == a.as_secs().tolist()
+    assert [d.as_secs_f() for d in durations] == a.as_secs_f().tolist()
+    assert [d.subsec_nanos() for d in durations] == a.subsec_nanos().tolist()
+    assert [d.subsec_micros() for d in durations] == a.subsec_micros().tolist()
+    assert [d.subsec_millis() for d in durations] == a.subsec_millis().tolist()
+
+
+def test_DurationArray_arithmetic():
+
+    a = DurationArray(_VALUES)
+    one_ms = Duration.from_millis(1)
+
+    assert [v + 1_000_000 for v in _VALUES] == (a + one_ms).tolist()
+    assert [v - 1_000_000 for v in _VALUES] == (a - one_ms).tolist()
+    assert [2 * v for v in _VALUES] == (a + a).tolist()
+    assert [0] * len(_VALUES) == (a - a).tolist()
+    assert [3 * v for v in _VALUES] == (a * 3).tolist()
+    assert [3 * v for v in _VALUES] == (3 * a).tolist()
+    assert [int(Duration.from_nanos(v) * 0.5) for v in _VALUES] == (a * 0.5).tolist()
+
+
+def test_DurationArray_reflected_arithmetic():
+
+    a = DurationArray(_VALUES)
+    one_ms = Duration.from_millis(1)
+
+    assert [1_000_000 + v for v in _VALUES] == (one_ms + a).tolist()
+    assert [5 + v for v in _VALUES] == (5 + a).tolist()
+    assert [1_000_000 - v for v in _VALUES] == (one_ms - a).tolist()
+    assert [5 - v for v in _VALUES] == (5 - a).tolist()
+    assert isinstance(one_ms - a, DurationArray)
+
+
+def test_DurationArray_aggregates():
+
+    a = DurationArray(_VALUES)
+
+    assert Duration.from_nanos(-2) == a.min()
+    assert Duration.from_nanos(3_000_001_000) == a.max()
+    assert Duration.from_nanos(sum(_VALUES)) == a.sum()
+    assert Duration.from_nanos(-2) == a.percentile(0)
+    assert Duration.from_nanos(999) == a.percentile(50)
+    assert Duration.from_nanos(3_000_001_000) == a.percentile(100)
+
+    assert Duration.from_nanos(999) == DurationArray([1, 999, 1_000]).percentile(33.4)
+    assert Duration.from_nanos(1) == DurationArray([1, 999, 1_000]).percentile(33.3)
+
+    # exact nearest rank, where `p * n` is inexact in floating-point
+
+    assert Duration.from_nanos(161) == DurationArray(range(1, 251)).percentile(64.4)
+    assert Duration.from_nanos(33) == DurationArray(range(1, 376)).percentile(8.8)
+
+    with pytest.raises(ValueError):
+
+        DurationArray().percentile(50)
+
+
+def test_DurationArray_adopts_array_without_copying():
+
+    data = array('q', _VALUES)
+    a = DurationArray(data)
+
+    assert a.data() is data
+    assert a.as_nanos() is data
+
+    view = memoryview(a.data())
+
+    data[0] = 7
+
+    assert 7 == view[0]
+    assert Duration.from_nanos(7) == a[0]
+
+
+def test_InstantArray_arithmetic():
+
+    a = InstantArray.from_instants([Instant(10), Instant(20), Instant(35)])
+    d = DurationArray([1, 2, 3])
+
+    assert 20 == int(a[1])
+    assert [10, 20, 35] == [int(instant) for instant in a]
+    assert [15, 25, 40] == (a + Duration.from_nanos(5)).tolist()
+    assert [5, 15, 30] == (a - Duration.from_nanos(5)).tolist()
+    assert [11, 22, 38] == (a + d).tolist()
+    assert [9, 18, 32] == (a - d).tolist()
+
+    elapsed = a - Instant(10)
+
+    assert isinstance(elapsed, DurationArray)
+    assert [0, 10, 25] == elapsed.tolist()
+    assert [0, 0, 0] == (a - a).tolist()
+    assert [10, 15] == a.diff().tolist()
+    assert [20, 35] == a[1:].tolist()
+
+
+def test_InstantArray_aggregates():
+
+    a = InstantArray([30, 10, 20])
+
+    assert 10 == int(a.min())
+    assert 30 == int(a.max())
+    assert 20 == int(a.percentile(50))
+
+
+def test_DurationArray_with_numpy():
+
+    numpy = pytest.importorskip('numpy')
+
+    data = numpy.array(_VALUES, dtype=numpy.int64)
+    a = DurationArray(data)
+    b = DurationArray(_VALUES)
+
+    assert a.numpy() is data
+    assert (a + Duration.from_millis(1)).tolist() == (b + Duration.from_millis(1)).tolist()
+    assert (a * 0.5).tolist() == (b * 0.5).tolist()
+    assert a.as_millis().tolist() == b.as_millis().tolist()
+    assert a.subsec_micros().tolist() == b.subsec_micros().tolist()
+    assert a.percentile(50) == b.percentile(50)
+    assert (a + b).tolist() == (b + b).tolist()
+
+    # a view of `array('q')` storage, rather than a copy
+
+    view = b.numpy()
+
+    b.data()[0] = 7
+
+    assert 7 == view[0]
+
@@ -0,0 +1,161 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_calibrator.py
+#
+# Purpose:  Unit-test for `asynkio.time.BiasCalibrator`, and for adaptive
+#           `negative_bias` in `Interval`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+from asynkio.time import (
+    BiasCalibrator,
+    Clock,
+    Duration,
+    Interval,
+)
+
+MS = 1_000_000
+US = 1_000
+
+
+class _SimulatedClock(Clock):
+    """
+    Clock whose time only moves when told.
+    """
+
+    def __init__(self, t_ns):
+
+        self.t_ns = t_ns
+
+    def now_ns(self):
+
+        return self.t_ns
+
+
+def _run_with_latency(interval_factory, latency_ns, ticks):
+    """
+    Iterates `ticks` ticks of an interval on a loop driven by a simulated
+    clock, on which every timer wakes up `latency_ns` late. Returns the
+    interval and the lateness of each tick.
+    """
+
+    clock = _SimulatedClock(10_000 * MS)
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        def call_at(when, callback, *args, context=None):
+
+            clock.t_ns = round(when * 1_000_000_000) + latency_ns
+
+            return loop.call_soon(callback, *args, context=context)
+
+        loop.time = lambda: clock.t_ns / 1_000_000_000
+        loop.call_at = call_at
+
+        interval = interval_factory(clock)
+
+        lateness = []
+
+        async for instant in interval.take(ticks):
+
+            lateness.append(clock.t_ns - int(instant))
+
+        return interval, lateness
+
+    return asyncio.run(main())
+
+
+def test_BiasCalibrator_ewma():
+
+    calibrator = BiasCalibrator(alpha=0.5)
+
+    assert 0 == calibrator.estimate().as_nanos()
+    assert 0 == calibrator.samples()
+
+    calibrator.observe(100)
+    calibrator.observe(200)
+
+    assert 125 == calibrator.estimate().as_nanos()
+    assert 2 == calibrator.samples()
+
+
+def test_BiasCalibrator_initial_and_bounds():
+
+    calibrator = BiasCalibrator(alpha=1.0, initial=Duration.from_micros(50), maximum=Duration.from_micros(200))
+
+    assert 50 * US == calibrator.estimate().as_nanos()
+
+    calibrator.observe(-10 * US)
+
+    assert 0 == calibrator.estimate().as_nanos()
+
+    calibrator.observe(500 * US)
+
+    assert 200 * US == calibrator.estimate().as_nanos()
+
+
+def test_BiasCalibrator_for_loop_is_shared():
+
+    async def main():
+
+        return BiasCalibrator.for_loop(), BiasCalibrator.for_loop()
+
+    c1, c2 = asyncio.run(main())
+
+    assert c1 is c2
+
+
+def test_Interval_adaptive_bias_converges_on_latency():
+
+    interval, lateness = _run_with_latency(
+        lambda clock: Interval(MS, negative_bias=BiasCalibrator(), clock=clock),
+        300 * US,
+        200,
+    )
+
+    # the first tick is late by the full latency, and later ticks by
+    # ever less, as the bias converges
+
+    assert 300 * US == lateness[0]
+    assert abs(interval.negative_bias().as_nanos() - 300 * US) < US
+    assert all(abs(late_ns) < US for late_ns in lateness[-10:])
+
+
+def test_Interval_adaptive_bias_is_bounded_by_period():
+
+    interval, _ = _run_with_latency(
+        lambda clock: Interval(MS, negative_bias=BiasCalibrator(), clock=clock),
+        3 * MS,
+        100,
+    )
+
+    assert MS - 1 == interval.negative_bias().as_nanos()
+
+
+def test_Interval_shared_calibrator():
+
+    calibrator = BiasCalibrator()
+
+    for _ in range(2):
+
+        _run_with_latency(
+            lambda clock: Interval(MS, negative_bias=calibrator, clock=clock),
+            200 * US,
+            50,
+        )
+
+    assert 100 == calibrator.samples()
+    assert abs(calibrator.estimate().as_nanos() - 200 * US) < US
+
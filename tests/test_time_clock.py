@@ -0,0 +1,145 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_clock.py
+#
+# Purpose:  Unit-test for `asynkio.time.Clock` and its implementations.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+import time
+
+import pytest
+
+from asynkio.time import (
+    Clock,
+    Duration,
+    Instant,
+    Interval,
+    LoopClock,
+    MonotonicClock,
+    PerfCounterClock,
+    WallClock,
+)
+
+
+def test_Clock_now_ns_is_abstract():
+
+    with pytest.raises(NotImplementedError):
+
+        Clock().now_ns()
+
+
+def test_MonotonicClock_now_ns():
+
+    t0 = time.monotonic_ns()
+    t1 = MonotonicClock().now_ns()
+    t2 = time.monotonic_ns()
+
+    assert t0 <= t1 <= t2
+
+
+def test_PerfCounterClock_now_ns():
+
+    t0 = time.perf_counter_ns()
+    t1 = PerfCounterClock().now_ns()
+    t2 = time.perf_counter_ns()
+
+    assert t0 <= t1 <= t2
+
+
+def test_WallClock_now_ns():
+
+    t0 = time.time_ns()
+    t1 = WallClock().now_ns()
+    t2 = time.time_ns()
+
+    assert t0 <= t1 <= t2
+
+
+def test_LoopClock_now_ns_uses_running_loop():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        return int(loop.time() * 1_000_000_000), LoopClock().now_ns(), int(loop.time() * 1_000_000_000)
+
+    t0, t1, t2 = asyncio.run(main())
+
+    assert t0 <= t1 <= t2
+
+
+def test_LoopClock_loop_time_is_direct():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        return LoopClock().loop_time(1_500_000_000, loop), LoopClock(loop).loop_time(2_500_000_000, loop)
+
+    assert (1.5, 2.5) == asyncio.run(main())
+
+
+def test_Clock_loop_time_converts_relative_to_now():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        clock = WallClock()
+
+        t0 = loop.time()
+        when = clock.loop_time(clock.now_ns() + 2_000_000_000, loop)
+        t1 = loop.time()
+
+        return t0, when, t1
+
+    t0, when, t1 = asyncio.run(main())
+
+    assert t0 + 2.0 - 0.01 <= when <= t1 + 2.0 + 0.01
+
+
+def test_Instant_now_with_clock():
+
+    class FixedClock(Clock):
+
+        def now_ns(self):
+
+            return 123_456
+
+    assert 123_456 == int(Instant.now(FixedClock()))
+
+    t0 = time.time_ns()
+    t1 = int(Instant.now())
+
+    assert t0 <= t1
+
+
+def test_Interval_default_clock_is_monotonic():
+
+    interval = Interval(Duration.from_secs(1))
+
+    assert isinstance(interval.clock(), MonotonicClock)
+
+
+def test_Interval_uses_given_clock():
+
+    clock = PerfCounterClock()
+
+    t0 = time.perf_counter_ns()
+
+    interval = Interval(Duration.from_secs(1), clock=clock)
+
+    t1 = time.perf_counter_ns()
+
+    assert clock is interval.clock()
+    assert t0 <= int(interval.reference_instant()) <= t1
+
@@ -0,0 +1,276 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_coalescer.py
+#
+# Purpose:  Unit-test for `asynkio.time.TimerCoalescer`, and for timer slack
+#           in `Interval`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+from asynkio.time import (
+    Clock,
+    Interval,
+    TimerCoalescer,
+)
+from asynkio.time.coalescer import (
+    slack_deadline,
+)
+
+MS = 1_000_000
+US = 1_000
+
+
+class _FixedClock(Clock):
+
+    def now_ns(self):
+
+        return 0
+
+
+def test_slack_deadline():
+
+    assert 12_345 == slack_deadline(12_345, 0)
+    assert 12_345 == slack_deadline(12_345, 1)
+    assert 12_352 == slack_deadline(12_345, 10)
+    assert 12_352 == slack_deadline(12_352, 10)
+    assert 2 * 524_288 == slack_deadline(1_000_000, 1_000_000)
+
+    for deadline in range(0, 100_000, 997):
+
+        for slack in (2, 1_000, 4_096, 65_535):
+
+            when = slack_deadline(deadline, slack)
+
+            assert deadline <= when < deadline + slack
+
+
+def test_TimerCoalescer_nearby_deadlines_share_a_loop_timer():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        coalescer = TimerCoalescer(loop)
+
+        now_ns = int(loop.time() * 1_000_000_000)
+        deadlines = [now_ns + 10 * MS + i * US for i in range(5)]
+
+        fired = []
+        done = loop.create_future()
+
+        def on_timer(deadline_ns):
+
+            fired.append((deadline_ns, int(loop.time() * 1_000_000_000)))
+
+            if 5 == len(fired):
+
+                done.set_result(None)
+
+        for deadline_ns in deadlines:
+
+            coalescer.call_at(deadline_ns, MS, on_timer, deadline_ns)
+
+        armed = len(coalescer)
+
+        await done
+
+        return armed, coalescer.wakeups(), coalescer.coalesced_wakeups(), fired
+
+    armed, wakeups, coalesced, fired = asyncio.run(main())
+
+    assert 1 == armed
+    assert 1 == wakeups
+    assert 4 == coalesced
+
+    for deadline_ns, t_ns in fired:
+
+        assert t_ns >= deadline_ns
+
+
+def test_TimerCoalescer_cancel():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        coalescer = TimerCoalescer(loop)
+
+        fired = []
+
+        now_ns = int(loop.time() * 1_000_000_000)
+
+        h1 = coalescer.call_at(now_ns + 5 * MS, MS, fired.append, 1)
+        h2 = coalescer.call_at(now_ns + 5 * MS, MS, fired.append, 2)
+
+        assert h1.cancel()
+        assert not h1.cancel()
+        assert not h1.pending()
+        assert 1 == len(coalescer)
+
+        assert h2.cancel()
+        assert 0 == len(coalescer)
+
+        await asyncio.sleep(0.02)
+
+        return fired, coalescer.wakeups()
+
+    assert ([], 0) == asyncio.run(main())
+
+
+def test_TimerCoalescer_callback_may_cancel_sibling_in_batch():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        coalescer = TimerCoalescer(loop)
+
+        errors = []
+        fired = []
+        handles = []
+
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+        def cancel_sibling():
+
+            fired.append(1)
+
+            handles.append(handles[1].cancel())
+
+        now_ns = int(loop.time() * 1_000_000_000)
+
+        handles.append(coalescer.call_at(now_ns + MS, MS, cancel_sibling))
+        handles.append(coalescer.call_at(now_ns + MS, MS, fired.append, 2))
+
+        await asyncio.sleep(0.02)
+
+        return errors, fired, handles[2], handles[1].pending(), len(coalescer), coalescer.coalesced_wakeups()
+
+    # the cancelled sibling was not called, so is not counted as coalesced
+
+    assert ([], [1], True, False, 0, 0) == asyncio.run(main())
+
+
+def test_Interval_slack_task_may_cancel_sibling_in_batch():
+
+    async def main():
+
+        intervals = [Interval(20 * MS, negative_bias=0, slack=4 * MS) for _ in range(2)]
+
+        async def first():
+
+            await intervals[0]
+
+            target.cancel()
+
+            await asyncio.sleep(0)
+
+            return target.cancelled()
+
+        async def second():
+
+            await intervals[1]
+
+            await asyncio.sleep(1)
+
+        # `first()` waits first, so is woken first by the shared timer
+
+        task = asyncio.create_task(first())
+        target = asyncio.create_task(second())
+
+        return await task
+
+    assert asyncio.run(main())
+
+
+def test_TimerCoalescer_callback_exception_is_reported():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        coalescer = TimerCoalescer(loop)
+
+        errors = []
+        fired = []
+
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+        def bad():
+
+            raise ValueError("bad")
+
+        now_ns = int(loop.time() * 1_000_000_000)
+
+        coalescer.call_at(now_ns + MS, MS, bad)
+        coalescer.call_at(now_ns + MS, MS, fired.append, 1)
+
+        await asyncio.sleep(0.02)
+
+        return errors, fired
+
+    errors, fired = asyncio.run(main())
+
+    assert [1] == fired
+    assert 1 == len(errors)
+    assert isinstance(errors[0]['exception'], ValueError)
+
+
+def test_TimerCoalescer_for_loop_is_shared():
+
+    async def main():
+
+        return TimerCoalescer.for_loop(), TimerCoalescer.for_loop()
+
+    c1, c2 = asyncio.run(main())
+
+    assert c1 is c2
+
+
+def test_Interval_slack_coalesces_nearby_ticks():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        whens = []
+
+        def call_at(when, callback, *args, context=None):
+
+            whens.append(when)
+
+            return loop.call_soon(callback, *args, context=context)
+
+        loop.time = lambda: 0.0
+        loop.call_at = call_at
+
+        clock = _FixedClock()
+
+        intervals = [
+            Interval(period, negative_bias=0, clock=clock, slack=MS) for period in (20 * MS - US, 20 * MS, 20 * MS + US)
+        ]
+
+        instants = await asyncio.gather(*(interval.__anext__() for interval in intervals))
+
+        coalescer = TimerCoalescer.for_loop()
+
+        return whens, [int(instant) for instant in instants], coalescer.wakeups(), coalescer.coalesced_wakeups()
+
+    whens, instants, wakeups, coalesced = asyncio.run(main())
+
+    assert [39 * 524_288 / 1_000_000_000] == whens
+    assert [20 * MS - US, 20 * MS, 20 * MS + US] == instants
+    assert 1 == wakeups
+    assert 2 == coalesced
+
+
+def test_Interval_slack_accessor():
+
+    assert 0 == Interval(20 * MS).slack().as_nanos()
+    assert MS == Interval(20 * MS, slack=MS).slack().as_nanos()
+
@@ -0,0 +1,224 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_delay_queue.py
+#
+# Purpose:  Unit-test for `asynkio.time.DelayQueue`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.time import (
+    DelayQueue,
+    Duration,
+    Instant,
+    advance,
+    run_virtual,
+    sleep,
+)
+
+MS = 1_000_000
+
+
+class _ManualClock:
+
+    def __init__(self):
+
+        self.t_ns = 0
+
+    def now_ns(self) -> int:
+
+        return self.t_ns
+
+
+def test_DelayQueue_poll_expired_in_deadline_order():
+
+    clock = _ManualClock()
+    queue = DelayQueue(clock)
+
+    queue.insert('c', 30)
+    queue.insert('a', Duration.from_nanos(10))
+    queue.insert_at('b', Instant(20))
+
+    assert 3 == len(queue)
+    assert None is queue.poll_expired()
+
+    clock.t_ns = 25
+
+    assert ['a', 'b'] == [queue.poll_expired().value(), queue.poll_expired().value()]
+    assert None is queue.poll_expired()
+
+    clock.t_ns = 30
+
+    expired = queue.poll_expired()
+
+    assert 'c' == expired.value()
+    assert 30 == int(expired.deadline())
+    assert 0 == len(queue)
+
+
+def test_DelayQueue_reset_and_remove_by_key():
+
+    clock = _ManualClock()
+    queue = DelayQueue(clock)
+
+    a = queue.insert('a', 10)
+    b = queue.insert('b', 20)
+    c = queue.insert('c', 30)
+
+    queue.reset(a, 40)
+
+    assert 40 == int(queue.deadline(a))
+    assert b == queue.peek()
+
+    removed = queue.remove(b)
+
+    assert 'b' == removed.value()
+    assert b == removed.key()
+    assert b not in queue
+    assert c == queue.peek()
+
+    clock.t_ns = 100
+
+    assert ['c', 'a'] == [queue.poll_expired().value(), queue.poll_expired().value()]
+
+    with pytest.raises(KeyError):
+
+        queue.reset(a, 10)
+
+    with pytest.raises(KeyError):
+
+        queue.remove(a)
+
+
+def test_DelayQueue_stale_key_does_not_match_reused_slot():
+
+    queue = DelayQueue(_ManualClock())
+
+    a = queue.insert('a', 10)
+
+    queue.remove(a)
+
+    b = queue.insert('b', 10)
+
+    assert a != b
+    assert a not in queue
+    assert b in queue
+
+    with pytest.raises(KeyError):
+
+        queue.deadline(a)
+
+    queue.clear()
+
+    assert 0 == len(queue)
+    assert b not in queue
+    assert None is queue.peek()
+
+
+def test_DelayQueue_compacts_after_many_resets():
+
+    clock = _ManualClock()
+    queue = DelayQueue(clock)
+
+    keys = [queue.insert(i, 1_000 + i) for i in range(100)]
+
+    for n in range(50):
+
+        for key in keys:
+
+            queue.reset(key, 2_000 + n)
+
+    assert len(queue._heap) <= 2 * len(queue) + 64 + 1
+
+    clock.t_ns = 10_000
+
+    values = []
+
+    while (expired := queue.poll_expired()) is not None:
+
+        values.append(expired.value())
+
+    assert list(range(100)) == sorted(values)
+
+
+def test_DelayQueue_async_iteration_with_one_timer():
+
+    async def main():
+
+        queue = DelayQueue()
+
+        t0 = queue.clock().now_ns()
+
+        for i in range(1_000):
+
+            queue.insert(i, (i % 10 + 1) * MS)
+
+        results = []
+
+        async for expired in queue:
+
+            results.append((queue.clock().now_ns() - t0, expired.value()))
+
+            if 1_000 == len(results):
+
+                break
+
+        return results
+
+    results = run_virtual(main())
+
+    assert list(range(1_000)) == sorted(value for _, value in results)
+
+    for elapsed_ns, value in results:
+
+        assert (value % 10 + 1) * MS <= elapsed_ns
+
+
+def test_DelayQueue_iteration_wakes_for_earlier_insertion_and_skips_removed():
+
+    async def main():
+
+        queue = DelayQueue()
+
+        async def consume():
+
+            return await queue.__anext__()
+
+        task = asyncio.create_task(consume())
+
+        await sleep(5 * MS)
+
+        # the waiting iterator is woken by an insertion into the empty
+        # queue, and re-armed for an earlier deadline
+
+        late = queue.insert('late', 100 * MS)
+        removed = queue.insert('removed', 10 * MS)
+
+        queue.insert('early', 20 * MS)
+        queue.remove(removed)
+
+        await advance(Duration.from_millis(30))
+
+        assert task.done()
+
+        first = task.result().value()
+
+        queue.reset(late, 5 * MS)
+
+        second = (await queue.__anext__()).value()
+
+        return first, second
+
+    assert ('early', 'late') == run_virtual(main())
+
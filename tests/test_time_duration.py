@@ -6,7 +6,7 @@
 # Purpose:  Unit-test for `asynkio.time.Duration`.
 #
 # Created:  25th July 2025
-# Updated:  12th July 2026
+# Updated:  17th October 2026
 #
 # Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
 # All rights reserved
@@ -15,6 +15,9 @@
 
 
 import math
+import random
+
+import pytest
 
 from asynkio.time import (
     Duration,
@@ -251,3 +254,94 @@ def test_Duration_MUL():
     assert Duration.from_nanos(50) == (d_100 * 0.5)
     assert Duration.from_nanos(200) == (d_100 * 2.0)
 
+
+def test_Duration_STRING_fraction_with_leading_zeros():
+
+    assert "7.059ms" == str(Duration.from_nanos(7_059_962))
+    assert "9.002µs" == str(Duration.from_nanos(9_002))
+    assert "1.050s" == str(Duration.from_nanos(1_050_000_000))
+    assert "10.05s" == str(Duration.from_nanos(10_050_000_000))
+    assert "-4.080ms" == str(Duration.from_nanos(-4_080_420))
+
+
+def test_Duration_formatter():
+
+    formatter = Duration.formatter('+')
+
+    assert formatter is Duration.formatter('+')
+    assert "+123.4ms" == formatter(Duration.from_nanos(123_456_789))
+    assert "+123.4ms" == formatter(123_456_789)
+    assert "-9ns" == formatter(-9)
+    assert "0s" == formatter(0)
+
+    assert "123.4ms" == Duration.formatter()(123_456_789)
+    assert "+123.4ms" == format(Duration.from_nanos(123_456_789), '+')
+    assert "+123.4ms" == f"{Duration.from_nanos(123_456_789):+}"
+
+
+@pytest.mark.parametrize(
+    'n',
+    [1, 9, 10, 99, 100, 999, 1_000, 9_999, 10**11 - 1, 10**11, 10**12, 2**40, 2**63 - 1],
+)
+def test_Duration_STRING_orders_of_magnitude(n):
+
+    s = str(Duration.from_nanos(n))
+
+    digits = len(str(n))
+
+    if digits <= 3:
+
+        assert f"{n}ns" == s
+    elif digits <= 6:
+
+        assert s.endswith("µs")
+    elif digits <= 9:
+
+        assert s.endswith("ms")
+    else:
+
+        assert s.endswith("s") and s[-2].isdigit()
+
+
+def test_Duration_parse():
+
+    assert 1_500_000 == Duration.parse("1.5ms").as_nanos()
+    assert 250_000 == Duration.parse("250µs").as_nanos()
+    assert 250_000 == Duration.parse("250us").as_nanos()
+    assert 2_000_000_000 == Duration.parse("2s").as_nanos()
+    assert 90_000_000_000 == Duration.parse("1m30s").as_nanos()
+    assert 3_723_500_000_000 == Duration.parse("1h2m3.5s").as_nanos()
+    assert -9_123_000_000 == Duration.parse("-9.123s").as_nanos()
+    assert 123_400_000 == Duration.parse("+123.4ms").as_nanos()
+    assert 0 == Duration.parse("0").as_nanos()
+    assert 0 == Duration.parse("0s").as_nanos()
+
+    # exact, with fractions of a nanosecond truncated
+
+    assert 1 == Duration.parse("0.000000001s").as_nanos()
+    assert 1 == Duration.parse("1.9ns").as_nanos()
+    assert 100_000_000_000_000_001 == Duration.parse("100000000.000000001s").as_nanos()
+
+
+@pytest.mark.parametrize(
+    's',
+    ["", "1", "ms", "1.ms", ".5s", "1 s", " 1s", "1s2", "-", "+-1s", "1.5.5s", "1x", "1S", "\uff11s"],
+)
+def test_Duration_parse_invalid(s):
+
+    with pytest.raises(ValueError):
+
+        Duration.parse(s)
+
+
+def test_Duration_parse_round_trips():
+
+    rng = random.Random(0)
+
+    for _ in range(10_000):
+
+        d = Duration.from_nanos(rng.randrange(-(10**18), 10**18) // 10 ** rng.randrange(0, 18))
+
+        assert str(d) == str(Duration.parse(str(d)))
+        assert format(d, '+') == format(Duration.parse(format(d, '+')), '+')
+
@@ -6,7 +6,7 @@
 # Purpose:  Unit-test for `asynkio.time.Instant`.
 #
 # Created:  25th July 2025
-# Updated:  12th July 2026
+# Updated:  17th October 2026
 #
 # Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
 # All rights reserved
@@ -14,9 +14,19 @@
 # ######################################################################## #
 
 
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+import random
+
+import pytest
+
 from asynkio.time import (
     Duration,
     Instant,
+    InstantArray,
 )
 
 
@@ -97,3 +107,157 @@ def test_Instant_INT():
     assert 0 == Instant(0).__int__()
     assert 123 == Instant(123).__int__()
 
+
+def test_Instant_isoformat():
+
+    instant_x = Instant(1_754_271_065_290_980_123)
+
+    assert "2025-08-04T01:31:05Z" == instant_x.isoformat(0)
+    assert "2025-08-04T01:31:05.290Z" == instant_x.isoformat(3)
+    assert "2025-08-04T01:31:05.290980Z" == instant_x.isoformat()
+    assert "2025-08-04T01:31:05.290980123Z" == instant_x.isoformat(9)
+
+    assert "1969-12-31T23:59:59.999999999Z" == Instant(-1).isoformat(9)
+    assert "2000-02-29T00:00:00Z" == Instant(951_782_400_000_000_000).isoformat(0)
+
+
+@pytest.mark.parametrize('digits', [1, 2, 4, 12, -3, None])
+def test_Instant_isoformat_invalid_digits(digits):
+
+    with pytest.raises(ValueError, match="digits must be 0, 3, 6, or 9"):
+
+        Instant(0).isoformat(digits)
+
+    with pytest.raises(ValueError, match="digits must be 0, 3, 6, or 9"):
+
+        Instant.format_many([0], digits)
+
+
+def test_Instant_isoformat_matches_datetime():
+
+    epoch = datetime(1970, 1, 1, tzinfo=UTC)
+    rng = random.Random(0)
+
+    for _ in range(10_000):
+
+        # (from the year 1000, since `strftime()` does not pad years to
+        # four digits)
+
+        t_ns = rng.randrange(-30_610_224_000_000_000_000, 253_402_300_800_000_000_000)
+
+        expected = (epoch + timedelta(microseconds=t_ns // 1_000)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        assert expected == str(Instant(t_ns))
+
+
+def test_Instant_format_many():
+
+    t_ns = [1_754_271_065_290_980_123, 1_754_271_065_999_999_999, 1_754_271_066_000_000_000, 0]
+
+    expected = [Instant(t).isoformat(9) for t in t_ns]
+
+    assert expected == Instant.format_many(t_ns, 9)
+    assert expected == Instant.format_many([Instant(t) for t in t_ns], 9)
+    assert expected == Instant.format_many(InstantArray(t_ns), 9)
+    assert [str(Instant(t)) for t in t_ns] == Instant.format_many(t_ns)
+
+
+def test_Instant_formatter():
+
+    instant_x = Instant(1_754_271_065_290_980_000)
+
+    formatter = Instant.formatter('#x')
+
+    assert formatter is Instant.formatter('#x')
+    assert "0x18586c3d466a3aa0" == formatter(instant_x)
+    assert "0x18586c3d466a3aa0" == formatter(1_754_271_065_290_980_000)
+    assert "2025-08-04T01:31:05.290980Z" == Instant.formatter()(instant_x)
+    assert "+1754271065290980000" == f"{instant_x:+d}"
+
+    with pytest.raises(ValueError):
+
+        Instant.formatter('dx')
+
+    with pytest.raises(ValueError):
+
+        format(instant_x, 'xX')
+
+
+def test_Instant_parse():
+
+    assert 1_754_271_065_290_980_123 == int(Instant.parse("2025-08-04T01:31:05.290980123Z"))
+    assert 1_754_271_065_290_980_000 == int(Instant.parse("2025-08-04T01:31:05.290980Z"))
+    assert 1_754_271_065_290_000_000 == int(Instant.parse("2025-08-04T01:31:05.29Z"))
+    assert 1_754_271_065_000_000_000 == int(Instant.parse("2025-08-04T01:31:05Z"))
+    assert 1_754_271_065_290_980_123 == int(Instant.parse("2025-08-04T01:31:05.2909801239Z"))
+    assert 0 == int(Instant.parse("1970-01-01T00:00:00Z"))
+    assert -1 == int(Instant.parse("1969-12-31T23:59:59.999999999Z"))
+
+    # RFC-3339 forms
+
+    assert 1_754_271_065_500_000_000 == int(Instant.parse("2025-08-04T11:31:05.5+10:00"))
+    assert 1_754_271_065_500_000_000 == int(Instant.parse("2025-08-03t23:01:05.5-02:30"))
+    assert 1_754_271_065_000_000_000 == int(Instant.parse("2025-08-04 01:31:05z"))
+
+
+@pytest.mark.parametrize(
+    'timestamp',
+    [
+        "",
+        "2025-08-04",
+        "2025-08-04T01:31:05",
+        "2025-08-04T01:31:05.Z",
+        "2025-08-04T01:31:5Z",
+        "2025-8-04T01:31:05Z",
+        "2025-02-29T00:00:00Z",
+        "2025-13-01T00:00:00Z",
+        "2025-08-04T24:00:00Z",
+        "2025-08-04T01:60:00Z",
+        "2025-08-04T01:31:05.+1Z",
+        "2025-08-04T01:31:05+1000",
+        "\uff12025-08-04T01:31:05Z",
+    ],
+)
+def test_Instant_parse_invalid(timestamp):
+
+    with pytest.raises(ValueError):
+
+        Instant.parse(timestamp)
+
+
+def test_Instant_parse_round_trips():
+
+    rng = random.Random(0)
+
+    for _ in range(10_000):
+
+        t_ns = rng.randrange(-62_135_596_800_000_000_000, 253_402_300_800_000_000_000)
+
+        assert t_ns == int(Instant.parse(Instant(t_ns).isoformat(9)))
+        assert t_ns // 1_000 * 1_000 == int(Instant.parse(str(Instant(t_ns))))
+
+
+def test_Instant_parse_many():
+
+    t_0 = 1_754_271_065_999_999_000
+
+    timestamps = [Instant(t_0 + i * 300).isoformat(9) for i in range(10)]
+
+    timestamps += [
+        "2025-08-04T01:31:06.5Z",
+        "2025-08-04T11:31:06.6+10:00",
+        "2025-08-04T01:31:06.7Z",
+        "2025-08-04T01:31:06Z",
+        "2025-08-04T01:31:07.000000001Z",
+    ]
+
+    result = Instant.parse_many(timestamps)
+
+    assert [int(Instant.parse(timestamp)) for timestamp in timestamps] == result.tolist()
+    assert [t_0 + i * 300 for i in range(10)] == result.tolist()[:10]
+    assert 1_754_271_066_600_000_000 == result[11]
+
+    with pytest.raises(ValueError):
+
+        Instant.parse_many(["2025-08-04T01:31:06.5Z", "2025-08-04T01:31:06.Z"])
+
@@ -0,0 +1,241 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_shared.py
+#
+# Purpose:  Unit-test for `asynkio.time.SharedInterval`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+
+import pytest
+
+from asynkio.time import (
+    BiasCalibrator,
+    MissedTickBehaviour,
+    SharedInterval,
+    run_virtual,
+    sleep,
+    timeout,
+)
+
+MS = 1_000_000
+
+
+def test_SharedInterval_one_wakeup_per_tick_for_all_subscribers():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS, negative_bias=0)
+
+        t0 = int(shared.reference_instant())
+
+        async def subscriber():
+
+            return [int(instant) - t0 async for instant in shared.subscribe().take(5)]
+
+        results = await asyncio.gather(*(subscriber() for _ in range(100)))
+
+        return shared, results
+
+    shared, results = run_virtual(main())
+
+    assert 100 == shared.subscriptions()
+    assert 5 == shared.wakeups()
+
+    for offsets in results:
+
+        assert [10 * MS, 20 * MS, 30 * MS, 40 * MS, 50 * MS] == offsets
+
+
+def test_SharedInterval_late_subscriber_joins_the_grid():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS, negative_bias=0)
+
+        t0 = int(shared.reference_instant())
+
+        await sleep(25 * MS)
+
+        interval = shared.subscribe()
+
+        return int(await interval.__anext__()) - t0, int(interval.reference_instant()) - t0
+
+    first_ns, reference_ns = run_virtual(main())
+
+    assert 30 * MS == first_ns
+    assert 0 == reference_ns
+
+
+def test_SharedInterval_subscribers_keep_their_own_missed_ticks():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS, negative_bias=0)
+
+        t0 = int(shared.reference_instant())
+
+        punctual = shared.subscribe()
+        bursting = shared.subscribe(MissedTickBehaviour.BURST)
+        skipping = shared.subscribe(MissedTickBehaviour.SKIP)
+        delaying = shared.subscribe(MissedTickBehaviour.DELAY)
+
+        async def late(interval):
+
+            await interval
+
+            # miss the ticks at 20ms and 30ms
+
+            await sleep(25 * MS)
+
+            return [int(instant) - t0 async for instant in interval.take(3)]
+
+        async def on_time(interval):
+
+            return [int(instant) - t0 async for instant in interval.take(4)]
+
+        return await asyncio.gather(on_time(punctual), late(bursting), late(skipping), late(delaying))
+
+    punctual, bursting, skipping, delaying = run_virtual(main())
+
+    assert [10 * MS, 20 * MS, 30 * MS, 40 * MS] == punctual
+    assert [20 * MS, 30 * MS, 40 * MS] == bursting
+    assert [40 * MS, 50 * MS, 60 * MS] == skipping
+
+    # one period from the late await, and thence off the shared grid
+
+    assert 0 <= delaying[0] - 45 * MS < MS
+    assert [10 * MS, 10 * MS] == [b - a for a, b in zip(delaying, delaying[1:])]
+
+
+def test_SharedInterval_cancelled_subscriber_is_not_woken():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS, negative_bias=0)
+
+        t0 = int(shared.reference_instant())
+
+        interval = shared.subscribe()
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout(5 * MS):
+
+                await interval
+
+        return int(await interval.__anext__()) - t0, shared
+
+    first_ns, shared = run_virtual(main())
+
+    assert 10 * MS == first_ns
+    assert 1 == shared.wakeups()
+
+
+def test_SharedInterval_cancelled_last_waiter_disarms_the_timer():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS, negative_bias=0)
+
+        interval = shared.subscribe()
+
+        # cancel many waits, each before the first tick
+
+        for _ in range(100):
+
+            with pytest.raises(TimeoutError):
+
+                async with timeout(MS // 100):
+
+                    await interval
+
+        await sleep(50 * MS)
+
+        return shared
+
+    shared = run_virtual(main())
+
+    assert 0 == shared.wakeups()
+    assert 0 == len(shared._heap)
+
+
+def test_SharedInterval_cancelled_armed_group_rearms_for_the_next():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS, negative_bias=0)
+
+        t0 = int(shared.reference_instant())
+
+        # a subscriber off the shared grid, whose next tick is at 45ms
+
+        delaying = shared.subscribe(MissedTickBehaviour.DELAY)
+
+        await delaying
+
+        await sleep(25 * MS)
+
+        async def next_tick():
+
+            return await delaying.__anext__()
+
+        task = asyncio.create_task(next_tick())
+
+        # a subscriber waiting for the tick at 40ms, which it abandons
+
+        interval = shared.subscribe()
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout(2 * MS):
+
+                await interval
+
+        return int(await task) - t0, shared
+
+    next_ns, shared = run_virtual(main())
+
+    assert 0 <= next_ns - 45 * MS < MS
+
+    # the ticks at 10ms and 45ms, and not the abandoned one at 40ms
+
+    assert 2 == shared.wakeups()
+
+
+def test_SharedInterval_with_BiasCalibrator():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS, negative_bias=BiasCalibrator())
+
+        t0 = int(shared.reference_instant())
+
+        return [int(instant) - t0 async for instant in shared.subscribe().take(3)]
+
+    assert [10 * MS, 20 * MS, 30 * MS] == run_virtual(main())
+
+
+def test_SharedInterval_stop_ends_a_subscription():
+
+    async def main():
+
+        shared = SharedInterval(10 * MS)
+
+        interval = shared.subscribe()
+
+        asyncio.get_running_loop().call_later(0.035, interval.stop)
+
+        return [instant async for instant in interval]
+
+    assert 3 == len(run_virtual(main()))
+
@@ -0,0 +1,296 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_sleep.py
+#
+# Purpose:  Unit-test for `asynkio.time.Sleep`, `sleep()`, and
+#           `sleep_until()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+import time
+
+import pytest
+
+from asynkio.time import (
+    Duration,
+    Instant,
+    LoopClock,
+    Sleep,
+    sleep,
+    sleep_until,
+)
+
+MS = 1_000_000
+
+
+def _count_call_at(loop):
+    """
+    Wraps `loop.call_at()` so as to count the timers that are armed.
+    """
+
+    counts = [0]
+    call_at = loop.call_at
+
+    def counting_call_at(*args, **kwargs):
+
+        counts[0] += 1
+
+        return call_at(*args, **kwargs)
+
+    loop.call_at = counting_call_at
+
+    return counts
+
+
+def test_sleep_with_Duration():
+
+    async def main():
+
+        t0 = time.monotonic_ns()
+
+        await sleep(Duration.from_millis(20))
+
+        return time.monotonic_ns() - t0
+
+    assert asyncio.run(main()) >= 20 * MS
+
+
+def test_sleep_with_nanoseconds():
+
+    async def main():
+
+        s = sleep(20 * MS)
+
+        await s
+
+        return s.is_elapsed(), (Instant.now() - s.deadline()).as_nanos()
+
+    is_elapsed, late_ns = asyncio.run(main())
+
+    assert is_elapsed
+    assert late_ns >= 0
+
+
+def test_sleep_until():
+
+    async def main():
+
+        # integer nanoseconds are on the scheduling (monotonic) clock
+
+        deadline_ns = time.monotonic_ns() + 20 * MS
+
+        await sleep_until(deadline_ns)
+
+        return time.monotonic_ns() - deadline_ns
+
+    assert asyncio.run(main()) >= 0
+
+
+def test_sleep_until_Instant_now():
+
+    async def main():
+
+        t0 = Instant.now()
+        deadline = t0 + Duration.from_millis(10)
+
+        s = sleep_until(deadline)
+
+        # mapped onto the monotonic clock, and back, to within a millisecond
+
+        assert abs((s.deadline() - deadline).as_nanos()) < MS
+
+        await s
+
+        return (Instant.now() - t0).as_nanos()
+
+    assert 10 * MS <= asyncio.run(main()) < 1_000 * MS
+
+
+def test_sleep_until_past_deadline_yields_once():
+
+    async def main():
+
+        order = []
+
+        async def other():
+
+            order.append('other')
+
+        task = asyncio.create_task(other())
+
+        await sleep_until(Instant(0))
+
+        order.append('sleep')
+
+        await task
+
+        return order
+
+    assert ['other', 'sleep'] == asyncio.run(main())
+
+
+def test_sleep_with_LoopClock_schedules_exact_loop_time():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        whens = []
+        call_at = loop.call_at
+
+        def recording_call_at(when, *args, **kwargs):
+
+            whens.append(when)
+
+            return call_at(when, *args, **kwargs)
+
+        loop.call_at = recording_call_at
+
+        deadline_ns = int(loop.time() * 1_000_000_000) + 10 * MS
+
+        await sleep_until(deadline_ns, LoopClock())
+
+        return deadline_ns, whens
+
+    deadline_ns, whens = asyncio.run(main())
+
+    assert [deadline_ns / 1_000_000_000] == whens
+
+
+def test_Sleep_reset_later_does_not_rearm_until_timer_fires():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        counts = _count_call_at(loop)
+
+        s = sleep(20 * MS)
+
+        async def extend():
+
+            for _ in range(10):
+
+                s.reset(s.deadline() + Duration.from_millis(2))
+
+                await asyncio.sleep(0)
+
+        t0 = time.monotonic_ns()
+
+        await asyncio.gather(s, extend())
+
+        return counts[0], time.monotonic_ns() - t0
+
+    count, elapsed_ns = asyncio.run(main())
+
+    # one timer for the original deadline, and one on its expiry for the
+    # extended deadline
+    assert 2 == count
+    assert elapsed_ns >= 40 * MS
+
+
+def test_Sleep_reset_earlier_rearms():
+
+    async def main():
+
+        s = sleep(Duration.from_secs(10))
+
+        async def shorten():
+
+            await asyncio.sleep(0)
+
+            s.reset(time.monotonic_ns() + 10 * MS)
+
+        t0 = time.monotonic_ns()
+
+        await asyncio.gather(s, shorten())
+
+        return time.monotonic_ns() - t0
+
+    elapsed_ns = asyncio.run(main())
+
+    assert 10 * MS <= elapsed_ns < 5_000 * MS
+
+
+def test_Sleep_may_be_awaited_again_after_reset():
+
+    async def main():
+
+        s = sleep(5 * MS)
+
+        await s
+
+        assert s.is_elapsed()
+
+        s.reset(time.monotonic_ns() + 5 * MS)
+
+        assert not s.is_elapsed()
+
+        await s
+
+        return s.is_elapsed()
+
+    assert asyncio.run(main())
+
+
+def test_Sleep_cancel_while_waiting():
+
+    async def main():
+
+        s = sleep(Duration.from_secs(10))
+
+        task = asyncio.create_task(_await(s))
+
+        await asyncio.sleep(0.001)
+
+        task.cancel("stop")
+
+        try:
+
+            await task
+        except asyncio.CancelledError as x:
+
+            return x.args, s._waiter._handle
+
+    async def _await(s):
+
+        await s
+
+    args, handle = asyncio.run(main())
+
+    assert ("stop",) == args
+    assert handle is None
+
+
+def test_Sleep_concurrent_await_is_rejected():
+
+    s = Sleep(time.monotonic_ns() + 1_000 * MS)
+
+    async def waiter():
+
+        await s
+
+    async def main():
+
+        task = asyncio.create_task(waiter())
+
+        await asyncio.sleep(0.001)
+
+        try:
+
+            await s
+        finally:
+
+            task.cancel()
+
+    with pytest.raises(RuntimeError, match="already being awaited"):
+
+        asyncio.run(main())
+
@@ -0,0 +1,252 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_stats.py
+#
+# Purpose:  Unit-test for `asynkio.time.IntervalStats`, and for its use by
+#           `Interval`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+import tracemalloc
+
+from asynkio.time import (
+    Clock,
+    Interval,
+    IntervalStats,
+    MissedTickBehaviour,
+)
+from asynkio.time.stats import (
+    nearest_rank,
+)
+
+MS = 1_000_000
+
+
+class _SimulatedClock(Clock):
+    """
+    Clock whose time only moves when told.
+    """
+
+    def __init__(self, t_ns):
+
+        self.t_ns = t_ns
+
+    def now_ns(self):
+
+        return self.t_ns
+
+
+def _run_with_stalls(mtb, stalls, latency_ns=0):
+    """
+    Iterates an interval, of period 1ms, on a loop driven by a simulated
+    clock, on which every timer wakes up `latency_ns` late, with the
+    consumer working for the given time after each tick (one tick per
+    element of `stalls`). Returns the interval's stats.
+    """
+
+    clock = _SimulatedClock(10_000 * MS)
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        def call_at(when, callback, *args, context=None):
+
+            clock.t_ns = round(when * 1_000_000_000) + latency_ns
+
+            return loop.call_soon(callback, *args, context=context)
+
+        loop.time = lambda: clock.t_ns / 1_000_000_000
+        loop.call_at = call_at
+
+        interval = Interval(MS, missed_tick_behaviour=mtb, negative_bias=0, clock=clock, stats=True)
+
+        i = 0
+
+        async for _ in interval.take(len(stalls)):
+
+            clock.t_ns += stalls[i]
+
+            i += 1
+
+        return interval.stats()
+
+    return asyncio.run(main())
+
+
+def test_IntervalStats_initial():
+
+    stats = IntervalStats()
+
+    assert 0 == stats.ticks()
+    assert 0 == stats.missed()
+    assert 0 == stats.skipped()
+    assert 0 == stats.burst()
+    assert 0 == stats.max_lateness().as_nanos()
+    assert 0 == stats.asleep().as_nanos()
+    assert [] == stats.histogram()
+    assert 0 == stats.percentile(99).as_nanos()
+
+
+def test_IntervalStats_histogram_and_percentile():
+
+    stats = IntervalStats()
+
+    for lateness_ns in (0, -5, 1, 3, 700, 1_000, 1_023, 1_024, 5 * MS):
+
+        stats._record_tick(lateness_ns, 10)
+
+    assert 9 == stats.ticks()
+    assert 90 == stats.asleep().as_nanos()
+    assert 5 * MS == stats.max_lateness().as_nanos()
+
+    histogram = [(int(upper), count) for upper, count in stats.histogram() if count]
+
+    assert [(1, 2), (2, 1), (4, 1), (1_024, 3), (2_048, 1), (8_388_608, 1)] == histogram
+
+    assert 1 == stats.percentile(0).as_nanos()
+    assert 1_024 == stats.percentile(50).as_nanos()
+    assert 8_388_608 == stats.percentile(100).as_nanos()
+
+    stats.reset()
+
+    assert 0 == stats.ticks()
+    assert [] == stats.histogram()
+
+
+def test_IntervalStats_percentile_of_small_odd_sample():
+
+    stats = IntervalStats()
+
+    for lateness_ns in (1, 100, 10_000):
+
+        stats._record_tick(lateness_ns, 10)
+
+    # the rank is ceil(p * 3 / 100), exactly: e.g. 33.4 => rank 2, not 1
+
+    assert 2 == stats.percentile(33).as_nanos()
+    assert 128 == stats.percentile(33.4).as_nanos()
+    assert 128 == stats.percentile(66.6).as_nanos()
+    assert 16_384 == stats.percentile(66.7).as_nanos()
+
+
+def test_nearest_rank_is_exact():
+
+    # `p * n` is not exact in floating-point, e.g. 64.4 * 250 gives
+    # 16100.000000000002
+
+    assert 161 == nearest_rank(64.4, 250)
+    assert 33 == nearest_rank(8.8, 375)
+    assert 2 == nearest_rank(33.4, 3)
+    assert 1 == nearest_rank(33.3, 3)
+    assert 1 == nearest_rank(0, 10)
+    assert 10 == nearest_rank(100, 10)
+    assert 5 == nearest_rank(50, 10)
+
+
+def test_IntervalStats_percentile_rank_is_exact():
+
+    stats = IntervalStats()
+
+    for lateness_ns in [1] * 161 + [100] * 89:
+
+        stats._record_tick(lateness_ns, 10)
+
+    assert 2 == stats.percentile(64.4).as_nanos()
+    assert 128 == stats.percentile(64.5).as_nanos()
+
+
+def test_IntervalStats_recording_retains_no_memory():
+
+    stats = IntervalStats()
+
+    stats._record_tick(1, 1)
+
+    tracemalloc.start()
+
+    try:
+
+        before, _ = tracemalloc.get_traced_memory()
+
+        for i in range(10_000):
+
+            stats._record_missed(3, False)
+            stats._record_tick(i * 1_000_003, 2_000_000_000 + i)
+
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+
+        tracemalloc.stop()
+
+    assert after - before < 1_024
+
+
+def test_Interval_stats_disabled_by_default():
+
+    assert Interval(MS).stats() is None
+
+
+def test_Interval_stats_shared():
+
+    stats = IntervalStats()
+
+    assert stats is Interval(MS, stats=stats).stats()
+    assert stats is Interval(MS, stats=stats).stats()
+
+
+def test_Interval_stats_on_time():
+
+    stats = _run_with_stalls(MissedTickBehaviour.SKIP, [100_000] * 10, latency_ns=50_000)
+
+    assert 10 == stats.ticks()
+    assert 0 == stats.missed()
+    assert 50_000 == stats.max_lateness().as_nanos()
+    assert [(65_536, 10)] == [(int(upper), count) for upper, count in stats.histogram() if count]
+
+    # the first await sleeps a full period, and each thereafter the rest of
+    # the period after the consumer's work
+
+    assert 10 * MS + 10 * 50_000 - 9 * (100_000 + 50_000) == stats.asleep().as_nanos()
+
+
+def test_Interval_stats_SKIP():
+
+    # the third tick's consumer stalls for 3.5 periods
+
+    stats = _run_with_stalls(MissedTickBehaviour.SKIP, [0, 0, 3_500_000, 0, 0])
+
+    assert 5 == stats.ticks()
+    assert 1 == stats.missed()
+    assert 3 == stats.skipped()
+    assert 0 == stats.burst()
+
+
+def test_Interval_stats_BURST():
+
+    stats = _run_with_stalls(MissedTickBehaviour.BURST, [0, 0, 3_500_000, 0, 0, 0, 0])
+
+    assert 7 == stats.ticks()
+    assert 3 == stats.missed()
+    assert 0 == stats.skipped()
+    assert 3 == stats.burst()
+    assert 2_500_000 == stats.max_lateness().as_nanos()
+
+
+def test_Interval_stats_DELAY():
+
+    stats = _run_with_stalls(MissedTickBehaviour.DELAY, [0, 0, 3_500_000, 0, 0])
+
+    assert 5 == stats.ticks()
+    assert 1 == stats.missed()
+    assert 0 == stats.skipped()
+    assert 0 == stats.burst()
+
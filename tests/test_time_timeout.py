@@ -0,0 +1,262 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_timeout.py
+#
+# Purpose:  Unit-test for `asynkio.time.Timeout`, `timeout()`, and
+#           `timeout_at()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+import time
+
+import pytest
+
+from asynkio.time import (
+    Duration,
+    Instant,
+    Timeout,
+    timeout,
+    timeout_at,
+)
+
+MS = 1_000_000
+
+
+def test_timeout_expires():
+
+    async def main():
+
+        t0 = time.monotonic_ns()
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout(Duration.from_millis(10)) as t:
+
+                await asyncio.sleep(10)
+
+        return t.expired(), time.monotonic_ns() - t0
+
+    expired, elapsed_ns = asyncio.run(main())
+
+    assert expired
+    assert 10 * MS <= elapsed_ns < 5_000 * MS
+
+
+def test_timeout_does_not_expire():
+
+    async def main():
+
+        async with timeout(1_000 * MS) as t:
+
+            await asyncio.sleep(0.001)
+
+        return t.expired(), t._handle
+
+    expired, handle = asyncio.run(main())
+
+    assert not expired
+    assert handle is None
+
+
+def test_timeout_None_never_expires():
+
+    async def main():
+
+        async with timeout(None) as t:
+
+            await asyncio.sleep(0.01)
+
+        return t.deadline(), t.expired()
+
+    assert (None, False) == asyncio.run(main())
+
+
+def test_timeout_at_past_deadline():
+
+    async def main():
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout_at(Instant(0)):
+
+                await asyncio.sleep(10)
+
+    asyncio.run(main())
+
+
+def test_timeout_at_Instant_now():
+
+    async def main():
+
+        t0 = Instant.now()
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout_at(t0 + Duration.from_millis(10)):
+
+                await asyncio.sleep(10)
+
+        return (Instant.now() - t0).as_nanos()
+
+    assert 10 * MS <= asyncio.run(main()) < 1_000 * MS
+
+
+def test_Timeout_reschedule_later_does_not_rearm_until_timer_fires():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        counts = [0]
+        call_at = loop.call_at
+
+        def counting_call_at(*args, **kwargs):
+
+            counts[0] += 1
+
+            return call_at(*args, **kwargs)
+
+        loop.call_at = counting_call_at
+
+        t0 = time.monotonic_ns()
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout(20 * MS) as t:
+
+                for _ in range(10):
+
+                    t.reschedule(t.deadline() + Duration.from_millis(2))
+
+                    await asyncio.sleep(0)
+
+                await loop.create_future()
+
+        return counts[0], time.monotonic_ns() - t0
+
+    count, elapsed_ns = asyncio.run(main())
+
+    # one timer for the original deadline, and one on its expiry for the
+    # extended deadline
+    assert 2 == count
+    assert elapsed_ns >= 40 * MS
+
+
+def test_Timeout_reschedule_earlier():
+
+    async def main():
+
+        t0 = time.monotonic_ns()
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout(Duration.from_secs(10)) as t:
+
+                t.reschedule(time.monotonic_ns() + 10 * MS)
+
+                await asyncio.sleep(10)
+
+        return time.monotonic_ns() - t0
+
+    assert asyncio.run(main()) < 5_000 * MS
+
+
+def test_Timeout_reschedule_None_disarms():
+
+    async def main():
+
+        async with timeout(10 * MS) as t:
+
+            t.reschedule(None)
+
+            await asyncio.sleep(0.03)
+
+        return t.expired()
+
+    assert not asyncio.run(main())
+
+
+def test_Timeout_may_be_reentered():
+
+    async def main():
+
+        t = Timeout(None)
+
+        results = []
+
+        for delay_s in (0.001, 10, 0.001):
+
+            t.reschedule(time.monotonic_ns() + 10 * MS)
+
+            try:
+
+                async with t:
+
+                    await asyncio.sleep(delay_s)
+            except TimeoutError:
+
+                pass
+
+            results.append(t.expired())
+
+        return results
+
+    assert [False, True, False] == asyncio.run(main())
+
+
+def test_Timeout_outer_cancellation_is_not_converted():
+
+    async def main():
+
+        async def inner():
+
+            async with timeout(1_000 * MS):
+
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(inner())
+
+        await asyncio.sleep(0.001)
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+
+            await task
+
+    asyncio.run(main())
+
+
+def test_Timeout_outside_task():
+
+    async def enter():
+
+        await Timeout(None).__aenter__()
+
+    with pytest.raises(RuntimeError):
+
+        enter().send(None)
+
+
+def test_Timeout_cannot_be_entered_twice():
+
+    async def main():
+
+        async with timeout(None) as t:
+
+            with pytest.raises(RuntimeError):
+
+                async with t:
+
+                    pass
+
+    asyncio.run(main())
+
@@ -0,0 +1,211 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_timerfd.py
+#
+# Purpose:  Unit-test for the `timerfd` backend of `asynkio.time.Interval`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from asynkio.time import (
+    Interval,
+    LoopClock,
+    MissedTickBehaviour,
+)
+import asynkio.time.timerfd as timerfd_module
+from asynkio.time.timerfd import (
+    timerfd_available,
+)
+
+MS = 1_000_000
+
+
+class _SimulatedTimerFds:
+    """
+    Stands in for the kernel's timerfds - whichever the platform - with
+    eventfds (whose reads, like those of a timerfd, return and reset a
+    count) incremented by loop timers.
+    """
+
+    def __init__(self):
+
+        self.settime_calls = 0
+        self.handles = {}
+
+    def create(self, clockid, *, flags=0):
+
+        return os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+
+    def settime_ns(self, fd, *, flags=0, initial=0, interval=0):
+
+        self.settime_calls += 1
+
+        loop = asyncio.get_running_loop()
+
+        handle = self.handles.pop(fd, None)
+
+        if handle is not None:
+
+            handle.cancel()
+
+        def expire(when_ns):
+
+            # as the kernel, count all expirations up to now
+
+            expirations = (time.monotonic_ns() - when_ns) // interval + 1
+
+            os.eventfd_write(fd, expirations)
+
+            when_ns += expirations * interval
+
+            self.handles[fd] = loop.call_at(when_ns / 1e9, expire, when_ns)
+
+        self.handles[fd] = loop.call_at(initial / 1e9, expire, initial)
+
+    def cancel_all(self):
+
+        for handle in self.handles.values():
+
+            handle.cancel()
+
+
+@pytest.fixture
+def simulated_timerfds(monkeypatch):
+
+    if not hasattr(os, 'eventfd'):
+
+        pytest.skip("eventfd is not available")
+
+    timerfds = _SimulatedTimerFds()
+
+    monkeypatch.setattr(timerfd_module, '_AVAILABLE', True)
+    monkeypatch.setattr(timerfd_module, '_timerfd_create', timerfds.create, raising=False)
+    monkeypatch.setattr(timerfd_module, '_timerfd_settime_ns', timerfds.settime_ns, raising=False)
+    monkeypatch.setattr(timerfd_module, '_TFD_FLAGS', 0, raising=False)
+    monkeypatch.setattr(timerfd_module, '_TFD_TIMER_ABSTIME', 1, raising=False)
+    monkeypatch.setattr(timerfd_module, '_CLOCK_MONOTONIC', 1, raising=False)
+
+    yield timerfds
+
+    timerfds.cancel_all()
+
+
+def test_Interval_timerfd_falls_back_when_unavailable(monkeypatch):
+
+    monkeypatch.setattr(timerfd_module, '_AVAILABLE', False)
+
+    async def main():
+
+        interval = Interval(5 * MS, timerfd=True)
+
+        assert not interval.timerfd()
+
+        async for _ in interval.take(3):
+
+            pass
+
+        return interval.event_count()
+
+    assert 3 == asyncio.run(main())
+
+
+def test_Interval_timerfd_requires_monotonic_clock(simulated_timerfds):
+
+    async def main():
+
+        return Interval(5 * MS, timerfd=True, clock=LoopClock()).timerfd()
+
+    assert not asyncio.run(main())
+
+
+def test_Interval_timerfd_is_available_when_platform_supports_it():
+
+    assert timerfd_available() == Interval(5 * MS, timerfd=True).timerfd()
+
+
+def test_Interval_timerfd_may_not_be_combined_with_wheel():
+
+    with pytest.raises(AssertionError):
+
+        Interval(5 * MS, timerfd=True, wheel=True)
+
+
+def test_Interval_timerfd_ticks_on_its_grid(simulated_timerfds):
+
+    async def main():
+
+        interval = Interval(5 * MS, MissedTickBehaviour.BURST, timerfd=True, negative_bias=0)
+
+        assert interval.timerfd()
+
+        t0 = interval.reference_instant()
+
+        instants = [instant async for instant in interval.take(10)]
+
+        return interval, t0, instants
+
+    _, t0, instants = asyncio.run(main())
+
+    for i, instant in enumerate(instants):
+
+        assert int(t0) + (i + 1) * 5 * MS == int(instant)
+
+    # the kernel timer is armed once, and thereafter is periodic
+
+    assert 1 == simulated_timerfds.settime_calls
+
+
+def test_Interval_timerfd_counts_overruns_and_SKIPs(simulated_timerfds):
+
+    async def main():
+
+        interval = Interval(10 * MS, MissedTickBehaviour.SKIP, timerfd=True, negative_bias=0)
+
+        t0 = interval.reference_instant()
+
+        await interval
+
+        # block the loop for more than three periods
+
+        time.sleep(0.035)
+
+        t1 = await interval.__anext__()
+
+        return interval, int(t1) - int(t0)
+
+    interval, elapsed_ns = asyncio.run(main())
+
+    assert 50 * MS == elapsed_ns
+    assert interval.overruns() >= 2
+
+
+def test_Interval_timerfd_rearms_on_DELAY(simulated_timerfds):
+
+    async def main():
+
+        interval = Interval(10 * MS, MissedTickBehaviour.DELAY, timerfd=True, negative_bias=0)
+
+        await interval
+
+        time.sleep(0.015)
+
+        await interval
+        await interval
+
+    asyncio.run(main())
+
+    assert 2 == simulated_timerfds.settime_calls
+
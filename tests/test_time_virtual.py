@@ -0,0 +1,220 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_virtual.py
+#
+# Purpose:  Unit-test for `asynkio.time.VirtualEventLoop`, `pause()`,
+#           `resume()`, `advance()`, and `run_virtual()`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+import time
+
+import pytest
+
+from asynkio.time import (
+    Instant,
+    Interval,
+    MissedTickBehaviour,
+    MonotonicClock,
+    VirtualClock,
+    advance,
+    default_clock,
+    pause,
+    resume,
+    run_virtual,
+    sleep,
+    timeout,
+)
+
+MS = 1_000_000
+S = 1_000_000_000
+
+
+def test_VirtualEventLoop_default_clock_outside_loop():
+
+    assert isinstance(default_clock(), MonotonicClock)
+
+
+def test_VirtualEventLoop_clock_is_default_and_drives_Instant_now():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        assert loop.is_paused()
+        assert isinstance(default_clock(), VirtualClock)
+        assert default_clock() is loop.clock()
+
+        t0 = Instant.now()
+
+        await asyncio.sleep(3600)
+
+        return Instant.now() - t0
+
+    t_real = time.monotonic()
+
+    elapsed = run_virtual(main())
+
+    assert 3600 * S == int(elapsed)
+    assert time.monotonic() - t_real < 5
+
+
+def test_VirtualEventLoop_hour_of_ticks_has_no_drift():
+
+    async def main():
+
+        t0 = Instant.now()
+
+        interval = Interval(100 * MS, negative_bias=0)
+
+        instants = [instant async for instant in interval.take(36_000)]
+
+        return t0, instants
+
+    t0, instants = run_virtual(main())
+
+    assert 36_000 == len(instants)
+
+    for i, instant in enumerate(instants[:1000]):
+
+        assert int(instants[0]) + i * 100 * MS == int(instant)
+
+    assert 3600 * S == int(instants[-1]) - int(instants[0]) + 100 * MS
+    assert int(instants[0]) - int(t0) == 100 * MS
+
+
+def test_VirtualEventLoop_stall_with_SKIP():
+
+    async def main():
+
+        interval = Interval(100 * MS, MissedTickBehaviour.SKIP, negative_bias=0)
+
+        t0 = interval.reference_instant()
+
+        await interval
+
+        # fall behind by 350ms of virtual time
+
+        await advance(350 * MS)
+
+        t1 = await interval.__anext__()
+
+        return int(t1) - int(t0)
+
+    assert 500 * MS == run_virtual(main())
+
+
+def test_VirtualEventLoop_sleep_and_timeout():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        t0 = loop.time()
+
+        await sleep(250 * MS)
+
+        t1 = loop.time()
+
+        with pytest.raises(TimeoutError):
+
+            async with timeout(2 * S):
+
+                await asyncio.sleep(10)
+
+        return t1 - t0, loop.time() - t1
+
+    slept, waited = run_virtual(main())
+
+    assert 0.25 == pytest.approx(slept, abs=1e-9)
+    assert 2.0 == pytest.approx(waited, abs=1e-9)
+
+
+def test_VirtualEventLoop_advance_fires_timers_in_order():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+        fired = []
+
+        for t in (3, 1, 2, 5):
+
+            loop.call_later(t, lambda t=t: fired.append((t, loop.time())))
+
+        await advance(4 * S)
+
+        return fired, loop.time()
+
+    fired, now = run_virtual(main())
+
+    assert [1, 2, 3] == [t for t, _ in fired]
+
+    for t, when in fired:
+
+        assert t == pytest.approx(when, abs=1e-9)
+
+    assert 4.0 == pytest.approx(now, abs=1e-9)
+
+
+def test_VirtualEventLoop_advance_requires_paused_time():
+
+    async def main():
+
+        resume()
+
+        assert not asyncio.get_running_loop().is_paused()
+
+        with pytest.raises(RuntimeError):
+
+            await advance(1 * MS)
+
+        pause()
+
+        await advance(1 * MS)
+
+    run_virtual(main())
+
+
+def test_VirtualEventLoop_resumed_time_follows_real_time():
+
+    async def main():
+
+        loop = asyncio.get_running_loop()
+
+        t0 = loop.time()
+
+        await asyncio.sleep(0.02)
+
+        return loop.time() - t0
+
+    t_real = time.monotonic()
+
+    elapsed = run_virtual(main(), paused=False)
+
+    assert elapsed >= 0.02
+    assert time.monotonic() - t_real >= 0.02
+
+
+def test_VirtualEventLoop_controls_require_virtual_loop():
+
+    async def main():
+
+        with pytest.raises(RuntimeError):
+
+            pause()
+
+        with pytest.raises(RuntimeError):
+
+            await advance(1 * MS)
+
+    asyncio.run(main())
+
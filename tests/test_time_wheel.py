@@ -0,0 +1,391 @@
+#! /usr/bin/env python3
+
+# ######################################################################## #
+# File:     tests/test_time_wheel.py
+#
+# Purpose:  Unit-test for `asynkio.time.TimerWheel`.
+#
+# Created:  17th October 2026
+# Updated:  17th October 2026
+#
+# Copyright (c) Matthew Wilson, Synesis Information Systems Pty Ltd
+# All rights reserved
+#
+# ######################################################################## #
+
+
+import asyncio
+import random
+
+from asynkio.time import (
+    Duration,
+    Interval,
+    MissedTickBehaviour,
+    TimerWheel,
+)
+
+MS = 1_000_000
+
+
+class _FakeHandle:
+
+    def __init__(self, when, callback):
+
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+
+        self.cancelled = True
+
+
+class _FakeLoop:
+    """
+    Minimal stand-in for an event loop, whose time only moves when told.
+    """
+
+    def __init__(self, t_ns=0):
+
+        self.t_ns = t_ns
+        self.handles = []
+        self.errors = []
+
+    def time(self):
+
+        return self.t_ns / 1_000_000_000
+
+    def call_at(self, when, callback):
+
+        handle = _FakeHandle(when, callback)
+
+        self.handles.append(handle)
+
+        return handle
+
+    def call_exception_handler(self, context):
+
+        self.errors.append(context)
+
+    def run_until(self, t_ns):
+        """
+        Fires, in order, every armed handle due at or before `t_ns`.
+        """
+
+        while True:
+
+            live = [h for h in self.handles if not h.cancelled]
+
+            if not live:
+
+                break
+
+            handle = min(live, key=lambda h: h.when)
+
+            when_ns = round(handle.when * 1_000_000_000)
+
+            if when_ns > t_ns:
+
+                break
+
+            self.handles.remove(handle)
+
+            self.t_ns = max(self.t_ns, when_ns)
+
+            handle.callback()
+
+        self.t_ns = t_ns
+
+    def armed(self):
+
+        return [h for h in self.handles if not h.cancelled]
+
+
+def test_TimerWheel_resolution():
+
+    wheel = TimerWheel(Duration.from_micros(250), loop=_FakeLoop())
+
+    assert 250_000 == wheel.resolution().as_nanos()
+    assert 0 == len(wheel)
+
+
+def test_TimerWheel_fires_at_deadline_not_before():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    fired = []
+
+    wheel.call_at(5 * MS, lambda: fired.append(loop.t_ns))
+
+    assert 1 == len(wheel)
+    assert 1 == len(loop.armed())
+
+    loop.run_until(4 * MS)
+
+    assert [] == fired
+
+    loop.run_until(10 * MS)
+
+    assert [5 * MS] == fired
+    assert 0 == len(wheel)
+    assert [] == loop.armed()
+
+
+def test_TimerWheel_rounds_deadline_up_to_resolution():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    fired = []
+
+    wheel.call_at(2 * MS + 1, lambda: fired.append(loop.t_ns))
+
+    loop.run_until(100 * MS)
+
+    assert [3 * MS] == fired
+
+
+def test_TimerWheel_single_loop_timer_for_many_entries():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    for i in range(1_000):
+
+        wheel.call_at((1 + i % 50) * MS, lambda: None)
+
+    assert 1_000 == len(wheel)
+    assert 1 == len(loop.armed())
+
+
+def test_TimerWheel_cascades_across_levels():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    deadlines = [
+        3,
+        63,
+        64,
+        65,
+        4_095,
+        4_097,
+        262_143,
+        262_145,
+        16_777_300,
+        1_073_741_900,
+    ]
+
+    fired = []
+
+    for d in reversed(deadlines):
+
+        wheel.call_at(d * MS, lambda d=d: fired.append((d, loop.t_ns // MS)))
+
+    loop.run_until(2_000_000_000 * MS)
+
+    assert [(d, d) for d in deadlines] == fired
+    assert 0 == len(wheel)
+
+
+def test_TimerWheel_random_deadlines_fire_in_order():
+
+    rng = random.Random(1234)
+
+    loop = _FakeLoop(t_ns=123_456_789)
+    wheel = TimerWheel(MS, loop=loop)
+
+    deadlines = sorted(rng.randrange(1, 10_000_000) * MS for _ in range(2_000))
+
+    fired = []
+
+    for d in deadlines:
+
+        wheel.call_at(loop.t_ns + d, lambda d=d: fired.append((d, loop.t_ns)))
+
+    loop.run_until(20_000_000 * MS)
+
+    assert len(deadlines) == len(fired)
+
+    for d, t in fired:
+
+        assert t >= 123_456_789 + d
+        assert t < 123_456_789 + d + MS
+
+    assert sorted(d for d, _ in fired) == [d for d, _ in fired]
+
+
+def test_TimerWheel_cancel():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    fired = []
+
+    h1 = wheel.call_at(5 * MS, lambda: fired.append(1))
+    h2 = wheel.call_at(7 * MS, lambda: fired.append(2))
+
+    assert h1.pending()
+    assert h1.cancel()
+    assert not h1.pending()
+    assert not h1.cancel()
+
+    assert 1 == len(wheel)
+
+    loop.run_until(10 * MS)
+
+    assert [2] == fired
+    assert not h2.pending()
+
+
+def test_TimerWheel_cancel_last_entry_disarms_loop_timer():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    handle = wheel.call_at(5 * MS, lambda: None)
+
+    assert 1 == len(loop.armed())
+
+    handle.cancel()
+
+    assert [] == loop.armed()
+
+
+def test_TimerWheel_callback_may_cancel_sibling_in_same_slot():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    fired = []
+    handles = []
+
+    def first():
+
+        fired.append(1)
+
+        handles[1].cancel()
+
+    handles.append(wheel.call_at(5 * MS, first))
+    handles.append(wheel.call_at(5 * MS, lambda: fired.append(2)))
+
+    loop.run_until(10 * MS)
+
+    assert [1] == fired
+    assert 0 == len(wheel)
+
+
+def test_TimerWheel_callback_may_reschedule():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    fired = []
+
+    def tick():
+
+        fired.append(loop.t_ns // MS)
+
+        if len(fired) < 5:
+
+            wheel.call_later(10 * MS, tick)
+
+    wheel.call_later(10 * MS, tick)
+
+    loop.run_until(1_000 * MS)
+
+    assert [10, 20, 30, 40, 50] == fired
+
+
+def test_TimerWheel_past_deadline_fires_promptly():
+
+    loop = _FakeLoop(t_ns=50 * MS)
+    wheel = TimerWheel(MS, loop=loop)
+
+    fired = []
+
+    wheel.call_at(10 * MS, lambda: fired.append(loop.t_ns // MS))
+
+    loop.run_until(50 * MS)
+
+    assert [50] == fired
+
+
+def test_TimerWheel_callback_exception_is_reported():
+
+    loop = _FakeLoop()
+    wheel = TimerWheel(MS, loop=loop)
+
+    fired = []
+
+    def bad():
+
+        raise ValueError("bad")
+
+    wheel.call_at(5 * MS, bad)
+    wheel.call_at(5 * MS, lambda: fired.append(1))
+
+    loop.run_until(10 * MS)
+
+    assert [1] == fired
+    assert 1 == len(loop.errors)
+    assert isinstance(loop.errors[0]['exception'], ValueError)
+
+
+def test_TimerWheel_for_loop_is_shared():
+
+    async def main():
+
+        return TimerWheel.for_loop(), TimerWheel.for_loop()
+
+    w1, w2 = asyncio.run(main())
+
+    assert w1 is w2
+
+
+def test_Interval_with_wheel_ticks():
+
+    async def main():
+
+        interval = Interval(
+            Duration.from_millis(5),
+            missed_tick_behaviour=MissedTickBehaviour.SKIP,
+            wheel=True,
+        )
+
+        for _ in range(3):
+
+            await interval
+
+        return interval.event_count(), len(TimerWheel.for_loop())
+
+    event_count, pending = asyncio.run(main())
+
+    assert 3 == event_count
+    assert 0 == pending
+
+
+def test_TimerWheel_slack_coalesces_nearby_deadlines():
+
+    for slack, expected_fired, expected_wakeups, expected_coalesced in (
+        (0, [17, 18, 20], 3, 0),
+        (8 * MS, [21, 21, 21], 1, 2),
+    ):
+
+        loop = _FakeLoop()
+        wheel = TimerWheel(MS, loop=loop, slack=slack)
+
+        fired = []
+
+        for d in (17, 18, 20):
+
+            wheel.call_at(d * MS, lambda: fired.append(loop.t_ns // MS))
+
+        loop.run_until(100 * MS)
+
+        assert slack == wheel.slack().as_nanos()
+        assert expected_fired == fired
+        assert expected_wakeups == wheel.wakeups()
+        assert expected_coalesced == wheel.coalesced_wakeups()
+